@@ -8,20 +8,46 @@ from ._useragent import set_databricks_sdk_upstream
 
 set_databricks_sdk_upstream()
 
-import laktory._parsers
-import laktory.api
-import laktory.enums
-import laktory.models
+from typing import TYPE_CHECKING
+
+# Narwhals namespace is registered on import
 import laktory.narwhals_ext
-import laktory.typing
-import laktory.yaml
 
 from ._cache import cache_dir
+from ._lazy import attach
 from ._logger import get_logger
 from ._settings import Settings
-from .sqlparser import SQLParser
 from .version import show_version_info
 
+# Sub-modules imported on first access (PEP 562) to keep CLI and job
+# entrypoints startup time low
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "_parsers",
+        "api",
+        "constants",
+        "enums",
+        "exceptions",
+        "models",
+        "typing",
+        "yaml",
+    ],
+    objects={"SQLParser": "sqlparser"},
+)
+
+if TYPE_CHECKING:
+    import laktory._parsers
+    import laktory.api
+    import laktory.constants
+    import laktory.enums
+    import laktory.exceptions
+    import laktory.models
+    import laktory.typing
+    import laktory.yaml
+
+    from .sqlparser import SQLParser
+
 
 def register_spark_session(spark=None):
     """Register a Spark session"""
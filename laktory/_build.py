@@ -0,0 +1,88 @@
+import hashlib
+import os
+from pathlib import Path
+
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+# Directories never considered as package sources
+SOURCES_EXCLUDES = [
+    ".git",
+    ".venv",
+    "__pycache__",
+    "build",
+    "dist",
+]
+
+
+def hash_content(content: str | bytes) -> str:
+    """SHA-256 hex digest of a file content"""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_if_changed(filepath: str | Path, content: str) -> bool:
+    """
+    Write `content` to `filepath` only if the file does not exist or if its
+    content hash differs. Unchanged files keep their modification time, which
+    prevents downstream sync tools from uploading them again.
+
+    Parameters
+    ----------
+    filepath:
+        File path
+    content:
+        File content
+
+    Returns
+    -------
+    :
+        `True` if the file was written
+    """
+    filepath = Path(filepath)
+    if filepath.exists() and hash_content(filepath.read_bytes()) == hash_content(
+        content
+    ):
+        logger.debug(f"File {filepath} is unchanged")
+        return False
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    logger.debug(f"Writing file {filepath}")
+    with filepath.open(mode="w") as fp:
+        fp.write(content)
+    return True
+
+
+def hash_sources(dirpath: str | Path) -> str:
+    """
+    Hash of all the files of a source directory, including their relative
+    paths. Build outputs, virtual environments and caches are excluded.
+
+    Parameters
+    ----------
+    dirpath:
+        Source directory
+
+    Returns
+    -------
+    :
+        SHA-256 hex digest
+    """
+    dirpath = Path(dirpath)
+    h = hashlib.sha256()
+    for root, dirnames, filenames in os.walk(dirpath):
+        # Prune excluded directories in place to avoid walking them
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d not in SOURCES_EXCLUDES and not d.endswith(".egg-info")
+        )
+        for filename in sorted(filenames):
+            filepath = Path(root) / filename
+            h.update(filepath.relative_to(dirpath).as_posix().encode())
+            h.update(b"\0")
+            h.update(filepath.read_bytes())
+            h.update(b"\0")
+    return h.hexdigest()
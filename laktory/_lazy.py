@@ -0,0 +1,100 @@
+import importlib
+import sys
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+def attach(
+    package_name: str,
+    submodules: list[str] | None = None,
+    objects: dict[str, str] | None = None,
+    star_modules: list[str] | None = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level `__getattr__` and `__dir__` functions (PEP 562) so that
+    sub-modules and objects of a package are only imported on first access.
+    Accessed attributes are stored in the package namespace so that the
+    lookup is only executed once.
+
+    `__all__` (used by `from {package} import *`) and `__dir__` list all
+    public names of the package, sub-modules, objects and star modules, which
+    requires importing all of them.
+
+    Parameters
+    ----------
+    package_name:
+        Name of the package, typically `__name__`.
+    submodules:
+        Names of the sub-modules available as attributes of the package.
+    objects:
+        Mapping between object names and the (relative) name of the sub-module
+        defining them.
+    star_modules:
+        (Relative) names of the sub-modules whose public names are exposed by
+        the package, equivalent to `from .{module} import *`. Modules are
+        imported in the given order until the requested name is found.
+
+    Returns
+    -------
+    :
+        `__getattr__` and `__dir__` functions
+    """
+    submodules_order = list(submodules or [])
+    submodules = set(submodules_order)
+    objects = objects or {}
+    star_modules = star_modules or []
+
+    def _import(name: str) -> ModuleType:
+        return importlib.import_module(f"{package_name}.{name}")
+
+    def _public_names(module: ModuleType) -> list[str]:
+        public_names = getattr(module, "__all__", None)
+        if public_names is None:
+            public_names = [n for n in vars(module) if not n.startswith("_")]
+        return public_names
+
+    def _all() -> list[str]:
+        # Importing sub-modules binds them (and the sub-modules they import)
+        # in the package namespace, as eager imports would have.
+        names = set()
+        for name in submodules_order:
+            _import(name)
+        for module_name in dict.fromkeys(objects.values()):
+            _import(module_name)
+        for module_name in star_modules:
+            names |= set(_public_names(_import(module_name)))
+        names |= set(vars(sys.modules[package_name]).keys())
+        names |= submodules | set(objects.keys())
+        # Names only used to build the lazy package
+        names -= {"TYPE_CHECKING", "attach"}
+        return sorted(n for n in names if not n.startswith("_"))
+
+    def __getattr__(name: str) -> Any:
+        if name == "__all__":
+            value = _all()
+        elif name in submodules:
+            value = _import(name)
+        elif name in objects:
+            value = getattr(_import(objects[name]), name)
+        elif not name.startswith("_") and star_modules:
+            for module_name in star_modules:
+                module = _import(module_name)
+                if name in _public_names(module):
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(
+                    f"module '{package_name}' has no attribute '{name}'"
+                )
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        names = set(vars(sys.modules[package_name]).keys())
+        return sorted(names | set(__getattr__("__all__")))
+
+    return __getattr__, __dir__
@@ -87,126 +87,192 @@ def merge_dicts(d1: dict, d2: dict) -> dict:
 # --------------------------------------------------------------------------- #
 
 
+VAR_PATTERN = re.compile(r"\$\{vars?\.([a-zA-Z_][a-zA-Z0-9_]*)\}")
+EXPR_PATTERN = re.compile(r"\$\{\{\s*(.*?)\s*\}\}")
+EXPR_VAR_PATTERN = re.compile(r"\bvars?\.([a-zA-Z_][a-zA-Z0-9_]*)\b")
+
+
 def is_pattern(s):
     return r"\$\{" in s
 
 
-def _resolve_values(o, vars, objs) -> Any:
-    """Inject variables into a mutable object"""
+class VariableResolver:
+    """
+    Resolve variables and expressions in strings and mutable objects.
 
-    from laktory.models.basemodel import BaseModel
+    The resolver is built once for a given set of variables and objects. It
+    pre-compiles custom patterns, pre-merges model variables, environment
+    variables and laktory settings into a single case-insensitive lookup
+    table and memoizes the resolution of each distinct string.
 
-    if isinstance(o, BaseModel):
-        o.inject_vars(inplace=True, vars=vars, objs=objs)
-    elif isinstance(o, list):
-        for i, _o in enumerate(o):
-            o[i] = _resolve_values(_o, vars, objs)
-    elif isinstance(o, dict):
-        for k, _o in o.items():
-            o[k] = _resolve_values(_o, vars, objs)
-    else:
-        o = _resolve_value(o, vars, objs)
-    return o
+    Parameters
+    ----------
+    vars:
+        Variables available for resolution. Keys containing `${` are
+        considered regex patterns and values their replacement.
+    objs:
+        Objects available when evaluating `${{ <expression> }}`.
+    """
 
+    def __init__(self, vars: dict[str, Any] = None, objs: dict[str, Any] = None):
+        from laktory._settings import settings
 
-def _resolve_value(o, vars, objs):
-    """Replace variables in a simple object"""
-
-    # Not a string
-    if not isinstance(o, str):
+        if vars is None:
+            vars = {}
+
+        self.vars = vars
+        self.objs = objs
+
+        # Custom patterns
+        self.patterns = [
+            (re.compile(k, flags=re.IGNORECASE), v)
+            for k, v in vars.items()
+            if is_pattern(k)
+        ]
+
+        # Lookup table by increasing priority: settings, environment, variables
+        self.lookup = {
+            k.lower(): getattr(settings, k) for k in type(settings).model_fields
+        }
+        self.lookup.update({k.lower(): v for k, v in os.environ.items()})
+        self.lookup.update({k.lower(): v for k, v in vars.items() if v is not None})
+
+        self._memo = {}
+        self._expression_vars = None
+
+    def resolve_values(self, o) -> Any:
+        """Inject variables into a mutable object"""
+
+        from laktory.models.basemodel import BaseModel
+
+        if isinstance(o, BaseModel):
+            o.inject_vars(inplace=True, vars=self.vars, objs=self.objs)
+        elif isinstance(o, list):
+            for i, _o in enumerate(o):
+                o[i] = self.resolve_values(_o)
+        elif isinstance(o, dict):
+            for k, _o in o.items():
+                o[k] = self.resolve_values(_o)
+        else:
+            o = self.resolve_value(o)
         return o
 
-    # Resolve custom patterns
-    for pattern, repl in vars.items():
-        if not is_pattern(pattern):
-            continue
-        elif isinstance(o, str) and re.findall(pattern, o, flags=re.IGNORECASE):
-            o = re.sub(pattern, repl, o, flags=re.IGNORECASE)
+    def resolve_value(self, o) -> Any:
+        """Replace variables in a simple object"""
 
-    if not isinstance(o, str):
-        return o
+        # Not a string
+        if not isinstance(o, str):
+            return o
 
-    # Resolve ${vars.<name>} or ${var.<name>} syntax
-    pattern = re.compile(r"\$\{vars?\.([a-zA-Z_][a-zA-Z0-9_]*)\}")
-    for match in pattern.finditer(o):
-        # Extract the variable name
-        var_name = match.group(1)
+        # Plain strings are returned as is
+        if "${" not in o:
+            return o
 
-        # Resolve the variable value
-        resolved_value = _resolve_variable(var_name, vars, objs)
+        if o in self._memo:
+            return self._memo[o]
 
-        # Update the value with the resolved value
-        if isinstance(resolved_value, str):
-            o = o.replace(match.group(0), resolved_value)
-        else:
-            o = resolved_value
+        key = o
+
+        # Resolve custom patterns
+        for pattern, repl in self.patterns:
+            if isinstance(o, str) and pattern.search(o):
+                o = pattern.sub(repl, o)
+
+        if not isinstance(o, str):
+            return o
+
+        # Resolve ${vars.<name>} or ${var.<name>} syntax
+        for match in VAR_PATTERN.finditer(o):
+            # Resolve the variable value
+            resolved_value = self.resolve_variable(match.group(1))
+
+            # Update the value with the resolved value
+            if isinstance(resolved_value, str):
+                o = o.replace(match.group(0), resolved_value)
+            else:
+                o = resolved_value
 
-            # Recursively resolve element if variable value is a dict or a list
-            if isinstance(o, (list, dict)):
-                o = _resolve_values(o, vars, objs)
+                # Recursively resolve element if variable value is a dict or a list
+                if isinstance(o, (list, dict)):
+                    o = self.resolve_values(o)
+
+        if not isinstance(o, str):
+            self._memo[key] = o
+            return o
+
+        # Resolve ${{ <expression> }} syntax
+        has_expression = False
+        for match in EXPR_PATTERN.finditer(o):
+            has_expression = True
+
+            # Resolve the variable value
+            resolved_value = self.resolve_expression(match.group(1))
+
+            # Update the value with the resolved value
+            if isinstance(resolved_value, str):
+                o = o.replace(match.group(0), resolved_value)
+            else:
+                o = resolved_value
+
+        # Results of expressions depend on objects that may change between
+        # calls and are therefore not memoized.
+        if not has_expression:
+            self._memo[key] = o
 
-    if not isinstance(o, str):
         return o
 
-    # Resolve ${{ <expression> }} syntax
-    pattern = re.compile(r"\$\{\{\s*(.*?)\s*\}\}")
-    for match in pattern.finditer(o):
-        # Extract the variable name
-        expr = match.group(1)
+    def resolve_variable(self, name) -> Any:
+        """Resolve a variable name from the variables or environment."""
 
-        # Resolve the variable value
-        resolved_value = _resolve_expression(expr, vars, objs)
+        value = self.lookup.get(name.lower())
 
-        # Update the value with the resolved value
-        if isinstance(resolved_value, str):
-            o = o.replace(match.group(0), resolved_value)
-        else:
-            o = resolved_value
+        # Value not found returning original value
+        if value is None:
+            return f"${{vars.{name}}}"  # Default value if not resolved
 
-    return o
+        # If the resolved value is itself a string with variables, resolve it
+        if isinstance(value, str) and ("${" in value or "$${" in value):
+            value = self.resolve_value(value)
 
+        return value
 
-def _resolve_variable(name, vars, objs):
-    """Resolve a variable name from the variables or environment."""
+    def resolve_expression(self, expression) -> Any:
+        """Evaluate an inline expression."""
 
-    # Fetch from model variables
-    _vars = {k.lower(): v for k, v in vars.items()}
-    value = _vars.get(name.lower())
+        # Prepare a safe evaluation context
+        if self._expression_vars is None:
+            self._expression_vars = copy.deepcopy(self.vars)
 
-    # Fetch from env variables
-    if value is None:
-        _vars = {k.lower(): v for k, v in os.environ.items()}
-        value = _vars.get(name.lower())
+        return _resolve_expression(
+            expression, self.vars, self.objs, variables_map=self._expression_vars
+        )
 
-    # Fetch from laktory settings
-    if value is None:
-        from laktory._settings import settings
 
-        _vars = {k.lower(): getattr(settings, k) for k in settings.model_fields.keys()}
-        value = _vars.get(name.lower())
+def _resolve_values(o, vars, objs) -> Any:
+    """Inject variables into a mutable object"""
+    return VariableResolver(vars, objs).resolve_values(o)
+
 
-    # Value not found returning original value
-    if value is None:
-        return f"${{vars.{name}}}"  # Default value if not resolved
+def _resolve_value(o, vars, objs):
+    """Replace variables in a simple object"""
+    return VariableResolver(vars, objs).resolve_value(o)
 
-    # If the resolved value is itself a string with variables, resolve it
-    if isinstance(value, str) and ("${" in value or "$${" in value):
-        value = _resolve_value(value, vars, objs)
 
-    return value
+def _resolve_variable(name, vars, objs):
+    """Resolve a variable name from the variables or environment."""
+    return VariableResolver(vars, objs).resolve_variable(name)
 
 
-def _resolve_expression(expression, vars, objs):
+def _resolve_expression(expression, vars, objs, variables_map=None):
     """Evaluate an inline expression."""
     # Translate vars.env or var.env to variables_map['env']
-    expression = re.sub(
-        r"\bvars?\.([a-zA-Z_][a-zA-Z0-9_]*)\b", r"variables_map['\1']", expression
-    )
+    expression = EXPR_VAR_PATTERN.sub(r"variables_map['\1']", expression)
 
     # Prepare a safe evaluation context
-    local_context = copy.deepcopy(vars)
+    if variables_map is None:
+        variables_map = copy.deepcopy(vars)
 
-    locals = {"variables_map": local_context}
+    locals = {"variables_map": variables_map}
 
     if objs is not None:
         for k, v in objs.items():
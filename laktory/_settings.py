@@ -38,6 +38,12 @@ class Settings(BaseSettings):
         alias="LAKTORY_BUILD_ROOT",
     )
 
+    # Local catalog
+    local_catalog_root: str | None = Field(None, alias="LAKTORY_LOCAL_CATALOG_ROOT")
+
+    # YAML
+    yaml_cache_disk: bool = Field(False, alias="LAKTORY_YAML_CACHE_DISK")
+
     # Logging
     log_level: str = Field("INFO", alias="LAKTORY_LOG_LEVEL")
 
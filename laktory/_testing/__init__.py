@@ -6,6 +6,7 @@ from .get_dfs import StreamingSource
 from .get_dfs import get_df0
 from .get_dfs import get_df1
 from .paths import Paths
+from .workspaceclient import LocalWorkspaceClient
 
 
 def skip_test(required, extras=None):
@@ -0,0 +1,183 @@
+import itertools
+import re
+import threading
+from collections import Counter
+from types import SimpleNamespace
+
+
+class LocalWorkspaceClient:
+    """
+    Local stand-in for the Databricks Workspace Client, implementing the jobs
+    and pipelines calls used by the dispatcher runners. Each call reading runs
+    or updates states advances all active runs by one step.
+
+    Parameters
+    ----------
+    jobs:
+        Names of the deployed jobs
+    pipelines:
+        Names of the deployed pipelines
+    steps:
+        Number of states reads before a run terminates
+    failures:
+        Names of the jobs and pipelines whose runs fail
+    """
+
+    def __init__(
+        self,
+        jobs: list[str] = None,
+        pipelines: list[str] = None,
+        steps: int = 3,
+        failures: list[str] = None,
+    ):
+        self.steps = steps
+        self.failures = failures or []
+        self.calls = Counter()
+        self.config = SimpleNamespace(host="http://localhost")
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._job_ids = {name: next(self._ids) for name in jobs or []}
+        self._pipeline_ids = {name: str(next(self._ids)) for name in pipelines or []}
+        self._runs = {}
+        self.jobs = _LocalJobsAPI(self)
+        self.pipelines = _LocalPipelinesAPI(self)
+
+    def _call(self, name: str, advance: bool = False) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            if advance:
+                for run in self._runs.values():
+                    run["step"] = min(run["step"] + 1, self.steps)
+
+    def _start(self, name: str) -> str:
+        with self._lock:
+            run_id = next(self._ids)
+            self._runs[run_id] = {"name": name, "step": 0}
+            return run_id
+
+    def _state(self, run_id) -> tuple[str, bool | None]:
+        """Run state and success flag (`None` if not terminated)"""
+        run = self._runs[run_id]
+        if run["step"] == 0:
+            return "PENDING", None
+        if run["step"] < self.steps:
+            return "RUNNING", None
+        return "TERMINATED", run["name"] not in self.failures
+
+
+class _LocalJobsAPI:
+    def __init__(self, wc: LocalWorkspaceClient):
+        self.wc = wc
+
+    def list(self, name: str = None, **kwargs):
+        from databricks.sdk.service.jobs import BaseJob
+        from databricks.sdk.service.jobs import JobSettings
+
+        self.wc._call("jobs.list")
+        for _name, job_id in self.wc._job_ids.items():
+            if name is None or name == _name:
+                yield BaseJob(job_id=job_id, settings=JobSettings(name=_name))
+
+    def list_runs(
+        self,
+        job_id: int = None,
+        active_only: bool = None,
+        start_time_from: int = None,
+        **kwargs,
+    ):
+        self.wc._call("jobs.list_runs", advance=not active_only)
+        for run_id in reversed(list(self.wc._runs)):
+            run = self._get_run(run_id)
+            if job_id is not None and run.job_id != job_id:
+                continue
+            if active_only and run.state.life_cycle_state.value == "TERMINATED":
+                continue
+            yield run
+
+    def run_now(self, job_id: int, **kwargs):
+        self.wc._call("jobs.run_now")
+        name = {v: k for k, v in self.wc._job_ids.items()}[job_id]
+        return SimpleNamespace(run_id=self.wc._start(name))
+
+    def get_run(self, run_id: int, **kwargs):
+        self.wc._call("jobs.get_run", advance=True)
+        return self._get_run(run_id)
+
+    def _get_run(self, run_id: int):
+        from databricks.sdk.service.jobs import Run
+        from databricks.sdk.service.jobs import RunLifeCycleState
+        from databricks.sdk.service.jobs import RunResultState
+        from databricks.sdk.service.jobs import RunState
+
+        name = self.wc._runs[run_id]["name"]
+        state, success = self.wc._state(run_id)
+        result_state = None
+        if success is not None:
+            result_state = RunResultState.SUCCESS if success else RunResultState.FAILED
+        return Run(
+            run_id=run_id,
+            job_id=self.wc._job_ids.get(name),
+            run_page_url=f"{self.wc.config.host}/jobs/runs/{run_id}",
+            state=RunState(
+                life_cycle_state=RunLifeCycleState(state),
+                result_state=result_state,
+            ),
+            tasks=[],
+        )
+
+
+class _LocalPipelinesAPI:
+    def __init__(self, wc: LocalWorkspaceClient):
+        self.wc = wc
+
+    def list_pipelines(self, filter: str = None, **kwargs):
+        from databricks.sdk.service.pipelines import PipelineStateInfo
+        from databricks.sdk.service.pipelines import UpdateStateInfo
+        from databricks.sdk.service.pipelines import UpdateStateInfoState
+
+        self.wc._call("pipelines.list_pipelines", advance=filter is None)
+        name = None
+        if filter:
+            name = re.match(r"name LIKE '(.*)'", filter).group(1)
+
+        for _name, pipeline_id in self.wc._pipeline_ids.items():
+            if name is not None and name != _name:
+                continue
+            updates = [
+                UpdateStateInfo(
+                    update_id=str(run_id),
+                    state=UpdateStateInfoState(self._state(run_id)),
+                )
+                for run_id, run in reversed(self.wc._runs.items())
+                if run["name"] == _name
+            ]
+            yield PipelineStateInfo(
+                pipeline_id=pipeline_id, name=_name, latest_updates=updates
+            )
+
+    def start_update(self, pipeline_id: str, **kwargs):
+        from databricks.sdk.service.pipelines import StartUpdateResponse
+
+        self.wc._call("pipelines.start_update")
+        name = {v: k for k, v in self.wc._pipeline_ids.items()}[pipeline_id]
+        return StartUpdateResponse(update_id=str(self.wc._start(name)))
+
+    def get_update(self, pipeline_id: str, update_id: str, **kwargs):
+        from databricks.sdk.service.pipelines import GetUpdateResponse
+        from databricks.sdk.service.pipelines import UpdateInfo
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        self.wc._call("pipelines.get_update", advance=True)
+        return GetUpdateResponse(
+            update=UpdateInfo(
+                pipeline_id=pipeline_id,
+                update_id=update_id,
+                state=UpdateInfoState(self._state(int(update_id))),
+            )
+        )
+
+    def _state(self, run_id: int) -> str:
+        state, success = self.wc._state(run_id)
+        return {"PENDING": "QUEUED", "RUNNING": "RUNNING"}.get(
+            state, "COMPLETED" if success else "FAILED"
+        )
@@ -2,7 +2,6 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
 
 
@@ -33,6 +32,8 @@ def build(
     laktory build --env dev
     ```
     """
+    from laktory.cli._common import CLIController
+
     controller = CLIController(
         env=environment,
         stack_filepath=filepath,
@@ -2,7 +2,6 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
 from laktory.constants import SUPPORTED_BACKENDS
 
@@ -53,6 +52,8 @@ def destroy(
     * [CLI](https://www.laktory.ai/concepts/cli/)
     * terraform [destroy](https://developer.hashicorp.com/terraform/cli/commands/destroy)
     """
+    from laktory.cli._common import CLIController
+
     controller = CLIController(
         env=environment,
         auto_approve=auto_approve,
@@ -2,7 +2,6 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
 
 
@@ -42,6 +41,8 @@ def init(
     * [CLI](https://www.laktory.ai/concepts/cli/)
     * terraform [init](https://developer.hashicorp.com/terraform/cli/commands/init)
     """
+    from laktory.cli._common import CLIController
+
     controller = CLIController(
         env=environment,
         stack_filepath=filepath,
@@ -2,7 +2,6 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
 from laktory.constants import SUPPORTED_BACKENDS
 
@@ -43,6 +42,8 @@ def preview(
     * [CLI](https://www.laktory.ai/concepts/cli/)
     * terraform [plan](https://developer.hashicorp.com/terraform/cli/commands/plan)
     """
+    from laktory.cli._common import CLIController
+
     controller = CLIController(
         env=environment,
         stack_filepath=filepath,
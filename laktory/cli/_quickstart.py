@@ -7,7 +7,6 @@ from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
 
 from laktory._version import VERSION
-from laktory.cli._common import TemplateValidator
 from laktory.cli.app import app
 from laktory.constants import QUICKSTART_TEMPLATES
 
@@ -41,6 +40,7 @@ def quickstart(
     ----------
     * [CLI](https://www.laktory.ai/concepts/cli/)
     """
+    from laktory.cli._common import TemplateValidator
 
     # Template
     completer = WordCompleter(QUICKSTART_TEMPLATES, ignore_case=True)
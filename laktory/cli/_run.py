@@ -2,9 +2,7 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
-from laktory.dispatcher.dispatcher import Dispatcher
 
 
 @app.command()
@@ -78,6 +76,8 @@ def run(
     * [CLI](https://www.laktory.ai/concepts/cli/)
 
     """
+    from laktory.cli._common import CLIController
+    from laktory.dispatcher.dispatcher import Dispatcher
 
     # Set Resource Name
     if databricks_job and databricks_pipeline:
@@ -2,7 +2,6 @@ from typing import Annotated
 
 import typer
 
-from laktory.cli._common import CLIController
 from laktory.cli.app import app
 
 
@@ -35,6 +34,8 @@ def validate(
     ----------
     * [CLI](https://www.laktory.ai/concepts/cli/)
     """
+    from laktory.cli._common import CLIController
+
     CLIController(
         env=environment,
         stack_filepath=filepath,
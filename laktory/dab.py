@@ -1,5 +1,5 @@
 import os
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from laktory._logger import get_logger
@@ -25,6 +25,12 @@ def build_resources(bundle):
     - laktory workspace root is derived from the `dab_workspace_root` bundle variable
       as `{dab_workspace_root}/files/{build_root}/`.
 
+    Pipelines are loaded, validated and built concurrently on a process pool,
+    whose size may be set with the `laktory_build_max_workers` bundle variable.
+    The build directory is updated incrementally: config files are only
+    re-written when their content changed and stale files from deleted
+    pipelines are removed.
+
     Examples
     --------
     To use, declare in `databricks.yml`:
@@ -61,7 +67,6 @@ def build_resources(bundle):
     from databricks.bundles.core import Resources
 
     from laktory._settings import settings
-    from laktory.models.pipeline.pipeline import Pipeline
 
     # Get Bundle (databricks.yml) directory. This only works if CLI is called from the
     # same directory (i.e. --bundle-dir is not used)
@@ -96,12 +101,13 @@ def build_resources(bundle):
     # Laktory expect the workspace root to exclude "/Workspace/"
     settings.workspace_root = settings.workspace_root.replace("/Workspace/", "/")
 
-    # Clean the build directory to remove stale files from deleted pipelines
+    # The build directory is updated incrementally. Files that are neither
+    # written nor confirmed as unchanged by this build are removed at the end.
     build_dir = Path(settings.build_root)
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-        logger.info(f"Cleaned stale build directory '{build_dir}'")
     build_dir.mkdir(parents=True, exist_ok=True)
+    build_mtimes = {
+        str(f): f.stat().st_mtime_ns for f in build_dir.rglob("*") if f.is_file()
+    }
 
     # --- Bundle variables ---
     # Expose all bundle variables for injection into pipeline models.
@@ -111,8 +117,7 @@ def build_resources(bundle):
     dirs_raw = bundle_vars.get("laktory_pipelines_dir", "laktory/pipelines")
     pipelines_dirs = [d.strip() for d in dirs_raw.split(",")]
 
-    resources = Resources()
-
+    yaml_files = []
     for laktory_pipelines_dir in pipelines_dirs:
         dirpath = Path(laktory_pipelines_dir)
         if not dirpath.is_absolute():
@@ -122,34 +127,98 @@ def build_resources(bundle):
             logger.warning(f"Pipelines directory '{dirpath}' does not exist. Skipping.")
             continue
 
-        yaml_files = sorted(dirpath.glob("*.yaml")) + sorted(dirpath.glob("*.yml"))
-        if not yaml_files:
+        _yaml_files = sorted(dirpath.glob("*.yaml")) + sorted(dirpath.glob("*.yml"))
+        if not _yaml_files:
             logger.warning(f"No pipeline YAML files found in '{dirpath}'.")
             continue
+        yaml_files += _yaml_files
+
+    # --- Build pipelines ---
+    # Pipelines are independent: they are loaded, validated and built on a
+    # process pool.
+    max_workers = bundle_vars.get("laktory_build_max_workers", None)
+    if max_workers is not None:
+        max_workers = int(max_workers)
+    args = [
+        (yaml_file, bundle_vars, settings.build_root, settings.workspace_root)
+        for yaml_file in yaml_files
+    ]
+    if len(args) <= 1 or (max_workers is not None and max_workers <= 1):
+        results = [_build_pipeline_resource(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_build_pipeline_resource, *zip(*args)))
 
-        for yaml_file in yaml_files:
-            logger.info(f"Loading pipeline from '{yaml_file}'")
-            with open(yaml_file, "r", encoding="utf-8") as fp:
-                pl = Pipeline.model_validate_yaml(fp)
+    resources = Resources()
+    filepaths = set()
+    for result in results:
+        if result is None:
+            continue
+        resource_name, dab_resource, _filepaths = result
+        resources.add_resource(resource_name, dab_resource)
+        filepaths.update(_filepaths)
+        logger.info(f"Added DABs resource '{resource_name}'")
+
+    # --- Remove stale files from deleted pipelines ---
+    for filepath in sorted(build_dir.rglob("*"), reverse=True):
+        if filepath.is_dir():
+            if not any(filepath.iterdir()):
+                filepath.rmdir()
+        elif (
+            str(filepath) not in filepaths
+            and build_mtimes.get(str(filepath)) == filepath.stat().st_mtime_ns
+        ):
+            logger.info(f"Removing stale build file '{filepath}'")
+            filepath.unlink()
 
-            # Inject bundle variables. Pipeline-level variables take priority
-            # because inject_vars() applies them on top of the provided vars dict.
-            pl = pl.inject_vars(vars=bundle_vars)
+    return resources
 
-            orchestrator = pl.orchestrator
-            if not orchestrator:
-                logger.info(f"Pipeline '{pl.name}' has no orchestrator. Skipping.")
-                continue
 
-            # Write pipeline config JSON for DABs to sync to the workspace
-            config_file = getattr(orchestrator, "config_file", None)
-            if config_file:
-                config_file.build()
+def _build_pipeline_resource(
+    yaml_file: Path,
+    bundle_vars: dict,
+    build_root: str,
+    workspace_root: str,
+):
+    """
+    Load, validate and build a single pipeline YAML file. Executed in a worker
+    process of `build_resources`, so the settings set by the parent process are
+    passed explicitly.
 
-            # to_dab_resource() returns the dab resource, and also copies supporting
-            # files (e.g. DLT notebook) to build_root and sets notebook paths.
-            dab_resource = orchestrator.to_dab_resource()
-            resources.add_resource(orchestrator.resource_name, dab_resource)
-            logger.info(f"Added DABs resource '{orchestrator.resource_name}'")
+    Returns
+    -------
+    :
+        Resource name, DABs resource and paths of the built config files, or
+        `None` if the pipeline has no orchestrator.
+    """
+    from laktory._settings import settings
+    from laktory.models.pipeline.pipeline import Pipeline
 
-    return resources
+    settings.build_root = build_root
+    settings.workspace_root = workspace_root
+
+    logger.info(f"Loading pipeline from '{yaml_file}'")
+    with open(yaml_file, "r", encoding="utf-8") as fp:
+        pl = Pipeline.model_validate_yaml(fp)
+
+    # Inject bundle variables. Pipeline-level variables take priority
+    # because inject_vars() applies them on top of the provided vars dict.
+    pl = pl.inject_vars(vars=bundle_vars)
+
+    orchestrator = pl.orchestrator
+    if not orchestrator:
+        logger.info(f"Pipeline '{pl.name}' has no orchestrator. Skipping.")
+        return None
+
+    # Write pipeline config JSON for DABs to sync to the workspace. Unchanged
+    # files are not re-written.
+    filepaths = []
+    config_file = getattr(orchestrator, "config_file", None)
+    if config_file:
+        filepaths = [str(f) for f in config_file.build()]
+
+    # to_dab_resource() returns the dab resource, and also copies supporting
+    # files (e.g. DLT notebook) to build_root and sets notebook paths.
+    dab_resource = orchestrator.to_dab_resource()
+
+    return orchestrator.resource_name, dab_resource, filepaths
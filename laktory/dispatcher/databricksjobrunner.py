@@ -6,6 +6,7 @@ from laktory._logger import get_logger
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
 
 if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.jobs import Run
     from databricks.sdk.service.jobs import Wait
 
@@ -18,6 +19,7 @@ class DatabricksJobRunner(DispatcherRunner):
     """
 
     _run_start: "Wait" = None
+    _run_start_time: float = None
     _run: "Run" = None
 
     def get_id(self) -> str:
@@ -60,39 +62,10 @@ class DatabricksJobRunner(DispatcherRunner):
         output:
             None
         """
-        from databricks.sdk.errors import OperationFailed
         from databricks.sdk.service.jobs import RunLifeCycleState
 
-        active_runs = list(self.wc.jobs.list_runs(job_id=self.id, active_only=True))
-
-        if len(active_runs) > 0:
-            if current_run_action.upper() == "FAIL":
-                logger.info(f"Job {self.name} already running...")
-                raise Exception(f"Job {self.name} already running...")
-
-            elif current_run_action.upper() == "WAIT":
-                logger.info(
-                    f"Job {self.name} waiting for current run(s) to be completed..."
-                )
-                for run in active_runs:
-                    try:
-                        self.wc.jobs.wait_get_run_job_terminated_or_skipped(
-                            run_id=run.run_id
-                        )
-                    except OperationFailed:
-                        pass
-
-            elif current_run_action.upper() == "CANCEL":
-                logger.info(f"Job {self.name} cancelling current run(s)...")
-                for run in active_runs:
-                    self.wc.jobs.cancel_run_and_wait(run_id=run.run_id)
-
-        # Start update
-        t0 = time.time()
-        logger.info(f"Job {self.name} run started...")
-        self._run_start = self.wc.jobs.run_now(
-            job_id=self.id,
-        )
+        self.start(current_run_action=current_run_action)
+        t0 = self._run_start_time
 
         pstates = {}
         self.get_run()
@@ -137,6 +110,57 @@ class DatabricksJobRunner(DispatcherRunner):
                     f"Job {self.name} update not completed ({self.run_state})"
                 )
 
+    def start(
+        self,
+        current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        **kwargs,
+    ) -> None:
+        """
+        Start remote job run, without waiting for its completion.
+
+        Parameters
+        ----------
+        current_run_action:
+            Action to take with respect to current run (if any). Possible
+            options are:
+                - WAIT: wait for the current run to complete
+                - CANCEL: cancel the current run
+                - FAIL: raise an exception
+        """
+        from databricks.sdk.errors import OperationFailed
+
+        self._run = None
+        active_runs = list(self.wc.jobs.list_runs(job_id=self.id, active_only=True))
+
+        if len(active_runs) > 0:
+            if current_run_action.upper() == "FAIL":
+                logger.info(f"Job {self.name} already running...")
+                raise Exception(f"Job {self.name} already running...")
+
+            elif current_run_action.upper() == "WAIT":
+                logger.info(
+                    f"Job {self.name} waiting for current run(s) to be completed..."
+                )
+                for run in active_runs:
+                    try:
+                        self.wc.jobs.wait_get_run_job_terminated_or_skipped(
+                            run_id=run.run_id
+                        )
+                    except OperationFailed:
+                        pass
+
+            elif current_run_action.upper() == "CANCEL":
+                logger.info(f"Job {self.name} cancelling current run(s)...")
+                for run in active_runs:
+                    self.wc.jobs.cancel_run_and_wait(run_id=run.run_id)
+
+        # Start update
+        self._run_start_time = time.time()
+        logger.info(f"Job {self.name} run started...")
+        self._run_start = self.wc.jobs.run_now(
+            job_id=self.id,
+        )
+
     def get_run(self):
         self._run = self.wc.jobs.get_run(
             run_id=self.run_id,
@@ -150,3 +174,73 @@ class DatabricksJobRunner(DispatcherRunner):
     @property
     def run_id(self) -> str:
         return self._run_start.run_id
+
+    # ----------------------------------------------------------------------- #
+    # Run State                                                               #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def state(self) -> str | None:
+        """Current run life cycle state, with result state once terminated"""
+        if self._run is None:
+            return None
+        state = self.run_state.value
+        if self.is_terminated and self._run.state.result_state is not None:
+            state += f":{self._run.state.result_state.value}"
+        return state
+
+    @property
+    def is_terminated(self) -> bool:
+        """`True` if current run is terminated"""
+        from databricks.sdk.service.jobs import RunLifeCycleState
+
+        if self._run is None:
+            return False
+        return self.run_state in [
+            RunLifeCycleState.TERMINATED,
+            RunLifeCycleState.SKIPPED,
+            RunLifeCycleState.INTERNAL_ERROR,
+        ]
+
+    @property
+    def is_success(self) -> bool:
+        """`True` if current run is terminated successfully"""
+        from databricks.sdk.service.jobs import RunResultState
+
+        return (
+            self.is_terminated
+            and self._run.state.result_state == RunResultState.SUCCESS
+        )
+
+    def refresh_state(self) -> None:
+        """Refresh current run state"""
+        self.get_run()
+
+    @classmethod
+    def refresh_states(cls, wc: "WorkspaceClient", runners: list) -> None:
+        """
+        Refresh the run state of multiple job runners with a single list of
+        the runs started since the earliest runner start. Runs not found in
+        the list are fetched individually.
+
+        Parameters
+        ----------
+        wc:
+            Databricks Workspace Client
+        runners:
+            Job runners with a started run
+        """
+        if not runners:
+            return
+
+        pending = {r.run_id: r for r in runners}
+        start_time_from = int(min(r._run_start_time for r in runners) * 1000) - 1000
+        for run in wc.jobs.list_runs(start_time_from=start_time_from):
+            r = pending.pop(run.run_id, None)
+            if r is not None:
+                r._run = run
+            if not pending:
+                break
+
+        for r in pending.values():
+            r.get_run()
@@ -7,11 +7,16 @@ from laktory.datetime import unix_timestamp
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
 
 if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.pipelines import GetUpdateResponse
     from databricks.sdk.service.pipelines import StartUpdateResponse
 
 logger = get_logger(__name__)
 
+# Minimum number of pending runners for which states are refreshed by listing
+# all the workspace pipelines instead of getting each update
+LIST_REFRESH_MIN_RUNNERS = 3
+
 
 class DatabricksPipelineRunner(DispatcherRunner):
     """
@@ -19,6 +24,7 @@ class DatabricksPipelineRunner(DispatcherRunner):
     """
 
     _update_start: "StartUpdateResponse" = None
+    _update_start_time: float = None
     _update: "GetUpdateResponse" = None
 
     def get_id(self) -> str:
@@ -66,44 +72,14 @@ class DatabricksPipelineRunner(DispatcherRunner):
         output:
             None
         """
-        from databricks.sdk.core import DatabricksError
         from databricks.sdk.service.pipelines import EventLevel
         from databricks.sdk.service.pipelines import UpdateInfoState
 
         event_ids = []
 
         # Start update
-        t0 = time.time()
-        try:
-            self._update_start = self.wc.pipelines.start_update(
-                pipeline_id=self.id,
-                full_refresh=full_refresh,
-                # validate_only=False,
-            )
-            logger.info(f"Pipeline {self.name} update started...")
-
-        except DatabricksError as e:
-            # Exception is raised when update is currently in progress
-            if current_run_action.upper() == "FAIL":
-                logger.info(f"Pipeline {self.name} already running...")
-                raise e
-
-            elif current_run_action.upper() == "WAIT":
-                logger.info(
-                    f"Pipeline {self.name} waiting for current update to be completed..."
-                )
-                self.wc.pipelines.wait_get_pipeline_idle(pipeline_id=self.id)
-
-            elif current_run_action.upper() == "CANCEL":
-                logger.info(f"Pipeline {self.name} cancelling current update...")
-                self.wc.pipelines.stop_and_wait(pipeline_id=self.id)
-
-            logger.info(f"Pipeline {self.name} update started...")
-            self._update_start = self.wc.pipelines.start_update(
-                pipeline_id=self.id,
-                full_refresh=full_refresh,
-                # validate_only=False,
-            )
+        self.start(full_refresh=full_refresh, current_run_action=current_run_action)
+        t0 = self._update_start_time
 
         pstate = None
         self.get_update()
@@ -160,6 +136,62 @@ class DatabricksPipelineRunner(DispatcherRunner):
                     f"Pipeline {self.name} update not completed ({self.update_state})"
                 )
 
+    def start(
+        self,
+        current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        full_refresh: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Start remote pipeline update, without waiting for its completion.
+
+        Parameters
+        ----------
+        current_run_action:
+            Action to take with respect to current run (if any). Possible
+            options are:
+                - WAIT: wait for the current run to complete
+                - CANCEL: cancel the current run
+                - FAIL: raise an exception
+        full_refresh:
+            If `True`, tables are fully refreshed (re-built). Otherwise, only
+            increments are processed.
+        """
+        from databricks.sdk.core import DatabricksError
+
+        self._update = None
+        self._update_start_time = time.time()
+        try:
+            self._update_start = self.wc.pipelines.start_update(
+                pipeline_id=self.id,
+                full_refresh=full_refresh,
+                # validate_only=False,
+            )
+            logger.info(f"Pipeline {self.name} update started...")
+
+        except DatabricksError as e:
+            # Exception is raised when update is currently in progress
+            if current_run_action.upper() == "FAIL":
+                logger.info(f"Pipeline {self.name} already running...")
+                raise e
+
+            elif current_run_action.upper() == "WAIT":
+                logger.info(
+                    f"Pipeline {self.name} waiting for current update to be completed..."
+                )
+                self.wc.pipelines.wait_get_pipeline_idle(pipeline_id=self.id)
+
+            elif current_run_action.upper() == "CANCEL":
+                logger.info(f"Pipeline {self.name} cancelling current update...")
+                self.wc.pipelines.stop_and_wait(pipeline_id=self.id)
+
+            logger.info(f"Pipeline {self.name} update started...")
+            self._update_start = self.wc.pipelines.start_update(
+                pipeline_id=self.id,
+                full_refresh=full_refresh,
+                # validate_only=False,
+            )
+
     def get_update(self):
         self._update = self.wc.pipelines.get_update(
             pipeline_id=self.id, update_id=self.update_id
@@ -177,3 +209,86 @@ class DatabricksPipelineRunner(DispatcherRunner):
     @property
     def update_url(self) -> str:
         return f"{self.wc.config.host}/pipelines/{self.id}/updates/{self.update_id}"
+
+    # ----------------------------------------------------------------------- #
+    # Run State                                                               #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def state(self) -> str | None:
+        """Current update state"""
+        if self._update is None:
+            return None
+        return self.update_state.value
+
+    @property
+    def is_terminated(self) -> bool:
+        """`True` if current update is terminated"""
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        if self._update is None:
+            return False
+        return self.update_state in [
+            UpdateInfoState.CANCELED,
+            UpdateInfoState.COMPLETED,
+            UpdateInfoState.FAILED,
+        ]
+
+    @property
+    def is_success(self) -> bool:
+        """`True` if current update is completed"""
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        return (
+            self._update is not None and self.update_state == UpdateInfoState.COMPLETED
+        )
+
+    def refresh_state(self) -> None:
+        """Refresh current update state"""
+        self.get_update()
+
+    @classmethod
+    def refresh_states(cls, wc: "WorkspaceClient", runners: list) -> None:
+        """
+        Refresh the update state of multiple pipeline runners with a single
+        list of the pipelines and their latest updates. Updates not found in
+        the list are fetched individually. As the list pages through all the
+        workspace pipelines, updates are fetched individually when fewer than
+        `LIST_REFRESH_MIN_RUNNERS` runners are pending.
+
+        Parameters
+        ----------
+        wc:
+            Databricks Workspace Client
+        runners:
+            Pipeline runners with a started update
+        """
+        from databricks.sdk.service.pipelines import GetUpdateResponse
+        from databricks.sdk.service.pipelines import UpdateInfo
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        if not runners:
+            return
+
+        if len(runners) < LIST_REFRESH_MIN_RUNNERS:
+            super().refresh_states(wc, runners)
+            return
+
+        pending = {r.update_id: r for r in runners}
+        for pl in wc.pipelines.list_pipelines():
+            for u in pl.latest_updates or []:
+                r = pending.pop(u.update_id, None)
+                if r is None or u.state is None:
+                    continue
+                r._update = GetUpdateResponse(
+                    update=UpdateInfo(
+                        pipeline_id=pl.pipeline_id,
+                        update_id=u.update_id,
+                        state=UpdateInfoState(u.state.value),
+                    )
+                )
+            if not pending:
+                break
+
+        for r in pending.values():
+            r.get_update()
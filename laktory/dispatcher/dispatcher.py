@@ -1,5 +1,12 @@
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from typing import Literal
 
+from laktory._logger import get_logger
 from laktory._useragent import DATABRICKS_USER_AGENT
 from laktory._useragent import VERSION
 from laktory.constants import SUPPORTED_BACKENDS
@@ -10,6 +17,8 @@ from laktory.models.stacks.stack import Stack
 if TYPE_CHECKING:
     from databricks.sdk import WorkspaceClient
 
+logger = get_logger(__name__)
+
 
 class Dispatcher:
     """
@@ -44,6 +53,9 @@ class Dispatcher:
 
     # Run job
     job.run(current_run_action="CANCEL")
+
+    # Run job and pipeline concurrently
+    dispatcher.run(names=["pl-stock-prices", "job-stock-prices"])
     ```
     """
 
@@ -176,13 +188,33 @@ class Dispatcher:
     def get_resource_ids(self, env=None):
         """
         Get resource ids for each of the resources defined in the stack in the
-        provided environment `env`.
+        provided environment `env`. Ids are looked up concurrently.
         """
         if env is not None:
             self.env = env
 
-        for r in self.resources.values():
-            r.get_id()
+        # Workspace client is initialized once, before being shared by threads
+        _ = self.wc
+
+        with ThreadPoolExecutor(thread_name_prefix="laktory-dispatcher") as executor:
+            for future in [executor.submit(r.get_id) for r in self.resources.values()]:
+                future.result()
+
+    async def aget_resource_ids(self, names: list[str] | None = None):
+        """
+        Get resource ids concurrently on the running event loop.
+
+        Parameters
+        ----------
+        names:
+            Names of the resources. All resources if `None`.
+        """
+        _ = self.wc
+        if names is None:
+            names = list(self.resources.keys())
+        await asyncio.gather(
+            *[asyncio.to_thread(self.resources[name].get_id) for name in names]
+        )
 
     # ----------------------------------------------------------------------- #
     # Run                                                                     #
@@ -219,3 +251,149 @@ class Dispatcher:
         """
         pl = self.resources[dlt_name]
         pl.run(*args, **kwargs)
+
+    async def arun(
+        self,
+        names: list[str] | None = None,
+        timeout: int = 20 * 60,
+        full_refresh: bool = False,
+        raise_exception: bool = False,
+        current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        on_status: Callable[[dict[str, str | None]], None] | None = None,
+    ) -> dict[str, str | None]:
+        """
+        Run multiple jobs and pipelines concurrently and monitor them until
+        completion.
+
+        All runs are started concurrently. The states of all the runs are then
+        polled on the event loop with one batched list call per resource type.
+        The polling interval is increased exponentially, up to
+        `max_poll_interval`, while no state changes and is reset when a state
+        changes.
+
+        Parameters
+        ----------
+        names:
+            Names of the jobs and pipelines to run. All resources if `None`.
+        timeout:
+            Maximum time allowed for the runs to complete.
+        full_refresh:
+            If `True`, pipelines tables are fully refreshed (re-built).
+            Ignored for jobs.
+        raise_exception:
+            If `True`, an exception is raised if any of the runs fails or is
+            not completed before `timeout`.
+        current_run_action:
+            Action to take with respect to current runs (if any). Possible
+            options are:
+                - WAIT: wait for the current run to complete
+                - CANCEL: cancel the current run
+                - FAIL: raise an exception
+        poll_interval:
+            Initial time, in seconds, between two polls of the runs states.
+        max_poll_interval:
+            Maximum time, in seconds, between two polls of the runs states.
+        on_status:
+            Function called with the state of each run every time a state
+            changes.
+
+        Returns
+        -------
+        :
+            State of each run
+        """
+        if names is None:
+            names = list(self.resources.keys())
+        runners = {name: self.resources[name] for name in names}
+
+        # Ids
+        await self.aget_resource_ids(
+            [name for name, r in runners.items() if r.id is None]
+        )
+
+        # Start
+        def _start(runner):
+            kwargs = {"current_run_action": current_run_action}
+            if isinstance(runner, DatabricksPipelineRunner):
+                kwargs["full_refresh"] = full_refresh
+            runner.start(**kwargs)
+
+        t0 = time.time()
+        await asyncio.gather(*[asyncio.to_thread(_start, r) for r in runners.values()])
+
+        # Poll
+        statuses = {}
+        interval = poll_interval
+        while True:
+            pending = [r for r in runners.values() if not r.is_terminated]
+            groups = {}
+            for r in pending:
+                groups.setdefault(type(r), []).append(r)
+            await asyncio.gather(
+                *[
+                    asyncio.to_thread(cls.refresh_states, self.wc, _runners)
+                    for cls, _runners in groups.items()
+                ]
+            )
+
+            _statuses = {name: r.state for name, r in runners.items()}
+            if _statuses != statuses:
+                statuses = _statuses
+                interval = poll_interval
+                counts = Counter(statuses.values())
+                logger.info(
+                    "Runs status: "
+                    + ", ".join(f"{v} {k}" for k, v in sorted(counts.items()))
+                )
+                if on_status is not None:
+                    on_status(dict(statuses))
+            else:
+                interval = min(interval * 2, max_poll_interval)
+
+            if all(r.is_terminated for r in runners.values()):
+                break
+
+            if time.time() - t0 > timeout:
+                logger.info(f"Runs not completed after {timeout} sec")
+                break
+
+            await asyncio.sleep(interval)
+
+        logger.info(f"Runs terminated after {time.time() - t0: 5.2f} sec")
+        failed = [name for name, r in runners.items() if not r.is_success]
+        if raise_exception and failed:
+            raise Exception(f"Runs {failed} not completed successfully ({statuses})")
+
+        return statuses
+
+    def run(self, *args, **kwargs) -> dict[str, str | None]:
+        """
+        Run multiple jobs and pipelines concurrently and monitor them until
+        completion. Synchronous version of `Dispatcher.arun`.
+
+        When called from a running event loop (Databricks or Jupyter
+        notebooks), the runs are monitored on a new event loop in a separate
+        thread and the calling loop is blocked until completion. Prefer
+        `await dispatcher.arun(...)` from asynchronous code.
+
+        Parameters
+        ----------
+        *args:
+            Arguments passed to `Dispatcher.arun()`
+        **kwargs:
+            Keyword arguments passed to `Dispatcher.arun()`
+
+        Returns
+        -------
+        :
+            State of each run
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.arun(*args, **kwargs))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.arun(*args, **kwargs)).result()
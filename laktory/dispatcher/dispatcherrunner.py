@@ -29,5 +29,47 @@ class DispatcherRunner(BaseModel):
     def get_id(self) -> str:
         raise NotImplementedError()
 
+    def start(self, current_run_action="WAIT", **kwargs):
+        raise NotImplementedError()
+
     def run(self, wait=True):
         raise NotImplementedError()
+
+    # ----------------------------------------------------------------------- #
+    # Run State                                                               #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def state(self) -> str | None:
+        """Current run state, `None` if not started"""
+        raise NotImplementedError()
+
+    @property
+    def is_terminated(self) -> bool:
+        """`True` if current run is terminated"""
+        raise NotImplementedError()
+
+    @property
+    def is_success(self) -> bool:
+        """`True` if current run is terminated successfully"""
+        raise NotImplementedError()
+
+    @classmethod
+    def refresh_states(cls, wc: "WorkspaceClient", runners: list) -> None:
+        """
+        Refresh the run state of multiple runners. Runners may override this
+        method to fetch all states with batched list calls.
+
+        Parameters
+        ----------
+        wc:
+            Databricks Workspace Client
+        runners:
+            Runners with a started run
+        """
+        for runner in runners:
+            runner.refresh_state()
+
+    def refresh_state(self) -> None:
+        """Refresh current run state"""
+        raise NotImplementedError()
@@ -0,0 +1,286 @@
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalCatalog:
+    """
+    Local catalog of tables used with Polars backend. A SQLite registry maps
+    table full names (`{catalog}.{schema}.{table}`) to the location of their
+    data so that table data sinks and sources can be used without a Spark
+    session or a metastore. Tables data are stored in DELTA format and read
+    and written with `delta-rs`.
+
+    Managed tables are stored in `{root}/{catalog}/{schema}/{table}` and their
+    data is deleted when the table is dropped. External tables are stored at
+    the location provided when the table is created.
+
+    Parameters
+    ----------
+    root:
+        Root directory of the catalog registry and managed tables.
+
+    Examples
+    --------
+    ```py
+    import tempfile
+
+    import polars as pl
+
+    from laktory.localcatalog import LocalCatalog
+
+    catalog = LocalCatalog(root=tempfile.mkdtemp())
+    table = catalog.create_table("dev.finance.prices")
+    pl.DataFrame({"x": [1, 2, 3]}).write_delta(table["path"])
+
+    print(catalog.list_tables())
+    # > ['dev.finance.prices']
+    ```
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def registry_path(self) -> Path:
+        """Path of the SQLite registry"""
+        return self.root / "catalog.db"
+
+    # ----------------------------------------------------------------------- #
+    # Registry                                                                #
+    # ----------------------------------------------------------------------- #
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Registry connection, committed on success, rolled back on failure and
+        closed on exit.
+        """
+        with self._lock:
+            if not self._initialized:
+                self.root.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.registry_path, timeout=30)
+                try:
+                    with conn:
+                        conn.execute(
+                            """
+                            CREATE TABLE IF NOT EXISTS tables (
+                                full_name TEXT PRIMARY KEY,
+                                path TEXT NOT NULL,
+                                format TEXT NOT NULL,
+                                managed INTEGER NOT NULL,
+                                created_at TEXT NOT NULL
+                            )
+                            """
+                        )
+                finally:
+                    conn.close()
+                self._initialized = True
+
+        conn = sqlite3.connect(self.registry_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(full_name: str) -> str:
+        parts = [p.strip("`") for p in re.findall(r"`[^`]*`|[^.]+", full_name)]
+        if not parts or not all(parts) or len(parts) > 3:
+            raise ValueError(f"Invalid table name '{full_name}'")
+        return ".".join(parts).lower()
+
+    # ----------------------------------------------------------------------- #
+    # Tables                                                                  #
+    # ----------------------------------------------------------------------- #
+
+    def get_table(self, full_name: str) -> dict[str, Any] | None:
+        """
+        Get registered table.
+
+        Parameters
+        ----------
+        full_name:
+            Table full name
+
+        Returns
+        -------
+        :
+            Table `full_name`, `path`, `format`, `managed` and `created_at`
+            or `None` if the table is not registered.
+        """
+        key = self._key(full_name)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM tables WHERE full_name = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        table = dict(row)
+        table["managed"] = bool(table["managed"])
+        return table
+
+    def _get_path(self, key: str, path: str | Path = None) -> str:
+        if path is None:
+            path = self.root.joinpath(*key.split("."))
+        return Path(path).absolute().as_posix()
+
+    def get_table_path(self, full_name: str, path: str | Path = None) -> str:
+        """
+        Location of table data. The registry is not modified.
+
+        Parameters
+        ----------
+        full_name:
+            Table full name
+        path:
+            Location of an external table, used if the table is not
+            registered yet. If `None`, table is managed by the catalog.
+
+        Returns
+        -------
+        :
+            Path of the registered table or, if not registered, path at which
+            the table would be registered by `create_table`.
+        """
+        table = self.get_table(full_name)
+        if table is not None:
+            return table["path"]
+        return self._get_path(self._key(full_name), path)
+
+    def table_exists(self, full_name: str) -> bool:
+        """`True` if table `full_name` is registered and its data exists"""
+        table = self.get_table(full_name)
+        if table is None:
+            return False
+        return os.path.exists(table["path"])
+
+    def create_table(
+        self, full_name: str, format: str = "DELTA", path: str | Path = None
+    ) -> dict[str, Any]:
+        """
+        Register table, if not already registered. Table data is written by
+        the caller.
+
+        Parameters
+        ----------
+        full_name:
+            Table full name
+        format:
+            Table data format. Only `DELTA` is currently supported.
+        path:
+            Location of an external table. If `None`, table is managed by the
+            catalog.
+
+        Returns
+        -------
+        :
+            Registered table
+        """
+        if format.upper() != "DELTA":
+            raise ValueError(
+                f"Format '{format}' is not supported by local catalog. Use 'DELTA'."
+            )
+
+        key = self._key(full_name)
+        managed = path is None
+        path = self._get_path(key, path)
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO tables VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    format.upper(),
+                    int(managed),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+        table = self.get_table(key)
+        if table["path"] != path:
+            logger.info(
+                f"Table '{key}' already registered at {table['path']}. Path {path} is ignored."
+            )
+        return table
+
+    def drop_table(self, full_name: str) -> None:
+        """
+        Unregister table. Data of managed tables is deleted.
+
+        Parameters
+        ----------
+        full_name:
+            Table full name
+        """
+        table = self.get_table(full_name)
+        if table is None:
+            return
+
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM tables WHERE full_name = ?", (table["full_name"],)
+            )
+
+        if table["managed"] and os.path.exists(table["path"]):
+            logger.info(f"Deleting table data at {table['path']}")
+            shutil.rmtree(table["path"])
+
+    def list_tables(self, prefix: str = None) -> list[str]:
+        """
+        Full names of the registered tables.
+
+        Parameters
+        ----------
+        prefix:
+            If specified, only tables with full name starting with `prefix`
+            (e.g. `{catalog}.{schema}`) are returned.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT full_name FROM tables ORDER BY full_name"
+            ).fetchall()
+        names = [r["full_name"] for r in rows]
+        if prefix:
+            prefix = self._key(prefix) + "."
+            names = [n for n in names if n.startswith(prefix)]
+        return names
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_local_catalog() -> LocalCatalog:
+    """
+    Local catalog stored in `settings.local_catalog_root` or, if not set, in
+    `{settings.runtime_root}/catalog`.
+    """
+    from laktory._settings import settings
+
+    root = settings.local_catalog_root
+    if root is None:
+        root = Path(settings.runtime_root) / "catalog"
+    root = Path(root).absolute()
+
+    with _catalogs_lock:
+        if root not in _catalogs:
+            _catalogs[root] = LocalCatalog(root)
+        return _catalogs[root]
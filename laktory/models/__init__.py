@@ -1,13 +1,56 @@
-from .basechild import BaseChild
-from .basemodel import BaseModel
-from .dataframe import *
-from .dataquality import *
-from .datasinks import *
-from .datasources import *
-from .dtypes import *
-from .grants import *
-from .laktorycontext import LaktoryContext
-from .pipeline import *
-from .readerwritermethod import ReaderWriterMethod
-from .resources import *
-from .stacks import *
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+# Models imported on first access (PEP 562) so that only the models required
+# by a given entrypoint (CLI command, pipeline job task) are imported.
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "basechild",
+        "basemodel",
+        "dataframe",
+        "dataquality",
+        "datasinks",
+        "datasources",
+        "dtypes",
+        "grants",
+        "laktorycontext",
+        "pipeline",
+        "readerwritermethod",
+        "resources",
+        "stacks",
+    ],
+    objects={
+        "BaseChild": "basechild",
+        "BaseModel": "basemodel",
+        "LaktoryContext": "laktorycontext",
+        "ReaderWriterMethod": "readerwritermethod",
+    },
+    star_modules=[
+        "dataframe",
+        "dataquality",
+        "datasinks",
+        "datasources",
+        "dtypes",
+        "grants",
+        "pipeline",
+        "resources",
+        "stacks",
+    ],
+)
+
+if TYPE_CHECKING:
+    from .basechild import BaseChild
+    from .basemodel import BaseModel
+    from .dataframe import *
+    from .dataquality import *
+    from .datasinks import *
+    from .datasources import *
+    from .dtypes import *
+    from .grants import *
+    from .laktorycontext import LaktoryContext
+    from .pipeline import *
+    from .readerwritermethod import ReaderWriterMethod
+    from .resources import *
+    from .stacks import *
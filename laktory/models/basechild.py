@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
@@ -17,6 +18,7 @@ class BaseChild(BaseModel, metaclass=ModelMetaclass):
         validate_assignment=True,
     )
     _parent: Any = None
+    _parent_cache: dict[str, Any] = None
 
     @model_validator(mode="after")
     def assign_parent_to_children(self) -> Any:
@@ -34,6 +36,7 @@ class BaseChild(BaseModel, metaclass=ModelMetaclass):
     @parent.setter
     def parent(self, value):
         self._parent = value
+        self._invalidate_parent_cache()
 
     def update_from_parent(self):
         pass
@@ -48,22 +51,53 @@ class BaseChild(BaseModel, metaclass=ModelMetaclass):
 
     def model_copy(self, *args, **kwargs):
         model = super().model_copy(*args, **kwargs)
+        # Private attributes are shallow copied and the cache must not be shared
+        model._parent_cache = None
         model._assign_parent_to_children()
         return model
 
-    def _assign_parent_to_children(self):
-        def _set_parent(o, parent=self):
-            if isinstance(o, BaseChild):
-                o._parent = parent
-                o.update_from_parent()
-
+    def _get_children(self) -> list["BaseChild"]:
+        children = []
         for c_name in self.children_names:
             o = getattr(self, c_name)
             if isinstance(o, list):
-                for _o in o:
-                    _set_parent(_o)
+                children += list(o)
             elif isinstance(o, dict):
-                for _o in o.values():
-                    _set_parent(_o)
+                children += list(o.values())
             else:
-                _set_parent(o)
+                children += [o]
+        return [c for c in children if isinstance(c, BaseChild)]
+
+    def _assign_parent_to_children(self):
+        for o in self._get_children():
+            o._parent = self
+            o._invalidate_parent_cache()
+            o.update_from_parent()
+
+    # ----------------------------------------------------------------------- #
+    # Parent Cache                                                            #
+    # ----------------------------------------------------------------------- #
+
+    def _get_parent_cached(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Value resolved from the parent chain. `func` is only called on first
+        access, until the model or one of its ancestors is re-parented.
+        """
+        cache = self._parent_cache
+        if cache is None:
+            cache = self._parent_cache = {}
+        if key not in cache:
+            cache[key] = func()
+        return cache[key]
+
+    def _invalidate_parent_cache(self) -> None:
+        """Clear values resolved from the parent chain for model and descendants"""
+        visited = set()
+        models = [self]
+        while models:
+            o = models.pop()
+            if id(o) in visited:
+                continue
+            visited.add(id(o))
+            o._parent_cache = None
+            models += o._get_children()
@@ -22,8 +22,7 @@ from pydantic import Field
 from pydantic import model_validator
 from pydantic._internal._model_construction import ModelMetaclass as _ModelMetaclass
 
-from laktory._parsers import _resolve_value
-from laktory._parsers import _resolve_values
+from laktory._parsers import VariableResolver
 from laktory.typing import VariableType
 from laktory.yaml.recursiveloader import RecursiveLoader
 
@@ -429,7 +428,6 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
         if objs is None:
             objs = {}
 
-        # TODO: Review implementation as it results in serious performance hits
         from laktory.models.pipeline import Pipeline
         from laktory.models.pipeline import PipelineNode
 
@@ -443,6 +441,9 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
         if not inplace:
             self = self.model_copy(deep=True)
 
+        # Resolver (shared by all fields)
+        resolver = VariableResolver(vars=vars, objs=objs)
+
         # Inject into field values
         for k in list(self.model_fields_set):
             if k == "variables":
@@ -451,10 +452,10 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
 
             if isinstance(o, BaseModel) or isinstance(o, dict) or isinstance(o, list):
                 # Mutable objects will be updated in place
-                _resolve_values(o, vars, objs)
+                resolver.resolve_values(o)
             else:
                 # Simple objects must be updated explicitly
-                setattr(self, k, _resolve_value(o, vars, objs))
+                setattr(self, k, resolver.resolve_value(o))
 
         # Inject into child resources
         if hasattr(self, "core_resources"):
@@ -530,7 +531,7 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
             dump = copy.deepcopy(dump)
 
         # Inject into field values
-        _resolve_values(dump, vars, objs)
+        VariableResolver(vars=vars, objs=objs).resolve_values(dump)
 
         if not inplace:
             return dump
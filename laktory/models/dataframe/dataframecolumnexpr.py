@@ -202,7 +202,11 @@ class DataFrameColumnExpr(BaseModel, PipelineChild):
                 if self.type == "SQL":
                     import polars as pl
 
-                    expr = pl.sql_expr(_value)
+                    from laktory.sqlparser import expr_cache
+
+                    expr = expr_cache.get(
+                        ("polars", _value), lambda: pl.sql_expr(_value)
+                    )
                 else:
                     # Imports required to evaluate expressions
                     import polars as pl  # noqa: F401
@@ -1,5 +1,6 @@
 # import abc
 import re
+import uuid
 from typing import TYPE_CHECKING
 from typing import Literal
 
@@ -25,23 +26,83 @@ if TYPE_CHECKING:
 # --------------------------------------------------------------------------- #
 
 
-def to_safe_expr(expr, df_names=None):
+def to_safe_expr(expr, df_names=None, suffix=""):
     if df_names is None:
         df_names = []
     df_names += ["df"]
 
     # Update nodes
     pattern = r"\{nodes\.(.*?)\}"
-    repl = r"__nodes_\1___"
+    repl = r"__nodes_\1___" + suffix
     expr = re.sub(pattern, repl, expr)
 
     # Replace df names
     for df_name in df_names:
-        expr = expr.replace("{" + df_name + "}", f"__{df_name}__")
+        expr = expr.replace("{" + df_name + "}", f"__{df_name}__{suffix}")
 
     return expr
 
 
+# --------------------------------------------------------------------------- #
+# Helper Classes                                                              #
+# --------------------------------------------------------------------------- #
+
+
+class DataFrameExprContext:
+    """
+    SQL execution context shared by the DataFrame expressions of a
+    transformer execution. Frames are registered once in a single Polars
+    `SQLContext` (or as Spark temporary views) and only re-registered when
+    they change. Upstream nodes referenced by multiple expressions are only
+    read once.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.frames = {}
+        self.sources = {}
+        self._sql_context = None
+
+        # Spark temporary views are global to the session. Their names are
+        # unique to the context so that nodes executed concurrently don't
+        # read or replace each other views.
+        self.view_suffix = uuid.uuid4().hex[:12]
+
+    @property
+    def sql_context(self):
+        if self._sql_context is None:
+            import polars as pl
+
+            self._sql_context = pl.SQLContext()
+        return self._sql_context
+
+    def read(self, source: "PipelineNodeDataSource") -> AnyFrame:
+        """Read pipeline node data source, if not already read"""
+        name = source.node.name
+        if name not in self.sources:
+            self.sources[name] = source.read()
+        return self.sources[name]
+
+    def register(self, dfs: dict[str, AnyFrame]) -> None:
+        """
+        Register native frames `dfs`. Because Polars and Spark don't support {}
+        in frame names, double underscores (__) are used instead.
+        """
+        for k, df in dfs.items():
+            name = to_safe_expr("{" + k + "}", df_names=[k])
+            if self.frames.get(name) is df:
+                continue
+            self.frames[name] = df
+
+            if self.backend == DataFrameBackends.POLARS:
+                self.sql_context.register(name, df)
+
+            elif self.backend == DataFrameBackends.PYSPARK:
+                # TODO: Using parametrized queries would be ideal, but it is not compatible
+                #       with older versions of spark or Delta Live Tables.
+                df.createOrReplaceTempView(name + self.view_suffix)
+
+
 # --------------------------------------------------------------------------- #
 # Main Class                                                                  #
 # --------------------------------------------------------------------------- #
@@ -194,7 +255,9 @@ class DataFrameExpr(BaseModel, PipelineChild):
         #
         # return expr
 
-    def to_df(self, dfs: dict[str, AnyFrame]) -> AnyFrame:
+    def to_df(
+        self, dfs: dict[str, AnyFrame], context: DataFrameExprContext = None
+    ) -> AnyFrame:
         """
         Execute expression on provided DataFrame `dfs`.
 
@@ -202,6 +265,9 @@ class DataFrameExpr(BaseModel, PipelineChild):
         ----------
         dfs:
             Input dataframes
+        context:
+            Execution context shared with other expressions. A new context is
+            created if not provided.
 
         Returns
         -------
@@ -211,9 +277,12 @@ class DataFrameExpr(BaseModel, PipelineChild):
         # From SQL expression
         logger.info(f"DataFrame as \n{self.expr.strip()}")
 
+        if context is None:
+            context = DataFrameExprContext()
+
         # Read Data Sources
         for s in self.data_sources:
-            dfs[f"nodes.{s.node.name}"] = s.read()
+            dfs[f"nodes.{s.node.name}"] = context.read(s)
 
         # Convert to Native
         dfs = {k: nw.from_native(v).to_native() for k, v in dfs.items()}
@@ -221,49 +290,29 @@ class DataFrameExpr(BaseModel, PipelineChild):
 
         # Get Backend
         backend = DataFrameBackends.from_df(df0)
+        if backend not in [DataFrameBackends.POLARS, DataFrameBackends.PYSPARK]:
+            raise NotImplementedError(f"Backend '{backend}' is not supported.")
+        context.backend = backend
 
-        if backend == DataFrameBackends.POLARS:
-            import polars as pl
-
-            #
-            # kwargs = {"df": df}
-            # for source in self.data_sources:
-            #     kwargs[f"nodes__{source.node.name}"] = source.read()
-            # return pl.SQLContext(frames=dfs).execute(";".join(self.parsed_expr()))
-
-            # Because Polars don't support {} in frame names, we use
-            # double underscores (__) instead
-            _dfs = {}
-            for k, v in dfs.items():
-                _k = "{" + k + "}"
-                _dfs[to_safe_expr(_k, df_names=[k])] = v
+        # Register frames
+        context.register(dfs)
 
+        if backend == DataFrameBackends.POLARS:
             expr = to_safe_expr(self.expr, df_names=list(dfs.keys()))
-
-            df = pl.SQLContext(frames=_dfs).execute(expr)
+            df = context.sql_context.execute(expr)
             return nw.from_native(df)
 
-        elif backend == DataFrameBackends.PYSPARK:
-            _spark = df0.sparkSession
-
-            # Create views
-            # TODO: Using parametrized queries would be ideal, but it is not compatible
-            #       with older versions of spark or Delta Live Tables.
-            # Because PySpark does not support view names with {}, we replaced them
-            # with double underscores (__)
-            for k, _df in dfs.items():
-                _k = "{" + k + "}"
-                _df.createOrReplaceTempView(to_safe_expr(_k, df_names=[k]))
-
-            # Run query
-            _df = None
-            for expr in self.expr.split(";"):
-                if expr.replace("\n", " ").strip() == "":
-                    continue
-                _df = _spark.sql(to_safe_expr(expr, df_names=list(dfs.keys())))
-            if _df is None:
-                raise ValueError(f"SQL Expression '{self.expr}' is invalid")
-            return nw.from_native(_df)
-
-        else:
-            raise NotImplementedError(f"Backend '{backend}' is not supported.")
+        # Run query
+        _spark = df0.sparkSession
+        _df = None
+        for expr in self.expr.split(";"):
+            if expr.replace("\n", " ").strip() == "":
+                continue
+            _df = _spark.sql(
+                to_safe_expr(
+                    expr, df_names=list(dfs.keys()), suffix=context.view_suffix
+                )
+            )
+        if _df is None:
+            raise ValueError(f"SQL Expression '{self.expr}' is invalid")
+        return nw.from_native(_df)
@@ -5,6 +5,7 @@ from pydantic import Field
 from laktory._logger import get_logger
 from laktory.models.basemodel import BaseModel
 from laktory.models.dataframe.dataframeexpr import DataFrameExpr
+from laktory.models.dataframe.dataframeexpr import DataFrameExprContext
 from laktory.models.dataframe.dataframemethod import DataFrameMethod
 from laktory.models.pipelinechild import PipelineChild
 from laktory.typing import AnyFrame
@@ -119,7 +120,8 @@ class DataFrameTransformer(BaseModel, PipelineChild):
 
     def execute(self, df, named_dfs=None) -> AnyFrame:
         """
-        Execute transformation nodes on provided DataFrame `df`
+        Execute transformation nodes on provided DataFrame `df`. SQL nodes share
+        a single SQL context and upstream nodes are only read once.
 
         Parameters
         ----------
@@ -137,6 +139,9 @@ class DataFrameTransformer(BaseModel, PipelineChild):
         if named_dfs is None:
             named_dfs = {}
 
+        # SQL context shared by all SQL expressions
+        context = DataFrameExprContext()
+
         for inode, node in enumerate(self.nodes):
             tnode = type(node)
             logger.info(
@@ -150,7 +155,7 @@ class DataFrameTransformer(BaseModel, PipelineChild):
                 if df is not None:
                     dfs["df"] = df
                 dfs = dfs | named_dfs
-                df = node.to_df(dfs)
+                df = node.to_df(dfs, context=context)
             else:
                 raise NotImplementedError()
 
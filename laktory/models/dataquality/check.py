@@ -66,3 +66,25 @@ class DataQualityCheck(BaseModel):
             return None
 
         return self.fails_count / self.rows_count
+
+    # ----------------------------------------------------------------------- #
+    # Operators                                                               #
+    # ----------------------------------------------------------------------- #
+
+    def __add__(self, other: "DataQualityCheck") -> "DataQualityCheck":
+        """
+        Combine checks of two datasets, typically successive micro-batches of a
+        stream. Counts are summed and the combined check fails if any of the
+        checks failed.
+        """
+        kwargs = {"status": "PASS"}
+        if "FAIL" in [self.status, other.status]:
+            kwargs["status"] = "FAIL"
+
+        for k in ["fails_count", "rows_count"]:
+            v0 = getattr(self, k)
+            v1 = getattr(other, k)
+            if v0 is not None or v1 is not None:
+                kwargs[k] = (v0 or 0) + (v1 or 0)
+
+        return DataQualityCheck(**kwargs)
@@ -303,12 +303,7 @@ class DataQualityExpectation(BaseModel, PipelineChild):
         rows_count = df.shape[0]
 
         if rows_count == 0:
-            _check = DataQualityCheck(
-                fails_count=0,
-                status="PASS",
-                rows_count=0,
-            )
-            return _check
+            return self._build_check(rows_count=0)
 
         if self.type == "ROW":
             try:
@@ -320,7 +315,36 @@ class DataQualityExpectation(BaseModel, PipelineChild):
                     e.desc += f"\n{self.type_warning_msg}"
                 raise e
 
-            fails_count = df_fail.shape[0]
+            return self._build_check(rows_count=rows_count, value=df_fail.shape[0])
+
+        if self.type == "AGGREGATE":
+            _df = df.select(self.expr.to_expr()).to_pandas()
+            #
+            # import pyspark.sql.functions as F  # noqa: F401
+            #
+            # if self.expr.type == "SQL":
+            #     _df = df.select(self.expr.eval()).toPandas()
+            # else:
+            #     _df = df.agg(self.expr.eval()).toPandas()
+
+            return self._build_check(rows_count=rows_count, value=_df.iloc[0].values[0])
+
+    def _build_check(self, rows_count: int, value: Any = None) -> DataQualityCheck:
+        """
+        Build check from the rows count and the computed value, which is the
+        number of failing rows for a `"ROW"` expectation and the (boolean)
+        result of the expression for an `"AGGREGATE"` expectation.
+        """
+        if rows_count == 0:
+            _check = DataQualityCheck(
+                fails_count=0,
+                status="PASS",
+                rows_count=0,
+            )
+            return _check
+
+        if self.type == "ROW":
+            fails_count = int(value or 0)
 
             status = "PASS"
             if self.tolerance.abs is not None:
@@ -345,18 +369,7 @@ class DataQualityExpectation(BaseModel, PipelineChild):
             return _check
 
         if self.type == "AGGREGATE":
-            _df = df.select(self.expr.to_expr()).to_pandas()
-            #
-            # import pyspark.sql.functions as F  # noqa: F401
-            #
-            # if self.expr.type == "SQL":
-            #     _df = df.select(self.expr.eval()).toPandas()
-            # else:
-            #     _df = df.agg(self.expr.eval()).toPandas()
-
-            status = _df.iloc[0].values[0]
-
-            status = "PASS" if status else "FAIL"
+            status = "PASS" if value else "FAIL"
 
             _check = DataQualityCheck(
                 status=status,
@@ -385,3 +398,74 @@ class DataQualityExpectation(BaseModel, PipelineChild):
         else:
             # actions: WARN, DROP, QUARANTINE
             warnings.warn(msg)
+
+
+def run_checks(
+    expectations: list[DataQualityExpectation],
+    df: AnyFrame,
+    raise_or_warn: bool = False,
+    node=None,
+) -> list[DataQualityCheck]:
+    """
+    Check multiple expectations against a DataFrame in a single pass. The rows
+    count, the failing rows count of each `"ROW"` expectation and the result of
+    each `"AGGREGATE"` expectation are computed in a single `select`, so that
+    only scalar values are collected.
+
+    If the fused evaluation is not supported (e.g. an expression using window
+    functions), expectations are checked individually.
+
+    Parameters
+    ----------
+    expectations:
+        Expectations to check
+    df:
+        Input DataFrame for checking the expectations.
+    raise_or_warn:
+        Raise exception or issue warning if an expectation is not met.
+    node:
+        Pipeline Node
+
+    Returns
+    -------
+    output: list[DataQualityCheck]
+        Checks results, in the same order as the expectations.
+    """
+    if not expectations:
+        return []
+
+    logger.info(f"Checking expectations {[e.name for e in expectations]}")
+
+    exprs = [nw.len().alias("__rows_count")]
+    for i, e in enumerate(expectations):
+        if e.type == "ROW":
+            expr = e.fail_filter.cast(nw.Int64).sum()
+        else:
+            expr = e.expr.to_expr()
+        exprs += [expr.alias(f"__expectation_{i}")]
+
+    try:
+        _df = df.select(*exprs)
+        if isinstance(_df, nw.LazyFrame):
+            if DataFrameBackends(_df.implementation) == DataFrameBackends.PYSPARK:
+                # Using the pandas backend to avoid pyarrow version compatibility issues
+                _df = _df.collect(backend="pandas")
+            else:
+                _df = _df.collect()
+        values = _df.row(0)
+    except Exception as e:
+        logger.info(f"Fused expectations check failed ({e}). Checking individually.")
+        return [
+            _e.run_check(df, raise_or_warn=raise_or_warn, node=node)
+            for _e in expectations
+        ]
+
+    rows_count = int(values[0])
+    for e, value in zip(expectations, values[1:]):
+        e._check = e._build_check(rows_count=rows_count, value=value)
+
+    if raise_or_warn:
+        for e in expectations:
+            e.raise_or_warn(node)
+
+    return [e.check for e in expectations]
@@ -0,0 +1,109 @@
+from collections import defaultdict
+
+# XXH64 primes
+_P1 = 11400714785074694791
+_P2 = 14029467366897019727
+_P3 = 1609587929392839161
+_P4 = 9650029242287828579
+_P5 = 2870177450012600261
+
+# Seed used by Spark `xxhash64` function
+SPARK_SEED = 42
+
+
+def xxhash64(values: list[str | None], seed: int = SPARK_SEED) -> list[int | None]:
+    """
+    64-bit xxHash (XXH64) of the UTF-8 encoding of each string, returned as
+    signed integers. With the default seed, values are identical to Spark
+    `xxhash64` function applied to a string column.
+
+    Strings of the same length share the same control flow and are hashed
+    together with vectorized numpy operations.
+
+    Parameters
+    ----------
+    values:
+        Strings to hash. `None` values are returned as `None`.
+    seed:
+        Hash seed
+
+    Returns
+    -------
+    :
+        Signed 64-bit hashes
+    """
+    import numpy as np
+
+    u64 = np.uint64
+    p1, p2, p3, p4, p5 = u64(_P1), u64(_P2), u64(_P3), u64(_P4), u64(_P5)
+    seed = u64(seed % 2**64)
+
+    def rotl(x, r):
+        return (x << u64(r)) | (x >> u64(64 - r))
+
+    def round_(acc, lane):
+        return rotl(acc + lane * p2, 31) * p1
+
+    def merge_round(acc, val):
+        return (acc ^ round_(u64(0), val)) * p1 + p4
+
+    def lanes(data, start, stop, dtype):
+        return np.ascontiguousarray(data[:, start:stop]).view(dtype)
+
+    # Group rows by encoded length
+    groups = defaultdict(list)
+    encoded = [None if v is None else v.encode("utf-8") for v in values]
+    for i, b in enumerate(encoded):
+        if b is not None:
+            groups[len(b)].append(i)
+
+    hashes = [None] * len(values)
+    with np.errstate(over="ignore"):
+        for n, rows in groups.items():
+            k = len(rows)
+            data = np.frombuffer(b"".join(encoded[i] for i in rows), dtype=np.uint8)
+            data = data.reshape(k, n)
+
+            # 32-byte stripes
+            offset = n - n % 32
+            if n >= 32:
+                v = [
+                    np.full(k, seed + p1 + p2, dtype=u64),
+                    np.full(k, seed + p2, dtype=u64),
+                    np.full(k, seed, dtype=u64),
+                    np.full(k, seed - p1, dtype=u64),
+                ]
+                stripes = lanes(data, 0, offset, "<u8").astype(u64)
+                for j in range(0, stripes.shape[1], 4):
+                    for m in range(4):
+                        v[m] = round_(v[m], stripes[:, j + m])
+                h = rotl(v[0], 1) + rotl(v[1], 7) + rotl(v[2], 12) + rotl(v[3], 18)
+                for m in range(4):
+                    h = merge_round(h, v[m])
+            else:
+                h = np.full(k, seed + p5, dtype=u64)
+            h = h + u64(n)
+
+            # Remaining 8-byte, 4-byte and single byte lanes
+            while offset + 8 <= n:
+                lane = lanes(data, offset, offset + 8, "<u8").astype(u64)[:, 0]
+                h = rotl(h ^ round_(u64(0), lane), 27) * p1 + p4
+                offset += 8
+            if offset + 4 <= n:
+                lane = lanes(data, offset, offset + 4, "<u4").astype(u64)[:, 0]
+                h = rotl(h ^ (lane * p1), 23) * p2 + p3
+                offset += 4
+            while offset < n:
+                lane = data[:, offset].astype(u64)
+                h = rotl(h ^ (lane * p5), 11) * p1
+                offset += 1
+
+            # Avalanche
+            h = (h ^ (h >> u64(33))) * p2
+            h = (h ^ (h >> u64(29))) * p3
+            h = h ^ (h >> u64(32))
+
+            for i, _h in zip(rows, h.view(np.int64).tolist()):
+                hashes[i] = _h
+
+    return hashes
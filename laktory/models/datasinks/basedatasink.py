@@ -39,6 +39,12 @@ SPARK_MODES = [
 SPARK_STREAMING_MODES = ["APPEND", "COMPLETE", "UPDATE"] + LAKTORY_MODES
 POLARS_DELTA_MODES = ["ERROR", "APPEND", "OVERWRITE"] + LAKTORY_MODES
 SUPPORTED_MODES = tuple(set(SPARK_MODES + SPARK_STREAMING_MODES + POLARS_DELTA_MODES))
+# Static write mode equivalent to streaming write mode for micro-batches
+SPARK_MICRO_BATCH_MODES = {
+    "APPEND": "APPEND",
+    "COMPLETE": "OVERWRITE",
+    "MERGE": "MERGE",
+}
 
 
 class BaseDataSink(BaseModel, PipelineChild):
@@ -119,6 +125,8 @@ class BaseDataSink(BaseModel, PipelineChild):
         ),
     )
 
+    _micro_batch_id: int = None
+
     @field_validator("custom_writer", mode="before")
     @classmethod
     def coerce_custom_writer(cls, v):
@@ -441,6 +449,57 @@ class BaseDataSink(BaseModel, PipelineChild):
 
         logger.info("Write completed.")
 
+    @property
+    def supports_micro_batch(self) -> bool:
+        """
+        Sink can write micro-batches of a Spark streaming DataFrame from a
+        `foreachBatch` function.
+        """
+        if getattr(self, "table_type", None) == "VIEW":
+            return False
+        return bool(self.custom_writer) or self.mode in SPARK_MICRO_BATCH_MODES
+
+    @property
+    def is_micro_batch_idempotent(self) -> bool:
+        """
+        `True` if writing the same micro-batch twice is a no-op, as for DELTA
+        (non-merge) writes made idempotent with the batch id.
+        """
+        return (
+            not self.custom_writer
+            and self.mode != "MERGE"
+            and getattr(self, "format", None) == "DELTA"
+        )
+
+    def write_micro_batch(self, df: AnyFrame, batch_id: int) -> None:
+        """
+        Write a micro-batch of a Spark streaming DataFrame, typically from a
+        `foreachBatch` function. The sink streaming mode is converted to its
+        static equivalent and DELTA writes are made idempotent using the batch
+        id so that a replayed micro-batch is not written twice.
+
+        Parameters
+        ----------
+        df:
+            Micro-batch (static) dataframe.
+        batch_id:
+            Micro-batch id
+        """
+        if not self.supports_micro_batch:
+            raise ValueError(
+                f"Mode '{self.mode}' is not supported for micro-batch writes. Choose from {list(SPARK_MICRO_BATCH_MODES)}"
+            )
+
+        mode = None
+        if not self.custom_writer:
+            mode = SPARK_MICRO_BATCH_MODES[self.mode]
+
+        self._micro_batch_id = batch_id
+        try:
+            self.write(df=df, mode=mode)
+        finally:
+            self._micro_batch_id = None
+
     def _write_spark_view(self, view_definition) -> None:
         raise NotImplementedError(
             f"View creation with spark is not implemented for type '{type(self)}'"
@@ -482,6 +541,10 @@ class BaseDataSink(BaseModel, PipelineChild):
                 self.metadata._update_required = True
         if is_streaming:
             kwargs["checkpointLocation"] = self.checkpoint_path.as_posix()
+        elif self._micro_batch_id is not None and fmt == "delta":
+            # Idempotent writes of streaming micro-batches
+            kwargs["txnAppId"] = self._uuid
+            kwargs["txnVersion"] = self._micro_batch_id
 
         if fmt in ["jsonl", "ndjson"]:
             fmt = "json"
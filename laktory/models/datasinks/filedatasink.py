@@ -44,6 +44,15 @@ SUPPORTED_FORMATS = {
 
 ALL_SUPPORTED_FORMATS = tuple(sorted(set().union(*SUPPORTED_FORMATS.values())))
 
+# Polars formats that can be written from a LazyFrame with the streaming engine
+POLARS_SINK_METHODS = {
+    "CSV": "sink_csv",
+    "IPC": "sink_ipc",
+    "JSONL": "sink_ndjson",
+    "NDJSON": "sink_ndjson",
+    "PARQUET": "sink_parquet",
+}
+
 logger = get_logger(__name__)
 
 
@@ -229,13 +238,21 @@ class FileDataSink(BaseDataSink):
 
         df = df.to_native()
 
-        is_streaming = False
+        sink_method = self._get_polars_sink_method(df)
+        is_streaming = sink_method is not None
 
         _mode = "streaming" if is_streaming else "static"
         logger.info(
             f"Writing {_mode} df to {self.path} with format '{self.format}' and {kwargs}"
         )
 
+        if is_streaming:
+            # Out-of-core write: the frame is never fully materialized
+            getattr(df, sink_method)(
+                self.path, engine="streaming", **self.writer_kwargs
+            )
+            return
+
         if isinstance(df, pl.LazyFrame):
             df = df.collect()
 
@@ -263,6 +280,34 @@ class FileDataSink(BaseDataSink):
                 kwargs[k] = v
             ds.write_dataset(data=df.to_arrow(), base_dir=self.path, **kwargs)
 
+    def _get_polars_sink_method(self, df) -> str | None:
+        """
+        Name of the LazyFrame `sink_*` method used to stream `df` to disk or
+        `None` if the write requires a collected DataFrame. Writer kwargs not
+        supported by the sink method (e.g. `use_pyarrow` or `partition_by`)
+        fall back to a collected write.
+        """
+        import inspect
+
+        import polars as pl
+
+        if not isinstance(df, pl.LazyFrame):
+            return None
+
+        method = POLARS_SINK_METHODS.get(self.format)
+        if method is None:
+            return None
+
+        params = inspect.signature(getattr(pl.LazyFrame, method)).parameters
+        unsupported = [k for k in self.writer_kwargs if k not in params]
+        if unsupported:
+            logger.info(
+                f"Writer kwargs {unsupported} not supported by LazyFrame.{method}. DataFrame will be collected before writing."
+            )
+            return None
+
+        return method
+
     # ----------------------------------------------------------------------- #
     # Purge                                                                   #
     # ----------------------------------------------------------------------- #
@@ -1,3 +1,5 @@
+import time
+from contextlib import contextmanager
 from typing import Any
 from typing import Literal
 
@@ -11,7 +13,22 @@ from laktory.typing import AnyFrame
 
 logger = get_logger(__name__)
 
-SUPPORTED_BACKENDS = [DataFrameBackends.PYSPARK]
+SUPPORTED_BACKENDS = [DataFrameBackends.PYSPARK, DataFrameBackends.POLARS]
+
+
+def _unqualify_columns(expr: str, table: str) -> str:
+    """
+    Remove `table` qualifier from the columns of Spark SQL expression `expr`,
+    leaving literals and other identifiers untouched.
+    """
+    import sqlglot
+    from sqlglot import expressions
+
+    parsed = sqlglot.parse_one(expr, read="spark")
+    for c in parsed.find_all(expressions.Column):
+        if c.table.lower() == table:
+            c.set("table", None)
+    return parsed.sql()
 
 
 class DataSinkMergeCDCOptions(BaseModel):
@@ -21,6 +38,11 @@ class DataSinkMergeCDCOptions(BaseModel):
     They are also used to build the target using `apply_changes` method when
     using Databricks DLT.
 
+    Merge is supported with both Spark (using `delta-spark`) and Polars (using
+    `delta-rs`) DataFrame backends. With Polars, the source DataFrame is kept
+    lazy until the merge is executed and the target is only available as a
+    DELTA path.
+
     Examples
     --------
     ```py
@@ -68,6 +90,16 @@ class DataSinkMergeCDCOptions(BaseModel):
     exclude_columns: list[str] = Field(
         None, description="A subset of columns to exclude in the target table."
     )
+    hash_type: Literal["SHA256", "INT64"] = Field(
+        "SHA256",
+        description="""
+        When using SCD type 2, type of the hash of the update columns stored in the target and used to detect changes.
+        `SHA256` stores a hexadecimal string digest. `INT64` stores a 64-bit integer hash (`xxhash64` with seed 42,
+        as Spark `xxhash64` function) which is smaller to store and cheaper to compare and, with Polars, computed with
+        vectorized operations instead of hashing each row with `hashlib`. Both hash types produce the same values with
+        Spark and Polars. Changing the hash type of an existing target requires a full refresh.
+        """,
+    )
     ignore_null_updates: bool = Field(
         False,
         description="""
@@ -113,6 +145,7 @@ class DataSinkMergeCDCOptions(BaseModel):
     _parent: Any = None
     _source_schema: Any = None
     _source_columns: list[str] = None
+    _metrics: dict[str, float] = None
 
     @model_validator(mode="after")
     def validate_scd_type(self) -> Any:
@@ -157,10 +190,18 @@ class DataSinkMergeCDCOptions(BaseModel):
 
     @property
     def target_path(self):
+        from laktory.enums import DataFrameBackends
         from laktory.models.datasinks.filedatasink import FileDataSink
+        from laktory.models.datasinks.tabledatasink import TableDataSink
 
         if self._parent and isinstance(self._parent, FileDataSink):
             return self._parent.path
+        if (
+            self._parent
+            and isinstance(self._parent, TableDataSink)
+            and self._parent.dataframe_backend == DataFrameBackends.POLARS
+        ):
+            return self._parent.local_path
         return None
 
     @property
@@ -191,9 +232,13 @@ class DataSinkMergeCDCOptions(BaseModel):
     def hash_cols(self):
         return "__hash_cols"
 
+    @property
+    def staged_insert(self):
+        return "__staged_insert"
+
     @property
     def source_columns(self):
-        return [f.name for f in self._source_schema]
+        return self._source_columns
 
     @property
     def update_columns(self):
@@ -218,6 +263,9 @@ class DataSinkMergeCDCOptions(BaseModel):
 
     @property
     def index_type(self):
+        if isinstance(self._source_schema, dict):
+            # Polars schema
+            return self._source_schema[self.index]
         return [
             field.dataType
             for field in self._source_schema.fields
@@ -228,6 +276,18 @@ class DataSinkMergeCDCOptions(BaseModel):
     def source_delete_where(self):
         return self._add_alias(self.delete_where)
 
+    @property
+    def metrics(self) -> dict[str, float]:
+        """
+        Duration, in seconds, of each step of the last merge execution:
+
+        - `changes`: detection of the new and changed rows (SCD type 2 with
+          Polars only, Spark evaluates it lazily as part of the merge)
+        - `merge`: execution of the merge
+        - `total`: complete execution
+        """
+        return dict(self._metrics or {})
+
     # ----------------------------------------------------------------------- #
     # Methods                                                                 #
     # ----------------------------------------------------------------------- #
@@ -283,6 +343,22 @@ class DataSinkMergeCDCOptions(BaseModel):
 
         return new_expr
 
+    @staticmethod
+    def _quote(column: str, prefix: str = None) -> str:
+        """Quote column name for delta-rs (DataFusion) SQL expressions"""
+        column = f"`{column}`"
+        if prefix:
+            column = f"{prefix}.{column}"
+        return column
+
+    @contextmanager
+    def _measure(self, step: str):
+        """Record the duration of merge step `step` in metrics"""
+        t0 = time.perf_counter()
+        yield
+        self._metrics[step] = time.perf_counter() - t0
+        logger.info(f"Merge step '{step}' completed in {self._metrics[step]:.3f} s")
+
     def _init_target(self, source):
         import pyspark.sql.types as T
 
@@ -290,7 +366,8 @@ class DataSinkMergeCDCOptions(BaseModel):
         logger.info(f"Merge target not found. Creating empty table at {self.target_id}")
         schema = source.select(self.primary_keys + self.update_columns).schema
         if self.scd_type == 2:
-            schema.add(T.StructField(self.hash_cols, T.StringType(), True))
+            hash_type = T.LongType() if self.hash_type == "INT64" else T.StringType()
+            schema.add(T.StructField(self.hash_cols, hash_type, True))
             schema.add(T.StructField(self.start_at, self.index_type, True))
             schema.add(T.StructField(self.end_at, self.index_type, True))
 
@@ -304,6 +381,20 @@ class DataSinkMergeCDCOptions(BaseModel):
         else:
             writer.saveAsTable(self.target_name)
 
+    def _init_target_polars(self, source):
+        import polars as pl
+
+        logger.info(f"Merge target not found. Creating empty table at {self.target_id}")
+        schema = source.select(self.primary_keys + self.update_columns).collect_schema()
+        if self.scd_type == 2:
+            schema[self.hash_cols] = (
+                pl.Int64() if self.hash_type == "INT64" else pl.String()
+            )
+            schema[self.start_at] = self.index_type
+            schema[self.end_at] = self.index_type
+
+        pl.DataFrame(schema=schema).write_delta(self.target_path, mode="overwrite")
+
     def _execute(self, source: AnyFrame):
         import pyspark.sql.functions as F
         from delta.tables import DeltaTable
@@ -320,13 +411,15 @@ class DataSinkMergeCDCOptions(BaseModel):
 
         # Add internal columns
         if self.scd_type == 2:
+            hash_col = F.concat_ws("~", *self.update_columns)
+            if self.hash_type == "INT64":
+                hash_col = F.xxhash64(hash_col)
+            else:
+                hash_col = F.sha2(hash_col, 256)
             source = (
                 source.withColumn(self.start_at, F.col(self.index))
                 .withColumn(self.end_at, F.lit(None).cast(self.index_type))
-                .withColumn(
-                    self.hash_cols,
-                    F.lit(F.sha2(F.concat_ws("~", *self.update_columns), 256)),
-                )
+                .withColumn(self.hash_cols, hash_col)
             )
 
         # Process History
@@ -341,9 +434,7 @@ class DataSinkMergeCDCOptions(BaseModel):
                 source = source.filter(F.col("_row_number") == 1)
             elif self.scd_type == 2:
                 # Assign previous index to ends_at
-                w2 = Window.partitionBy(*self.primary_keys)
                 source = source.withColumn(self.end_at, F.lag(self.index, 1).over(w))
-                source = source.withColumn(self.index_fist, F.min(self.index).over(w2))
             source = source.drop("_row_number")
         else:
             logger.info(f"Dropping duplicates using {self.primary_keys}")
@@ -405,77 +496,288 @@ class DataSinkMergeCDCOptions(BaseModel):
                 merge = merge.whenMatchedDelete(condition=delete_condition)
 
             logger.info("Executing merge...")
-            merge.execute()
+            with self._measure("merge"):
+                merge.execute()
 
         elif self.scd_type == 2:
-            if self.delete_where:
-                delete_condition = F.coalesce(F.expr(self.delete_where), F.lit(False))
-                not_delete_condition = ~delete_condition
+            current_hash = "__current_hash"
+            current_start_at = "__current_start_at"
 
-            # Only select rows that have been updated
+            # Current target rows only
             if self.target_path:
                 target = spark.read.format("delta").load(self.target_path)
             else:
                 target = spark.read.table(self.target_name)
+            target = target.filter(F.col(self.end_at).isNull()).select(
+                *self.primary_keys,
+                F.col(self.hash_cols).alias(current_hash),
+                F.col(self.start_at).alias(current_start_at),
+            )
+
+            # Only select rows that have been updated and that are not older
+            # than the current record of their key
+            if self.delete_where:
+                delete_condition = F.coalesce(F.expr(self.delete_where), F.lit(False))
+                source = source.withColumn("__to_delete", delete_condition)
+            unchanged = F.col(self.hash_cols) == F.col(current_hash)
+            if self.delete_where:
+                unchanged = unchanged & ~F.col("__to_delete")
+            outdated = F.col(self.index) < F.col(current_start_at)
+            w2 = Window.partitionBy(*self.primary_keys)
+            upsert_or_delete = (
+                source.join(target, on=self.primary_keys, how="left")
+                .filter(~F.coalesce(unchanged | outdated, F.lit(False)))
+                .drop(current_hash, current_start_at)
+                .withColumn(self.index_fist, F.min(self.index).over(w2))
+            )
 
-            _source = source
-            _target = target
-            _on = [self.hash_cols] + self.primary_keys
+            # Stage rows to insert (never matched) with the latest row of
+            # each key (matched to expire the current record)
+            upsert = upsert_or_delete
             if self.delete_where:
-                _source = source.withColumn("__to_delete", delete_condition)
-                _target = target.withColumn("__to_delete", F.lit(False))
-                _on += ["__to_delete"]
-
-            upsert_or_delete = _source.join(
-                other=_target,
-                on=_on,
-                how="leftanti",
+                upsert = upsert.filter(~F.col("__to_delete"))
+            staged_source = upsert.withColumn(
+                self.staged_insert, F.lit(True)
+            ).unionByName(
+                upsert_or_delete.filter(F.col(self.end_at).isNull()).withColumn(
+                    self.staged_insert, F.lit(False)
+                )
             )
 
             # Merge
-            conditions = []
-            condition = F.expr(f"target.{self.end_at} IS NULL")
+            condition = F.expr(
+                f"NOT source.{self.staged_insert} AND target.{self.end_at} IS NULL"
+            )
             for c in self.primary_keys:
                 condition = condition & F.expr(f"source.{c} = target.{c}")
             merge = table_target.alias("target").merge(
-                upsert_or_delete.filter(F.col(self.end_at).isNull()).alias("source"),
+                staged_source.alias("source"),
                 condition=condition,
             )
 
             # Expire the current record
             _set = {f"target.{self.end_at}": f"source.{self.index_fist}"}
             merge = merge.whenMatchedUpdate(set=_set)
-            #
-            # # TODO: Review if required
-            # if not self.delete_where:
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set)
-            # else:
-            #     where = F.expr(self.source_delete_where)
-            #     # deleting
-            #     # _set = {f"target.{self.end_at}": "NULL"}
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set, condition=where)
-            #
-            #     # updating
-            #     _set = {f"target.{self.end_at}": f"source.{self.order_by}"}
-            #     merge = merge.whenMatchedUpdate(set=_set, condition=~where)
+
+            # Insert new rows
+            merge = merge.whenNotMatchedInsert(
+                values={f"target.{c}": f"source.{c}" for c in self.write_columns},
+                condition=f"source.{self.staged_insert}",
+            )
 
             logger.info("Executing merge...")
-            merge.execute()
+            with self._measure("merge"):
+                merge.execute()
+
+        else:
+            raise ValueError(f"SCD Type {self.scd_type} is not supported.")
+
+    def _execute_polars(self, source: AnyFrame):
+        import hashlib
+
+        import polars as pl
+
+        from laktory.models.datasinks._xxhash import xxhash64
+
+        logger.info(
+            f"Executing merge on {self.target_id} with primary keys {self.primary_keys} and scd type {self.scd_type}"
+        )
 
-            # Append rows
+        q = self._quote
+        to_delete = "__to_delete"
+
+        # Add delete flag
+        if self.delete_where:
+            logger.info(f"with delete on {self.delete_where}")
+            source = source.with_columns(
+                pl.sql_expr(_unqualify_columns(self.delete_where, "source"))
+                .fill_null(False)
+                .alias(to_delete)
+            )
+
+        # Add internal columns
+        if self.scd_type == 2:
+            hash_col = pl.concat_str(
+                [pl.col(c).cast(pl.String) for c in self.update_columns],
+                separator="~",
+                ignore_nulls=True,
+            )
+            # Polars native hash is not stable across versions. Hashes are
+            # computed for each batch of rows, identical to Spark values.
+            if self.hash_type == "INT64":
+                hash_col = hash_col.map_batches(
+                    lambda s: pl.Series(xxhash64(s.to_list()), dtype=pl.Int64),
+                    return_dtype=pl.Int64,
+                )
+            else:
+                hash_col = hash_col.map_batches(
+                    lambda s: pl.Series(
+                        [
+                            None
+                            if v is None
+                            else hashlib.sha256(v.encode()).hexdigest()
+                            for v in s.to_list()
+                        ],
+                        dtype=pl.String,
+                    ),
+                    return_dtype=pl.String,
+                )
+            source = source.with_columns(
+                pl.col(self.index).alias(self.start_at),
+                pl.lit(None, dtype=self.index_type).alias(self.end_at),
+                hash_col.alias(self.hash_cols),
+            )
+
+        # Process History
+        if self.index:
+            source = source.sort(self.index, descending=True)
+            if self.scd_type == 1:
+                # Drop Duplicates
+                logger.info(
+                    f"Dropping duplicates using {self.primary_keys} and '{self.order_by}' as sequencing index"
+                )
+                source = source.unique(
+                    subset=self.primary_keys, keep="first", maintain_order=True
+                )
+            elif self.scd_type == 2:
+                # Assign previous index to ends_at
+                source = source.with_columns(
+                    pl.col(self.index)
+                    .shift(1)
+                    .over(self.primary_keys)
+                    .alias(self.end_at),
+                )
+        else:
+            logger.info(f"Dropping duplicates using {self.primary_keys}")
+            source = source.unique(subset=self.primary_keys, keep="any")
+
+        merge_options = {
+            "predicate": " AND ".join(
+                [f"{q(c, 'target')} = {q(c, 'source')}" for c in self.primary_keys]
+            ),
+            "source_alias": "source",
+            "target_alias": "target",
+        }
+
+        if self.scd_type == 1:
+            delete_condition = None
+            not_delete_condition = None
+            if self.delete_where:
+                delete_condition = q(to_delete, "source")
+                not_delete_condition = f"NOT {delete_condition}"
+
+            # Define merge
+            logger.info("Collecting merge source...")
+            merge = source.collect().write_delta(
+                self.target_path, mode="merge", delta_merge_options=merge_options
+            )
+
+            # Update
+            _set = {q(c): q(c, "source") for c in self.update_columns}
+            if self.ignore_null_updates:
+                _set = {
+                    q(c): f"COALESCE({q(c, 'source')}, {q(c, 'target')})"
+                    for c in self.update_columns
+                }
+
+            conditions = []
+            if self.delete_where:
+                conditions += [not_delete_condition]
+            if self.order_by:
+                conditions += [f"{q(self.index, 'source')} > {q(self.index, 'target')}"]
+            condition = " AND ".join(conditions) if conditions else None
+
+            merge = merge.when_matched_update(updates=_set, predicate=condition)
+
+            # Insert
+            merge = merge.when_not_matched_insert(
+                updates={q(c): q(c, "source") for c in self.write_columns},
+                predicate=not_delete_condition,
+            )
+
+            # Delete
+            if self.delete_where:
+                merge = merge.when_matched_delete(predicate=delete_condition)
+
+            logger.info("Executing merge...")
+            with self._measure("merge"):
+                merge.execute()
+
+        elif self.scd_type == 2:
+            current_hash = "__current_hash"
+            current_start_at = "__current_start_at"
+
+            # Current target rows only
+            target = (
+                pl.scan_delta(self.target_path)
+                .filter(pl.col(self.end_at).is_null())
+                .select(
+                    self.primary_keys
+                    + [
+                        pl.col(self.hash_cols).alias(current_hash),
+                        pl.col(self.start_at).alias(current_start_at),
+                    ]
+                )
+            )
+
+            # Only select rows that have been updated and that are not older
+            # than the current record of their key
+            unchanged = pl.col(self.hash_cols) == pl.col(current_hash)
+            if self.delete_where:
+                unchanged = unchanged & ~pl.col(to_delete)
+            outdated = pl.col(self.index) < pl.col(current_start_at)
+            upsert_or_delete = (
+                source.join(target, on=self.primary_keys, how="left")
+                .filter(~(unchanged | outdated).fill_null(False))
+                .drop(current_hash, current_start_at)
+                .with_columns(
+                    pl.col(self.index)
+                    .min()
+                    .over(self.primary_keys)
+                    .alias(self.index_fist),
+                )
+            )
+
+            # Stage rows to insert (never matched) with the latest row of each
+            # key (matched to expire the current record)
             upsert = upsert_or_delete
             if self.delete_where:
-                upsert = upsert.filter(not_delete_condition)
-            writer = (
-                upsert.select(self.write_columns).write.mode("APPEND").format("DELTA")
+                upsert = upsert.filter(~pl.col(to_delete))
+            staged_source = pl.concat(
+                [
+                    upsert.with_columns(pl.lit(True).alias(self.staged_insert)),
+                    upsert_or_delete.filter(pl.col(self.end_at).is_null()).with_columns(
+                        pl.lit(False).alias(self.staged_insert)
+                    ),
+                ]
+            )
+
+            logger.info("Collecting merge source...")
+            with self._measure("changes"):
+                staged_source = staged_source.collect()
+
+            # Merge
+            merge_options["predicate"] = (
+                f"NOT {q(self.staged_insert, 'source')} AND {q(self.end_at, 'target')} IS NULL AND "
+                + merge_options["predicate"]
+            )
+            merge = staged_source.write_delta(
+                self.target_path, mode="merge", delta_merge_options=merge_options
+            )
+
+            # Expire the current record
+            _set = {q(self.end_at): q(self.index_fist, "source")}
+            merge = merge.when_matched_update(updates=_set)
+
+            # Insert new rows
+            merge = merge.when_not_matched_insert(
+                updates={q(c): q(c, "source") for c in self.write_columns},
+                predicate=q(self.staged_insert, "source"),
             )
-            logger.info("Appending new rows...")
-            if self.target_path:
-                writer.save(self.target_path)
-            else:
-                writer.saveAsTable(self.target_name)
+
+            logger.info("Executing merge...")
+            with self._measure("merge"):
+                merge.execute()
 
         else:
             raise ValueError(f"SCD Type {self.scd_type} is not supported.")
@@ -497,10 +799,34 @@ class DataSinkMergeCDCOptions(BaseModel):
             )
 
         source = source.to_native()
+        self._metrics = {}
+
+        if dataframe_backend == DataFrameBackends.POLARS:
+            import polars as pl
+            from deltalake import DeltaTable
+
+            if self.target_path is None:
+                raise NotImplementedError(
+                    f"Merge into table '{self.target_name}' is not supported with {dataframe_backend} backend. Use a DELTA file sink instead."
+                )
+
+            if isinstance(source, pl.DataFrame):
+                source = source.lazy()
+
+            self._source_schema = source.collect_schema()
+            self._source_columns = self._source_schema.names()
+
+            if not DeltaTable.is_deltatable(str(self.target_path)):
+                self._init_target_polars(source)
+
+            with self._measure("total"):
+                self._execute_polars(source=source)
+            return
 
         from delta.tables import DeltaTable
 
         self._source_schema = source.schema
+        self._source_columns = source.columns
         spark = source.sparkSession
 
         if self.target_path:
@@ -512,26 +838,29 @@ class DataSinkMergeCDCOptions(BaseModel):
             except Exception:
                 self._init_target(source)
 
-        if source.isStreaming:
-            if self.sink is None:
-                raise ValueError("Sink value required to fetch checkpoint location.")
-
-            if self.sink and self.sink.checkpoint_path is None:
-                raise ValueError(
-                    f"Checkpoint location not specified for sink '{self.sink}'"
-                )
-
-            query = (
-                source.writeStream.foreachBatch(
-                    lambda batch_df, batch_id: self._execute(source=batch_df)
+        with self._measure("total"):
+            if source.isStreaming:
+                if self.sink is None:
+                    raise ValueError(
+                        "Sink value required to fetch checkpoint location."
+                    )
+
+                if self.sink and self.sink.checkpoint_path is None:
+                    raise ValueError(
+                        f"Checkpoint location not specified for sink '{self.sink}'"
+                    )
+
+                query = (
+                    source.writeStream.foreachBatch(
+                        lambda batch_df, batch_id: self._execute(source=batch_df)
+                    )
+                    .trigger(availableNow=True)
+                    .options(
+                        checkpointLocation=self.sink.checkpoint_path,
+                    )
+                    .start()
                 )
-                .trigger(availableNow=True)
-                .options(
-                    checkpointLocation=self.sink.checkpoint_path,
-                )
-                .start()
-            )
-            query.awaitTermination()
+                query.awaitTermination()
 
-        else:
-            self._execute(source=source)
+            else:
+                self._execute(source=source)
@@ -10,6 +10,7 @@ from pydantic import model_validator
 
 from laktory._logger import get_logger
 from laktory.enums import DataFrameBackends
+from laktory.models.datasinks.basedatasink import POLARS_DELTA_MODES
 from laktory.models.datasinks.basedatasink import BaseDataSink
 from laktory.models.datasinks.tabledatasinkmetadata import TableDataSinkMetadata
 from laktory.models.datasources.tabledatasource import TableDataSource
@@ -100,6 +101,43 @@ class TableDataSink(BaseDataSink):
     def _id(self) -> str:
         return self.full_name
 
+    @property
+    def local_path(self) -> str:
+        """
+        Location of the table data in the local catalog, used with Polars
+        backend. When the table is not registered yet, location at which it
+        will be registered: `path` of `writer_kwargs` for an external table
+        or catalog managed location.
+        """
+        from laktory.localcatalog import get_local_catalog
+
+        return get_local_catalog().get_table_path(
+            self.full_name, path=self.writer_kwargs.get("path", None)
+        )
+
+    def _register_local_table(self) -> None:
+        """
+        Register table in the local catalog, as an external table when a
+        `path` is specified in `writer_kwargs`.
+        """
+        from laktory.localcatalog import get_local_catalog
+
+        get_local_catalog().create_table(
+            self.full_name,
+            format=self.format,
+            path=self.writer_kwargs.get("path", None),
+        )
+
+    def _get_local_sink(self):
+        from laktory.models.datasinks.filedatasink import FileDataSink
+
+        return FileDataSink(
+            path=self.local_path,
+            format=self.format,
+            writer_kwargs={k: v for k, v in self.writer_kwargs.items() if k != "path"},
+            dataframe_backend=self.dataframe_backend,
+        )
+
     # ----------------------------------------------------------------------- #
     # Children                                                                #
     # ----------------------------------------------------------------------- #
@@ -128,11 +166,13 @@ class TableDataSink(BaseDataSink):
             logger.info("Table is view. Skipping.")
             return False
 
+        if df is not None:
+            self._update_backend_from_df(df)
+
         if self.exists():
             logger.info("Table exists. Skipping.")
             return False
 
-        self._update_backend_from_df(df)
         schema = self._get_create_schema(df)
 
         if schema is None:
@@ -155,6 +195,13 @@ class TableDataSink(BaseDataSink):
                 **kwargs
             ).saveAsTable(self.full_name)
 
+        elif self.dataframe_backend == DataFrameBackends.POLARS:
+            import polars as pl
+
+            self._validate_format()
+            self._register_local_table()
+            pl.DataFrame(schema=schema).write_delta(self.local_path, mode="overwrite")
+
         else:
             raise NotImplementedError(
                 f"Table Data Sink for '{self.dataframe_backend}' is not yet supported."
@@ -168,6 +215,40 @@ class TableDataSink(BaseDataSink):
     # Write                                                                   #
     # ----------------------------------------------------------------------- #
 
+    def write(
+        self,
+        df: Any = None,
+        view_definition: str = None,
+        mode: str = None,
+    ) -> None:
+        super().write(df=df, view_definition=view_definition, mode=mode)
+
+        # Tables written with Polars (including MERGE) are registered in the
+        # local catalog once their data exists at `local_path`
+        if (
+            self.dataframe_backend == DataFrameBackends.POLARS
+            and self.table_type != "VIEW"
+            and not self.custom_writer
+        ):
+            self._register_local_table()
+
+    def _validate_format(self) -> None:
+        if self.dataframe_backend == DataFrameBackends.POLARS:
+            if self.format != "DELTA":
+                raise ValueError(
+                    f"'{self.format}' format is not supported for table with {self.dataframe_backend}. Use 'DELTA'."
+                )
+
+    def _validate_mode_polars(self, mode, df):
+        if mode not in POLARS_DELTA_MODES:
+            raise ValueError(
+                f"Mode '{mode}' is not supported for Polars DataFrame with table sink. Set to {POLARS_DELTA_MODES}"
+            )
+
+    def _write_polars(self, df, mode) -> None:
+        logger.info(f"Writing df to local table {self.full_name}")
+        self._get_local_sink()._write_polars(df=df, mode=mode)
+
     def _write_spark(self, df, mode) -> None:
         df = df.to_native()
 
@@ -220,6 +301,11 @@ class TableDataSink(BaseDataSink):
 
             return spark.catalog.tableExists(self.full_name)
 
+        elif self.dataframe_backend == DataFrameBackends.POLARS:
+            from laktory.localcatalog import get_local_catalog
+
+            return get_local_catalog().table_exists(self.full_name)
+
         else:
             raise NotImplementedError()
 
@@ -254,6 +340,21 @@ class TableDataSink(BaseDataSink):
             # Remove Checkpoint
             self._purge_checkpoint()
 
+        elif self.dataframe_backend == DataFrameBackends.POLARS:
+            from laktory.localcatalog import get_local_catalog
+
+            # Remove Data
+            logger.info(f"Dropping local table {self.full_name}")
+            get_local_catalog().drop_table(self.full_name)
+
+            path = self.writer_kwargs.get("path", None)
+            if path and os.path.exists(path):
+                logger.info(f"Deleting data dir {path}")
+                shutil.rmtree(path)
+
+            # Remove Checkpoint
+            self._purge_checkpoint()
+
         else:
             raise TypeError(
                 f"DataFrame backend {self.dataframe_backend} is not supported."
@@ -1,4 +1,7 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
+from typing import TYPE_CHECKING
 
 from pydantic import Field
 
@@ -6,6 +9,9 @@ from laktory._logger import get_logger
 from laktory.models.basemodel import BaseModel
 from laktory.models.pipelinechild import PipelineChild
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 # TBLPROPERTY key used to track which properties are managed by Laktory.
@@ -19,34 +25,93 @@ _LAKTORY_MANAGED_KEY = "laktory.managedProperties"
 #     not_null: bool = None
 
 
-def set_tags(object, full_name, current, new, is_uc):
-    from laktory import get_spark_session
-
-    spark = get_spark_session()
-
+def _quote(value: str | None) -> str:
+    if value is None:
+        value = ""
+    return "'" + value.replace("'", "\\'") + "'"
+
+
+def get_tags_statements(
+    object: str,
+    full_name: str,
+    current: dict,
+    new: dict,
+    is_uc: bool,
+    table_type: str = "TABLE",
+) -> list[str]:
+    """
+    SQL statements required to update tags of a table or a column from
+    `current` to `new` state. Changed and removed tags are unset with a single
+    statement and new and changed tags are set with a single statement.
+
+    Parameters
+    ----------
+    object:
+        Object type (`TABLE` or `COLUMN`)
+    full_name:
+        Object full name. For columns, `{table_full_name}.{column_name}`.
+    current:
+        Current tags
+    new:
+        Expected tags
+    is_uc:
+        Unity Catalog object. Tags are not supported otherwise.
+    table_type:
+        Type of the table (or of the column table). Tags of tables, views and
+        table columns are updated with `ALTER` statements supporting multiple
+        tags. Other tags (streaming tables, materialized views and view
+        columns) are updated one at a time.
+
+    Returns
+    -------
+    :
+        SQL statements
+    """
     if not is_uc:
-        logger.info("Tags are only supported on Unity Catalog. Skipping.")
-        return
+        if new or current:
+            logger.info("Tags are only supported on Unity Catalog. Skipping.")
+        return []
 
-    # Apply new tags
+    to_unset = []
+    to_set = {}
     for k, v in new.items():
         v0 = current.get(k, "__lk_undefined__")
         if v != v0:
             logger.info(f"Setting {object} '{full_name}' tag `{k}` to '{v}'")
             if k in current.keys():
                 # Tags can't be overwritten. They need to be unset first.
-                spark.sql(f"""UNSET TAG ON {object} {full_name} `{k}`""")
-
-            if v is not None:
-                spark.sql(f"""SET TAG ON {object} {full_name} `{k}` = `{v}`""")
-            else:
-                spark.sql(f"""SET TAG ON {object} {full_name} `{k}`""")
+                to_unset += [k]
+            to_set[k] = v
 
-    # Remove old tags
     for k in current.keys():
         if k not in new:
             logger.info(f"Unsetting {object} '{full_name}' tag `{k}`")
-            spark.sql(f"""UNSET TAG ON {object} {full_name} `{k}`""")
+            to_unset += [k]
+
+    statements = []
+    if table_type == "TABLE" or (table_type == "VIEW" and object == "TABLE"):
+        if object == "COLUMN":
+            table_full_name, column_name = full_name.rsplit(".", 1)
+            alter = f"ALTER {table_type} {table_full_name} ALTER COLUMN {column_name}"
+        else:
+            alter = f"ALTER {table_type} {full_name}"
+        if to_unset:
+            keys = ", ".join(_quote(k) for k in to_unset)
+            statements += [f"{alter} UNSET TAGS ({keys})"]
+        if to_set:
+            tags = ", ".join(f"{_quote(k)} = {_quote(v)}" for k, v in to_set.items())
+            statements += [f"{alter} SET TAGS ({tags})"]
+        return statements
+
+    for k in to_unset:
+        statements += [f"UNSET TAG ON {object} {full_name} `{k}`"]
+    for k, v in to_set.items():
+        if v is not None:
+            statements += [f"SET TAG ON {object} {full_name} `{k}` = `{v}`"]
+        else:
+            statements += [f"SET TAG ON {object} {full_name} `{k}`"]
+
+    return statements
 
 
 class ColumnMetadata(BaseModel):
@@ -62,16 +127,30 @@ class ColumnMetadata(BaseModel):
             return ""
         return "'" + self.comment.replace("'", "\\'") + "'"
 
-    def execute(self, current, table_meta):
-        from laktory import get_spark_session
-
-        spark = get_spark_session()
-
+    def get_statements(self, current, table_meta) -> list[str]:
+        """
+        SQL statements required to update column metadata from `current`
+        state.
+
+        Parameters
+        ----------
+        current:
+            Current column metadata
+        table_meta:
+            Table metadata
+
+        Returns
+        -------
+        :
+            SQL statements
+        """
         table_full_name = table_meta.table_full_name
         column_full_name = f"{table_full_name}.{self.name}"
         is_uc = table_meta.is_uc
         table_type = table_meta.table_type
 
+        statements = []
+
         # Comment
         if self.comment != current.comment:
             logger.info(
@@ -79,36 +158,46 @@ class ColumnMetadata(BaseModel):
             )
             if is_uc:
                 if table_type == "STREAMING_TABLE":
-                    spark.sql(
+                    statements += [
                         f"""ALTER STREAMING TABLE {table_full_name} ALTER COLUMN {self.name} COMMENT {self.comment_str}"""
-                    )
+                    ]
                 else:
-                    spark.sql(
+                    statements += [
                         f"""COMMENT ON COLUMN {column_full_name} IS {self.comment_str}"""
-                    )
+                    ]
             else:
                 if table_type == "VIEW":
                     raise ValueError(
                         f"Column comments are not supported for VIEW {type(table_meta.table)}"
                     )
                 if self.comment:
-                    spark.sql(
+                    statements += [
                         f"""ALTER {table_type} {table_full_name} CHANGE COLUMN {self.name} {self.name} {current._type} COMMENT {self.comment_str}"""
-                    )
+                    ]
                 else:
-                    spark.sql(
+                    statements += [
                         f"""ALTER {table_type} {table_full_name} CHANGE COLUMN {self.name} {self.name} {current._type}"""
-                    )
+                    ]
 
         # Tags
-        set_tags(
+        statements += get_tags_statements(
             object="COLUMN",
             full_name=column_full_name,
             current=current.tags,
             new=self.tags,
             is_uc=is_uc,
+            table_type=table_type,
         )
 
+        return statements
+
+    def execute(self, current, table_meta):
+        from laktory import get_spark_session
+
+        spark = get_spark_session()
+        for statement in self.get_statements(current, table_meta):
+            spark.sql(statement)
+
 
 class TableDataSinkMetadata(BaseModel, PipelineChild):
     columns: list[ColumnMetadata] | None = Field([], description="Columns Metadata.")
@@ -156,25 +245,30 @@ class TableDataSinkMetadata(BaseModel, PipelineChild):
     def update_required(self):
         return self._update_required
 
-    def execute(self):
-        from laktory import get_spark_session
+    def get_statements(self, current: "TableDataSinkMetadata") -> list[str]:
+        """
+        SQL statements required to update table metadata from `current` state.
+        Table properties are set and unset with a single statement each.
 
-        spark = get_spark_session()
+        Parameters
+        ----------
+        current:
+            Current table metadata
 
-        # Invalidate cached state so each execute() sees the current table state
-        try:
-            del self.current
-        except AttributeError:
-            pass
-
-        table = self.parent
-        table_full_name = table.full_name
-        self._table_type = self.current._table_type
+        Returns
+        -------
+        :
+            SQL statements
+        """
+        table_full_name = self.table_full_name
+        self._table_type = current._table_type
 
         logger.info(f"Processing table '{table_full_name}' of type '{self.table_type}'")
 
+        statements = []
+
         # Comment
-        if self.comment != self.current.comment:
+        if self.comment != current.comment:
             if self.table_type == "STREAMING_TABLE":
                 logger.info(
                     f"Table '{table_full_name}' is a STREAMING_TABLE. Comment can't be updated. Skipping."
@@ -185,32 +279,32 @@ class TableDataSinkMetadata(BaseModel, PipelineChild):
                     f"Setting table '{table_full_name}' comment to {self.comment_str}"
                 )
                 if self.is_uc:
-                    spark.sql(
+                    statements += [
                         f"""COMMENT ON TABLE {table_full_name} IS {self.comment_str}"""
-                    )
+                    ]
                 else:
-                    spark.sql(
+                    statements += [
                         f"""ALTER TABLE {table_full_name} SET TBLPROPERTIES(comment = {self.comment_str});"""
-                    )
+                    ]
 
         # Columns
-        for current in self.current.columns:
+        for _current in current.columns:
             new_found = False
             for new in self.columns:
-                if new.name == current.name:
+                if new.name == _current.name:
                     new_found = True
                     break
             if not new_found:
-                new = ColumnMetadata(name=current.name)
+                new = ColumnMetadata(name=_current.name)
 
-            new.execute(current, table_meta=self)
+            statements += new.get_statements(_current, table_meta=self)
 
         # Owner
-        if self.owner and self.owner != self.current.owner:
+        if self.owner and self.owner != current.owner:
             logger.info(f"Setting table '{table_full_name}' owner to '{self.owner}'")
-            spark.sql(
+            statements += [
                 f"""ALTER {self.table_type} {table_full_name} SET OWNER TO `{self.owner}`"""
-            )
+            ]
 
         # Options
         # https://docs.databricks.com/aws/en/sql/language-manual/sql-ref-syntax-ddl-tblproperties#options
@@ -223,7 +317,7 @@ class TableDataSinkMetadata(BaseModel, PipelineChild):
         # are ever unset — system properties are never touched.
         previously_managed = set(
             k.strip()
-            for k in self.current.properties.get(_LAKTORY_MANAGED_KEY, "").split("|")
+            for k in current.properties.get(_LAKTORY_MANAGED_KEY, "").split("|")
             if k.strip()
         )
         currently_managed = set(self.properties.keys()) if self.properties else set()
@@ -239,32 +333,61 @@ class TableDataSinkMetadata(BaseModel, PipelineChild):
             logger.info(
                 f"Setting table '{table_full_name}' properties to ({props_string})"
             )
-            spark.sql(
+            statements += [
                 f"""ALTER TABLE {table_full_name} SET TBLPROPERTIES({props_string});"""
-            )
+            ]
 
         # Unset only previously-managed keys that are no longer in config
         to_unset = previously_managed - currently_managed
         if not currently_managed and previously_managed:
             to_unset.add(_LAKTORY_MANAGED_KEY)
         if to_unset:
-            props_string = ",".join(to_unset)
+            props_string = ",".join(sorted(to_unset))
             logger.info(
                 f"Unsetting table '{table_full_name}' properties ({props_string})"
             )
-            spark.sql(
+            statements += [
                 f"""ALTER TABLE {table_full_name} UNSET TBLPROPERTIES IF EXISTS ({props_string});"""
-            )
+            ]
 
         # Tags
-        set_tags(
+        statements += get_tags_statements(
             object="TABLE",
             full_name=table_full_name,
-            current=self.current.tags,
+            current=current.tags,
             new=self.tags,
             is_uc=self.is_uc,
+            table_type=self.table_type,
         )
 
+        return statements
+
+    def execute(self, current: "TableDataSinkMetadata" = None):
+        """
+        Update table metadata.
+
+        Parameters
+        ----------
+        current:
+            Current table metadata. If `None`, it is fetched from the table.
+            Used by `update_tables_metadata` to provide metadata fetched in
+            batch.
+        """
+        from laktory import get_spark_session
+
+        spark = get_spark_session()
+
+        # Invalidate cached state so each execute() sees the current table state
+        try:
+            del self.current
+        except AttributeError:
+            pass
+        if current is not None:
+            self.__dict__["current"] = current
+
+        for statement in self.get_statements(self.current):
+            spark.sql(statement)
+
         self._update_required = False
 
     def get_current(self):
@@ -364,3 +487,162 @@ class TableDataSinkMetadata(BaseModel, PipelineChild):
         )
         meta._table_type = _table_type
         return meta
+
+
+# --------------------------------------------------------------------------- #
+# Batch                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def _map(func: Callable, items: list, max_workers: int | None) -> list:
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="laktory-metadata"
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+def get_uc_current(
+    metadatas: list[TableDataSinkMetadata], max_workers: int | None = 8
+) -> dict[str, TableDataSinkMetadata]:
+    """
+    Fetch current metadata of multiple Unity Catalog tables. Table type,
+    owner, comment, columns and tags are read from `information_schema` views
+    with a single query per view. Table properties are not available in
+    `information_schema` and are read with `SHOW TBLPROPERTIES` concurrently.
+
+    Parameters
+    ----------
+    metadatas:
+        Tables metadata. Tables not in Unity Catalog or without catalog and
+        schema names are ignored.
+    max_workers:
+        Maximum number of concurrent `SHOW TBLPROPERTIES` queries.
+
+    Returns
+    -------
+    :
+        Current metadata for each table found, by table full name
+    """
+    from laktory import get_spark_session
+
+    tables = {}
+    for m in metadatas:
+        table = m.table
+        if not m.is_uc or None in [
+            table.catalog_name,
+            table.schema_name,
+            table.table_name,
+        ]:
+            continue
+        tables[m.table_full_name.lower()] = m
+
+    if not tables:
+        return {}
+
+    spark = get_spark_session()
+    names = ", ".join(_quote(name) for name in tables)
+    catalogs = ", ".join(
+        _quote(c)
+        for c in dict.fromkeys(m.table.catalog_name.lower() for m in tables.values())
+    )
+    schemas = ", ".join(
+        _quote(s)
+        for s in dict.fromkeys(m.table.schema_name.lower() for m in tables.values())
+    )
+    logger.info(f"Fetching current metadata for {len(tables)} tables")
+
+    def _read(view: str, catalog: str, schema: str) -> "pd.DataFrame":
+        # Catalog and schema predicates on the view columns (Unity Catalog
+        # names are lower case) allow pruning before the full name filter.
+        key = f"lower(concat_ws('.', {catalog}, {schema}, table_name))"
+        df = spark.sql(
+            f"SELECT *, {key} AS _full_name FROM system.information_schema.{view} "
+            f"WHERE {catalog} IN ({catalogs}) AND {schema} IN ({schemas}) "
+            f"AND {key} IN ({names})"
+        ).toPandas()
+        return df.fillna("")
+
+    currents = {}
+
+    # Tables
+    for _, row in _read("tables", "table_catalog", "table_schema").iterrows():
+        meta = TableDataSinkMetadata(
+            owner=row["table_owner"] or None,
+            comment=row["comment"] or None,
+        )
+        meta._table_type = row["table_type"]
+        currents[row["_full_name"]] = meta
+
+    # Columns
+    columns = {k: [] for k in currents}
+    df = _read("columns", "table_catalog", "table_schema").sort_values(
+        ["_full_name", "ordinal_position"]
+    )
+    for _, row in df.iterrows():
+        if row["_full_name"] not in columns:
+            continue
+        col = ColumnMetadata(name=row["column_name"], comment=row["comment"] or None)
+        col._type = row["full_data_type"]
+        columns[row["_full_name"]] += [col]
+    for k, v in columns.items():
+        currents[k].columns = v
+
+    # Column tags
+    for _, row in _read("column_tags", "catalog_name", "schema_name").iterrows():
+        meta = currents.get(row["_full_name"])
+        if meta is None:
+            continue
+        for col in meta.columns:
+            if col.name == row["column_name"]:
+                col.tags[row["tag_name"]] = row["tag_value"] or None
+
+    # Table tags
+    for _, row in _read("table_tags", "catalog_name", "schema_name").iterrows():
+        meta = currents.get(row["_full_name"])
+        if meta is None:
+            continue
+        meta.tags[row["tag_name"]] = row["tag_value"] or None
+
+    # Properties
+    def _get_properties(full_name):
+        df = spark.sql(f"SHOW TBLPROPERTIES {tables[full_name].table_full_name}")
+        return {row["key"]: row["value"] for row in df.collect()}
+
+    full_names = list(currents.keys())
+    for full_name, properties in zip(
+        full_names, _map(_get_properties, full_names, max_workers)
+    ):
+        currents[full_name].properties = properties
+
+    return {tables[k].table_full_name: v for k, v in currents.items()}
+
+
+def update_tables_metadata(
+    metadatas: list[TableDataSinkMetadata], max_workers: int | None = 8
+) -> None:
+    """
+    Update metadata of multiple tables. Current metadata of Unity Catalog
+    tables is fetched in batch (see `get_uc_current`) and tables are updated
+    concurrently. Statements of a given table are executed sequentially.
+
+    Parameters
+    ----------
+    metadatas:
+        Tables metadata
+    max_workers:
+        Maximum number of tables updated concurrently. If `None` or `1`,
+        tables are updated sequentially.
+    """
+    metadatas = [m for m in metadatas if m is not None]
+    if not metadatas:
+        return
+
+    currents = get_uc_current(metadatas, max_workers=max_workers)
+
+    def _execute(meta):
+        meta.execute(current=currents.get(meta.table_full_name))
+
+    _map(_execute, metadatas, max_workers)
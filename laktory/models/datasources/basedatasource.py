@@ -72,6 +72,8 @@ class BaseDataSource(BaseModel, PipelineChild):
     type: Literal["CUSTOM", "DATAFRAME", "FILE", "UNITY_CATALOG", "HIVE_METASTORE"] = (
         Field(..., description="Name of the data source type")
     )
+    _pushed_columns: list[str] = None
+    _pushed_filter: str = None
 
     @model_validator(mode="after")
     def options(self) -> Any:
@@ -98,6 +100,19 @@ class BaseDataSource(BaseModel, PipelineChild):
     def _id(self):
         raise NotImplementedError()
 
+    def get_fingerprint(self) -> str | None:
+        """
+        Fingerprint of the data currently available from the source, used to
+        skip the execution of pipeline nodes whose inputs have not changed.
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if it can't be determined, in which case
+            the consuming node is always executed.
+        """
+        return None
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -147,6 +162,15 @@ class BaseDataSource(BaseModel, PipelineChild):
         )
 
     def _post_read(self, df: AnyFrame) -> AnyFrame:
+        # Columns required by downstream nodes
+        if self._pushed_columns is not None:
+            pushed_columns = set(self._pushed_columns)
+            columns = [c for c in df.columns if c in pushed_columns]
+            pruned = [c for c in df.columns if c not in pushed_columns]
+            if pruned:
+                logger.info(f"Pruning columns {pruned} from source {self._id}")
+                df = df.select(columns)
+
         # Apply filter
         if self.filter:
             df = df.filter(sql_expr(self.filter))
@@ -187,6 +211,10 @@ class BaseDataSource(BaseModel, PipelineChild):
 
             df = df.unique(subset=subset)
 
+        # Rows required by downstream nodes
+        if self._pushed_filter:
+            df = df.filter(sql_expr(self._pushed_filter))
+
         # Sample
         # TODO: Enable when Narwhals support sampling on LazyFrame
         # if self.sample:
@@ -1,3 +1,5 @@
+import glob
+import hashlib
 import os
 from pathlib import Path
 from typing import Any
@@ -51,6 +53,13 @@ SUPPORTED_FORMATS = {
 
 ALL_SUPPORTED_FORMATS = tuple(sorted(set().union(*SUPPORTED_FORMATS.values())))
 
+# Polars formats without a lazy scan function and their file extensions
+POLARS_EAGER_FORMATS = {
+    "avro": ("read_avro", [".avro"]),
+    "excel": ("read_excel", [".xls", ".xlsm", ".xlsx"]),
+    "json": ("read_json", [".json"]),
+}
+
 
 class FileDataSource(BaseDataSource):
     """
@@ -185,6 +194,43 @@ class FileDataSource(BaseDataSource):
     def serialize_path(self, value: Path) -> str:
         return value.as_posix()
 
+    def get_fingerprint(self) -> str | None:
+        """
+        Fingerprint of the data currently available from the source. For
+        DELTA format, the table version is used. For other formats, the
+        listing (path, size and modification time) of the source files is
+        used. Only sources available on the local (or mounted) file system
+        are supported.
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if it can't be determined.
+        """
+        path = Path(self.path)
+        if not path.exists():
+            return None
+
+        if self.format == "DELTA":
+            try:
+                from deltalake import DeltaTable
+
+                return f"delta:{DeltaTable(self.path).version()}"
+            except Exception:
+                path = path / "_delta_log"
+
+        if path.is_file():
+            filepaths = [path]
+        else:
+            filepaths = sorted(p for p in path.rglob("*") if p.is_file())
+
+        h = hashlib.sha256()
+        for filepath in filepaths:
+            stat = filepath.stat()
+            h.update(f"{filepath}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+
+        return f"files:{h.hexdigest()}"
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -353,6 +399,142 @@ class FileDataSource(BaseDataSource):
 
         return kwargs, fmt
 
+    def _get_polars_filepaths(
+        self, extensions: list[str]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Expand source path (file, directory or glob pattern) into a list of
+        files and their hive partitions values (`{key}={value}` directories).
+        """
+        path = str(self.path)
+
+        if glob.has_magic(path):
+            filepaths = sorted(glob.glob(path, recursive=True))
+            root = path
+            while glob.has_magic(root):
+                root = os.path.dirname(root)
+        elif os.path.isdir(path):
+            filepaths = sorted(str(p) for p in Path(path).rglob("*"))
+            root = path
+        else:
+            return [(path, {})]
+
+        files = []
+        for filepath in filepaths:
+            _path = Path(filepath)
+            if not _path.is_file() or _path.suffix.lower() not in extensions:
+                continue
+            if _path.name.startswith((".", "_")):
+                continue
+
+            partitions = {}
+            for part in _path.relative_to(root).parent.parts:
+                if "=" in part:
+                    k, v = part.split("=", 1)
+                    partitions[k] = _parse_partition_value(v)
+            files += [(filepath, partitions)]
+
+        return files
+
+    def _prune_partitions(
+        self, files: list[tuple[str, dict[str, Any]]]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Remove files whose hive partitions values do not meet the source
+        filter or the filter pushed by downstream nodes. Only filter conjuncts referencing partition columns
+        exclusively are evaluated. No file is opened.
+        """
+        import polars as pl
+        import sqlglot
+        from sqlglot import expressions
+
+        from laktory.narwhals_ext.functions import sql_expr
+
+        partition_names = set()
+        for _, partitions in files:
+            partition_names.update(partitions.keys())
+
+        source_filters = [self.filter]
+        if not (self.selects or self.renames or self.drop_duplicates):
+            # Filter pushed by downstream nodes applies to the same columns
+            source_filters += [self._pushed_filter]
+        source_filters = [f for f in source_filters if f]
+
+        if not source_filters or not partition_names:
+            return files
+
+        try:
+            conjuncts = []
+            for f in source_filters:
+                expr = sqlglot.parse_one(f)
+                if isinstance(expr, expressions.And):
+                    conjuncts += list(expr.flatten())
+                else:
+                    conjuncts += [expr]
+            filters = []
+            for c in conjuncts:
+                names = {col.name for col in c.find_all(expressions.Column)}
+                if names and names.issubset(partition_names):
+                    filters += [c.sql()]
+            if not filters:
+                return files
+
+            df = nw.from_native(
+                pl.DataFrame(
+                    [{**p, "__file_index": i} for i, (_, p) in enumerate(files)]
+                )
+            )
+            for f in filters:
+                df = df.filter(sql_expr(f))
+            indices = set(df["__file_index"].to_list())
+
+        except Exception as e:
+            logger.info(
+                f"Partitions could not be pruned with filter '{self.filter}': {e}"
+            )
+            return files
+
+        logger.info(
+            f"Partitions pruned with filter {filters}: {len(indices)} / {len(files)} files selected"
+        )
+        return [f for i, f in enumerate(files) if i in indices]
+
+    def _read_polars_eager(self, fmt: str, kwargs: dict[str, Any]) -> Any:
+        """
+        Read formats not supported by Polars lazy scans. Source files are
+        read concurrently in a thread pool and concatenated lazily so that
+        the source filter and selects are pushed down to each file frame.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        import polars as pl
+
+        method, extensions = POLARS_EAGER_FORMATS[fmt]
+        reader = getattr(pl, method)
+
+        files = self._get_polars_filepaths(extensions)
+        files = self._prune_partitions(files)
+        if not files:
+            raise FileNotFoundError(f"No {fmt} file found at {self.path}")
+
+        def _read(file):
+            filepath, partitions = file
+            df = reader(filepath, **kwargs)
+            if partitions:
+                df = df.with_columns(
+                    [pl.lit(v).alias(k) for k, v in partitions.items()]
+                )
+            return df.lazy()
+
+        if len(files) == 1:
+            return _read(files[0])
+
+        logger.info(f"Reading {len(files)} {fmt} files")
+        with ThreadPoolExecutor(thread_name_prefix="laktory-read") as executor:
+            dfs = list(executor.map(_read, files))
+
+        return pl.concat(dfs, how="diagonal_relaxed")
+
     def _read_polars(self) -> nw.LazyFrame:
         import polars as pl
 
@@ -360,8 +542,8 @@ class FileDataSource(BaseDataSource):
 
         logger.info(f"Reading {self.path} with format '{fmt}' and {kwargs}")
 
-        if fmt == "avro":
-            df = pl.read_avro(self.path, **kwargs).lazy()
+        if fmt in POLARS_EAGER_FORMATS:
+            df = self._read_polars_eager(fmt, kwargs)
 
         elif fmt == "csv":
             df = pl.scan_csv(self.path, **kwargs)
@@ -369,18 +551,12 @@ class FileDataSource(BaseDataSource):
         elif fmt == "delta":
             df = pl.scan_delta(self.path, **kwargs)
 
-        elif fmt == "excel":
-            df = pl.read_excel(self.path, **kwargs).lazy()
-
         elif fmt == "ipc":
             df = pl.scan_ipc(self.path, **kwargs)
 
         elif fmt == "iceberg":
             df = pl.scan_iceberg(self.path, **kwargs)
 
-        elif fmt == "json":
-            df = pl.read_json(self.path, **kwargs).lazy()
-
         elif fmt in ["ndjson", "jsonl"]:
             df = pl.scan_ndjson(self.path, **kwargs)
 
@@ -390,10 +566,24 @@ class FileDataSource(BaseDataSource):
         elif fmt == "pyarrow":
             import pyarrow.dataset as ds
 
-            dset = ds.dataset(self.path, format="parquet")
-            return pl.scan_pyarrow_dataset(dset, **kwargs)
+            dset = ds.dataset(
+                self.path,
+                format=kwargs.pop("format", "parquet"),
+                partitioning=kwargs.pop("partitioning", "hive"),
+            )
+            df = pl.scan_pyarrow_dataset(dset, **kwargs)
 
         else:
             raise ValueError(f"Format {fmt} is not supported.")
 
         return nw.from_native(df)
+
+
+def _parse_partition_value(value: str) -> Any:
+    """Cast hive partition value to int or float when possible"""
+    for _type in [int, float]:
+        try:
+            return _type(value)
+        except ValueError:
+            pass
+    return value
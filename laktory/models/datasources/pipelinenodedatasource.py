@@ -1,5 +1,7 @@
+import threading
 from typing import Any
 
+import narwhals as nw
 from pydantic import Field
 
 from laktory._logger import get_logger
@@ -9,6 +11,10 @@ from laktory.typing import AnyFrame
 
 logger = get_logger(__name__)
 
+# Polars frames can't be borrowed from multiple threads at once. Downstream
+# nodes executed concurrently read their own clone of the upstream output.
+_clone_lock = threading.Lock()
+
 
 class PipelineNodeDataSource(BaseDataSource):
     """
@@ -87,12 +93,28 @@ class PipelineNodeDataSource(BaseDataSource):
         if pl is None:
             raise ValueError(f"Source '{self.node_name}' is not attached to a pipeline")
 
-        if self.node_name not in pl.sorted_node_names:
+        node = pl.nodes_dict.get(self.node_name)
+        if node is None:
             raise ValueError(
                 f"Node '{self.node_name}' does not exists in pipeline '{pl.name}'"
             )
 
-        return pl.nodes_dict[self.node_name]
+        return node
+
+    @property
+    def _is_implicit(self) -> bool:
+        """
+        `True` if the upstream node has no sinks and is executed through the
+        pipeline execution plan, which executes it only once even when read
+        concurrently by several downstream nodes.
+        """
+        pl = self.parent_pipeline
+        return (
+            pl is not None
+            and pl._plan is not None
+            and pl._plan._implicit_executed is not None
+            and not self.node.has_sinks
+        )
 
     @property
     def sink_table_full_name(self):
@@ -140,6 +162,10 @@ class PipelineNodeDataSource(BaseDataSource):
                 logger.info(f"Reading pipeline node {self._id} with DLT as static")
                 df = dlt.read(self.node.primary_sink.dlt_table_or_view_name)
 
+        # Execute upstream node
+        elif self._is_implicit:
+            df = pl._plan.execute_implicit_node(self.node_name)
+
         elif stream_to_batch or self.node.output_df is None:
             if self.node.has_sinks:
                 logger.info(f"Reading pipeline node {self._id} from primary sink")
@@ -163,10 +189,17 @@ class PipelineNodeDataSource(BaseDataSource):
         return df
 
     def _read_polars(self) -> AnyFrame:
+        # Execute upstream node
+        if self._is_implicit:
+            df = self.parent_pipeline._plan.execute_implicit_node(self.node_name)
+            with _clone_lock:
+                df = nw.from_native(nw.to_native(df).clone())
+
         # Read from node output DataFrame (if available)
-        if self.node.output_df is not None:
+        elif self.node.output_df is not None:
             logger.info(f"Reading pipeline node {self._id} from output DataFrame")
-            df = self.node.output_df
+            with _clone_lock:
+                df = nw.from_native(nw.to_native(self.node.output_df).clone())
 
         # Read from node sink
         elif self.node.primary_sink:
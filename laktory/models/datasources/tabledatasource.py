@@ -144,3 +144,22 @@ class TableDataSource(BaseDataSource):
         df = reader.table(self.full_name)
 
         return nw.from_native(df)
+
+    def _read_polars(self, **kwargs) -> nw.LazyFrame:
+        import polars as pl
+
+        from laktory.localcatalog import get_local_catalog
+
+        catalog = get_local_catalog()
+        table = catalog.get_table(self.full_name)
+        if table is None:
+            raise ValueError(
+                f"Table '{self.full_name}' not found in local catalog {catalog.root}"
+            )
+
+        logger.info(
+            f"Reading {self._id} from local catalog at {table['path']} with {self.reader_kwargs}"
+        )
+        df = pl.scan_delta(table["path"], **self.reader_kwargs)
+
+        return nw.from_native(df)
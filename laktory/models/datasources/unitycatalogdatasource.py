@@ -1,6 +1,5 @@
 from typing import Literal
 
-from narwhals import LazyFrame
 from pydantic import Field
 
 from laktory._logger import get_logger
@@ -43,18 +42,3 @@ class UnityCatalogDataSource(TableDataSource):
     type: Literal["UNITY_CATALOG"] = Field(
         "UNITY_CATALOG", frozen=True, description="Source Type"
     )
-
-    # ----------------------------------------------------------------------- #
-    # Properties                                                              #
-    # ----------------------------------------------------------------------- #
-
-    # ----------------------------------------------------------------------- #
-    # Readers                                                                 #
-    # ----------------------------------------------------------------------- #
-
-    def _read_polars(self) -> LazyFrame:
-        # TODO
-        # https://docs.pola.rs/api/python/stable/reference/catalog/api/polars.Catalog.scan_table.html#polars.Catalog.scan_table
-        raise NotImplementedError(
-            "Unity Catalog data source is not yet implemented for Polars"
-        )
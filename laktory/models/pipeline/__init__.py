@@ -1,7 +1,11 @@
+# Job tasks entry points (`laktory.models.pipeline._execute()`)
+from ._execute import _execute
+from ._post_execute import _post_execute
 from .orchestrators.airfloworchestrator import AirflowOrchestrator
 from .orchestrators.databricksjoborchestrator import DatabricksJobOrchestrator
 from .orchestrators.databrickspipelineorchestrator import DatabricksPipelineOrchestrator
 from .pipeline import Pipeline
 from .pipeline import PipelineNode
 from .pipelineexecutionplan import PipelineExecutionPlan
+from .pipelinenodecacheoptions import PipelineNodeCacheOptions
 from .pipelinetask import PipelineTask
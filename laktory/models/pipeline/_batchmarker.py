@@ -0,0 +1,70 @@
+import os
+import re
+from pathlib import Path
+
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchMarker:
+    """
+    Id of the last streaming micro-batch written to a sink, stored as a file
+    next to the stream checkpoint. Used to skip sinks already written when a
+    micro-batch is replayed after a partial failure.
+
+    The marker is disabled, and micro-batches are always written, if it can't
+    be stored on the driver file system: cloud storage URIs (`s3://`,
+    `abfss://`, etc.) other than `dbfs:/` or read/write failures.
+
+    Parameters
+    ----------
+    path:
+        Path of the marker file. `dbfs:/` paths are accessed through the
+        `/dbfs` mount.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path).as_posix()
+        self._enabled = True
+        if path.startswith("dbfs:/"):
+            path = "/dbfs/" + path[len("dbfs:/") :].lstrip("/")
+        elif re.match(r"^[A-Za-z][A-Za-z0-9+.-]+:/", path):
+            # Not available on driver file system. `pathlib` would also turn
+            # the URI into a path relative to the working directory.
+            logger.info(f"Micro-batch marker {path} is not on a local path. Disabled.")
+            self._enabled = False
+        self.path = Path(path)
+        self._batch_id = None
+
+    def get(self) -> int | None:
+        """Id of the last micro-batch written, `None` if not available"""
+        if self._batch_id is not None or not self._enabled:
+            return self._batch_id
+
+        try:
+            with self.path.open("r") as fp:
+                self._batch_id = int(fp.read().strip())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read micro-batch marker {self.path}: {e}")
+            self._enabled = False
+
+        return self._batch_id
+
+    def set(self, batch_id: int) -> None:
+        """Record `batch_id` as the last micro-batch written"""
+        self._batch_id = batch_id
+        if not self._enabled:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("w") as fp:
+                fp.write(str(batch_id))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write micro-batch marker {self.path}: {e}")
+            self._enabled = False
@@ -37,11 +37,29 @@ def _execute():
         required=False,
     )
 
+    parser.add_argument(
+        "--skip_unchanged",
+        type=str2bool,
+        help="Skip nodes unchanged since their last successful execution",
+        default=False,
+        required=False,
+    )
+
+    parser.add_argument(
+        "--pushdown",
+        type=str2bool,
+        help="Prune columns and rows not required by downstream nodes",
+        default=False,
+        required=False,
+    )
+
     # Get arguments
     args, unknown = parser.parse_known_args()
     filepath = args.filepath
     selects = args.selects
     full_refresh = args.full_refresh
+    skip_unchanged = args.skip_unchanged
+    pushdown = args.pushdown
     selects_str = ""
     if selects:
         selects = selects.split(",")
@@ -58,4 +76,9 @@ def _execute():
             pl = lk.models.Pipeline.model_validate_json(fp.read())
 
     # Execute
-    pl.execute(full_refresh=full_refresh, selects=selects)
+    pl.execute(
+        full_refresh=full_refresh,
+        selects=selects,
+        skip_unchanged=skip_unchanged,
+        pushdown=pushdown,
+    )
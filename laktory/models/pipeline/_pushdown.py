@@ -0,0 +1,267 @@
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from laktory._logger import get_logger
+
+if TYPE_CHECKING:
+    from laktory.models.datasources.basedatasource import BaseDataSource
+    from laktory.models.pipeline.pipeline import Pipeline
+
+logger = get_logger(__name__)
+
+
+class NodePushdown(NamedTuple):
+    """
+    Columns and rows of a pipeline node output required by its downstream
+    consumers.
+
+    Attributes
+    ----------
+    columns:
+        Output columns read by downstream nodes and used by the node
+        expectations. `None` if all columns are required.
+    filter:
+        SQL expression selecting the output rows read by downstream nodes.
+        `None` if all rows are required.
+    source_columns:
+        Columns selected from the node source, before source `filter`,
+        `selects` and `renames` are applied. `None` if the node source is not
+        pruned.
+    """
+
+    columns: list[str] | None = None
+    filter: str | None = None
+    source_columns: list[str] | None = None
+
+
+# --------------------------------------------------------------------------- #
+# Columns                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+def sql_columns(expr: str) -> set[str] | None:
+    """
+    Names of the columns referenced by SQL expression `expr`.
+
+    Returns
+    -------
+    :
+        Columns names or `None` if they can't be determined (parsing error
+        or `*` outside of `COUNT(*)`).
+    """
+    import sqlglot
+    from sqlglot import expressions
+
+    try:
+        parsed = sqlglot.parse_one(expr)
+    except Exception:
+        return None
+
+    for star in parsed.find_all(expressions.Star):
+        if not isinstance(star.parent, expressions.Count):
+            return None
+
+    return {c.name for c in parsed.find_all(expressions.Column)}
+
+
+def _expectations_columns(node) -> set[str] | None:
+    from laktory.models.dataframe.dataframecolumnexpr import DataFrameColumnExpr
+
+    columns = set()
+    for e in node.expectations:
+        expr = e.expr
+        if isinstance(expr, DataFrameColumnExpr):
+            if expr.type != "SQL":
+                return None
+            expr = expr.expr
+        _columns = sql_columns(expr)
+        if _columns is None:
+            return None
+        columns |= _columns
+    return columns
+
+
+def source_input_columns(
+    source: "BaseDataSource", columns: set[str] | None
+) -> set[str] | None:
+    """
+    Columns read by `source` from its input so that `columns` of its output
+    are available.
+
+    Parameters
+    ----------
+    source:
+        Data source
+    columns:
+        Source output columns required. All columns if `None`.
+
+    Returns
+    -------
+    :
+        Input columns or `None` if all input columns are required.
+    """
+    required = set()
+
+    if source.filter:
+        _columns = sql_columns(source.filter)
+        if _columns is None:
+            return None
+        required |= _columns
+
+    # Deduplication on all columns depends on every selected column
+    if source.drop_duplicates is True:
+        columns = None
+    elif isinstance(source.drop_duplicates, list) and columns is not None:
+        columns = columns | set(source.drop_duplicates)
+
+    # Renames are applied after selects
+    if columns is not None and source.renames:
+        inverse = {v: k for k, v in source.renames.items()}
+        columns = {inverse.get(c, c) for c in columns}
+
+    if source.selects:
+        selects = source.selects
+        if isinstance(selects, list):
+            selects = {c: c for c in selects}
+        for expr, name in selects.items():
+            if columns is not None and name not in columns:
+                continue
+            _columns = sql_columns(expr)
+            if _columns is None:
+                return None
+            required |= _columns
+        return required
+
+    if columns is None:
+        return None
+
+    return required | columns
+
+
+# --------------------------------------------------------------------------- #
+# Planning                                                                    #
+# --------------------------------------------------------------------------- #
+
+
+def get_pushdowns(pipeline: "Pipeline") -> dict[str, NodePushdown]:
+    """
+    Compute, for each pipeline node, the output columns and rows required by
+    downstream nodes. Nodes are visited in reverse topological order so that
+    the requirements of a node are known before its upstream nodes are
+    visited.
+
+    Requirements are only restricted for nodes without sinks, with
+    downstream nodes reading them through pipeline node data sources. Node
+    expectations, primary keys and time column are always kept. Rows are only
+    restricted for nodes without expectations when every consumer defines a
+    `filter`.
+
+    Parameters
+    ----------
+    pipeline:
+        Pipeline
+
+    Returns
+    -------
+    :
+        Node pushdowns
+    """
+    from laktory.models.datasources.pipelinenodedatasource import PipelineNodeDataSource
+
+    nodes_dict = pipeline.nodes_dict
+
+    # Sources reading each node, with the downstream node
+    consumers = {name: [] for name in nodes_dict}
+    for node in pipeline.nodes:
+        for source in node.data_sources:
+            if isinstance(source, PipelineNodeDataSource):
+                consumers[source.node_name] += [(node, source)]
+
+    pushdowns = {}
+    for name in reversed(pipeline.sorted_node_names):
+        node = nodes_dict[name]
+        _consumers = consumers[name]
+
+        if node.has_sinks or node.is_view or not _consumers:
+            pushdowns[name] = NodePushdown()
+            continue
+
+        # Columns
+        columns = _expectations_columns(node)
+        for consumer, source in _consumers:
+            if columns is None:
+                break
+
+            # Consumer node output requirements are known only for its main
+            # source when it has no transformer
+            required = None
+            if source is consumer.source and not consumer.transformer:
+                required = pushdowns[consumer.name].columns
+                if required is not None:
+                    required = set(required)
+
+            _columns = source_input_columns(source, required)
+            if _columns is None:
+                columns = None
+            else:
+                columns |= _columns
+
+        if columns is not None:
+            columns |= set(node.primary_keys or [])
+            if node.time_column:
+                columns.add(node.time_column)
+            columns = sorted(columns)
+
+        # Rows
+        _filter = None
+        if not node.expectations and all(s.filter for _, s in _consumers):
+            filters = list(dict.fromkeys(s.filter for _, s in _consumers))
+            if len(filters) == 1:
+                _filter = filters[0]
+            else:
+                _filter = " OR ".join(f"({f})" for f in filters)
+
+        # Source
+        source_columns = None
+        if node.source is not None and not node.transformer:
+            source_columns = source_input_columns(
+                node.source, None if columns is None else set(columns)
+            )
+            if source_columns is not None:
+                source_columns = sorted(source_columns)
+
+        pushdowns[name] = NodePushdown(
+            columns=columns, filter=_filter, source_columns=source_columns
+        )
+
+    return {name: pushdowns[name] for name in pipeline.sorted_node_names}
+
+
+def apply_pushdowns(pipeline: "Pipeline", pushdowns: dict[str, NodePushdown]):
+    """
+    Push the columns and rows required by downstream nodes into the source
+    of nodes without transformer. Columns are selected before the source is
+    filtered and rows are filtered once source `selects`, `renames`, `drops`
+    and `drop_duplicates` are applied.
+    """
+    for name, pushdown in pushdowns.items():
+        node = pipeline.nodes_dict[name]
+        source = node.source
+        if source is None or node.transformer:
+            continue
+
+        source._pushed_columns = pushdown.source_columns
+        source._pushed_filter = pushdown.filter
+
+        if pushdown.source_columns is not None or pushdown.filter is not None:
+            logger.info(
+                f"Pushing down columns {pushdown.source_columns} and filter '{pushdown.filter}' into node '{name}' source"
+            )
+
+
+def reset_pushdowns(pipeline: "Pipeline"):
+    """Remove columns and rows pushed into nodes sources"""
+    for node in pipeline.nodes:
+        if node.source is not None:
+            node.source._pushed_columns = None
+            node.source._pushed_filter = None
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from laktory._logger import get_logger
+
+if TYPE_CHECKING:
+    from laktory.models.pipeline.pipelinenode import PipelineNode
+
+logger = get_logger(__name__)
+
+
+class PipelineRunState:
+    """
+    Persistent store of the fingerprint of the last successful execution of
+    each pipeline node, used to skip nodes whose sources and configuration
+    have not changed.
+
+    A node fingerprint combines the node configuration, the fingerprint of
+    each data source (file listing or Delta version) and the fingerprint of
+    the data last materialized by upstream nodes. The state is stored as a
+    JSON file.
+
+    Parameters
+    ----------
+    path:
+        Path of the JSON file storing the run state.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fingerprints = {}
+        self._nodes = {}
+        if self.path.exists():
+            try:
+                with self.path.open("r") as fp:
+                    self._nodes = json.load(fp).get("nodes", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read run state {self.path}: {e}")
+
+    def get_fingerprint(self, node: "PipelineNode") -> str | None:
+        """
+        Current fingerprint of `node`. Fingerprints are memoized for the
+        lifetime of the store.
+
+        Parameters
+        ----------
+        node:
+            Pipeline node
+
+        Returns
+        -------
+        :
+            Fingerprint or `None` if the node inputs can't be fingerprinted.
+        """
+        from laktory import __version__
+        from laktory.models.datasources import PipelineNodeDataSource
+
+        with self._lock:
+            if node.name in self._fingerprints:
+                return self._fingerprints[node.name]
+
+        fingerprint = None
+        sources = node.data_sources
+        parts = []
+        for s in sources:
+            if s.as_stream:
+                parts = None
+                break
+            if isinstance(s, PipelineNodeDataSource):
+                _fingerprint = self._get_upstream_fingerprint(s.node)
+            else:
+                _fingerprint = s.get_fingerprint()
+            if _fingerprint is None:
+                parts = None
+                break
+            parts += [_fingerprint]
+
+        # Nodes without sources may generate data and are always executed
+        if sources and parts is not None:
+            try:
+                config = node.model_dump_json()
+            except Exception as e:
+                logger.info(f"Could not serialize node {node.name} config: {e}")
+            else:
+                h = hashlib.sha256()
+                for part in [__version__, config] + parts:
+                    h.update(part.encode())
+                    h.update(b"\n")
+                fingerprint = h.hexdigest()
+
+        with self._lock:
+            self._fingerprints[node.name] = fingerprint
+
+        return fingerprint
+
+    def _get_upstream_fingerprint(self, node: "PipelineNode") -> str | None:
+        """
+        Fingerprint of the data materialized by upstream `node`. Nodes with
+        sinks are identified by the fingerprint recorded at their last
+        successful execution (and their primary sink fingerprint when
+        available), not their current one: an upstream node not executed yet
+        (e.g. not selected) still holds the data of its previous execution.
+        Nodes without sinks are executed with their downstream nodes and
+        identified by their current fingerprint.
+        """
+        if not node.has_sinks:
+            return self.get_fingerprint(node)
+
+        with self._lock:
+            state = self._nodes.get(node.name)
+        if state is None:
+            return None
+
+        sink_fingerprint = None
+        try:
+            sink_fingerprint = node.primary_sink.as_source().get_fingerprint()
+        except Exception as e:
+            logger.info(f"Could not fingerprint node {node.name} sink: {e}")
+
+        return f"{state['fingerprint']}:{sink_fingerprint or ''}"
+
+    def is_unchanged(self, node: "PipelineNode") -> bool:
+        """
+        `True` if `node` fingerprint matches its last successful execution
+        and its sinks still exist.
+
+        Parameters
+        ----------
+        node:
+            Pipeline node
+        """
+        if not node.has_sinks:
+            return False
+
+        fingerprint = self.get_fingerprint(node)
+        if fingerprint is None:
+            return False
+
+        with self._lock:
+            state = self._nodes.get(node.name)
+        if state is None or state.get("fingerprint") != fingerprint:
+            return False
+
+        for s in node.sinks:
+            try:
+                if not s.exists():
+                    return False
+            except NotImplementedError:
+                return False
+
+        return True
+
+    def set_success(self, node: "PipelineNode") -> None:
+        """
+        Record successful execution of `node` and save the run state.
+
+        Parameters
+        ----------
+        node:
+            Pipeline node
+        """
+        fingerprint = self.get_fingerprint(node)
+        if fingerprint is None:
+            return
+
+        with self._lock:
+            self._nodes[node.name] = {
+                "fingerprint": fingerprint,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as fp:
+            json.dump({"nodes": self._nodes}, fp, indent=2)
+        os.replace(tmp_path, self.path)
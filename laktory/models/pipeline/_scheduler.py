@@ -0,0 +1,78 @@
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def execute_dag(
+    upstreams: dict[str, set[str]],
+    func: Callable[[str], None],
+    max_workers: int | None = None,
+) -> None:
+    """
+    Execute a directed acyclic graph of units of work (pipeline nodes or tasks).
+    Each unit is submitted to a thread pool as soon as all its upstream units
+    have completed.
+
+    When a unit fails, units that have not started yet are cancelled, units
+    already running are allowed to complete and the original exception is
+    raised.
+
+    Parameters
+    ----------
+    upstreams:
+        Mapping between each unit name and the set of unit names it depends on.
+        Units are submitted in the order of the mapping when several are ready
+        at the same time.
+    func:
+        Function executing a unit, given its name.
+    max_workers:
+        Maximum number of units executed concurrently. If `None` or `1`, units
+        are executed sequentially in the order of the mapping.
+    """
+
+    # Sequential
+    if max_workers is None or max_workers <= 1 or len(upstreams) <= 1:
+        for name in upstreams:
+            func(name)
+        return
+
+    pending = {name: set(deps) for name, deps in upstreams.items()}
+    completed = set()
+    running = {}
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="laktory-dag"
+    )
+
+    def _submit_ready():
+        for name in list(pending.keys()):
+            if pending[name] <= completed:
+                logger.info(f"Submitting '{name}'")
+                running[executor.submit(func, name)] = name
+                del pending[name]
+
+    try:
+        _submit_ready()
+        while running:
+            done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                e = future.exception()
+                if e is not None:
+                    logger.error(f"'{name}' failed. Cancelling {list(pending.keys())}")
+                    pending.clear()
+                    raise e
+                completed.add(name)
+            _submit_ready()
+
+        if pending:
+            raise ValueError(
+                f"Units {list(pending.keys())} have unresolved upstream dependencies."
+            )
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
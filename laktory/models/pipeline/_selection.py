@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING
+
+from laktory._logger import get_logger
+
+if TYPE_CHECKING:
+    from laktory.models.pipeline.pipeline import Pipeline
+
+logger = get_logger(__name__)
+
+
+class SelectionIndex:
+    """
+    Precomputed index used to resolve pipeline nodes selections.
+
+    Nodes are numbered by their topological order and sets of nodes are stored
+    as bitsets (python integers). For each node, execution task name and tag
+    the index stores the bitset of its members, of their ancestors and of
+    their descendants, so that a selection is resolved with a few bitwise
+    operations, regardless of the size of the pipeline.
+
+    Parameters
+    ----------
+    pipeline:
+        Pipeline
+    """
+
+    def __init__(self, pipeline: "Pipeline"):
+        dag = pipeline.dag
+
+        self.node_names = pipeline.sorted_node_names
+        self.positions = {name: i for i, name in enumerate(self.node_names)}
+        positions = self.positions
+
+        # Nodes ancestors and descendants, propagated in topological order
+        ancestors = {}
+        for name in self.node_names:
+            b = 0
+            for pred in dag.predecessors(name):
+                b |= ancestors[pred] | (1 << positions[pred])
+            ancestors[name] = b
+
+        descendants = {}
+        for name in reversed(self.node_names):
+            b = 0
+            for succ in dag.successors(name):
+                b |= descendants[succ] | (1 << positions[succ])
+            descendants[name] = b
+
+        # Execution task and tag groups
+        groups = {}
+        for node in pipeline.nodes:
+            bit = 1 << positions[node.name]
+            for group_name in [node.execution_task_name] + list(node.tags):
+                groups[group_name] = groups.get(group_name, 0) | bit
+
+        # Members, ancestors and descendants of each selectable name. Node
+        # names have priority over execution task names and tags.
+        self._members = {}
+        self._ancestors = {}
+        self._descendants = {}
+        for group_name, members in groups.items():
+            self._members[group_name] = members
+            self._ancestors[group_name] = self._union(members, ancestors)
+            self._descendants[group_name] = self._union(members, descendants)
+        for name in self.node_names:
+            self._members[name] = 1 << positions[name]
+            self._ancestors[name] = ancestors[name]
+            self._descendants[name] = descendants[name]
+
+    def _union(self, members: int, bitsets: dict[str, int]) -> int:
+        b = 0
+        for name in self.to_names(members):
+            b |= bitsets[name]
+        return b
+
+    def to_names(self, bitset: int) -> list[str]:
+        """
+        Node names of a bitset, in topological order.
+
+        Parameters
+        ----------
+        bitset:
+            Set of nodes
+
+        Returns
+        -------
+        :
+            Node names
+        """
+        names = []
+        while bitset:
+            low = bitset & -bitset
+            names += [self.node_names[low.bit_length() - 1]]
+            bitset ^= low
+        return names
+
+    def ancestors(self, name: str) -> set[str]:
+        """Names of the ancestors of node, task or tag `name`"""
+        return set(self.to_names(self._ancestors[name]))
+
+    def descendants(self, name: str) -> set[str]:
+        """Names of the descendants of node, task or tag `name`"""
+        return set(self.to_names(self._descendants[name]))
+
+    def resolve(self, selects: list[str] | None) -> list[str]:
+        """
+        Resolve selected node names.
+
+        Parameters
+        ----------
+        selects:
+            List of node names, execution task names or tags with optional
+            dependency notation (`*{name}`, `{name}*` or `*{name}*`). All nodes
+            are selected if `None`.
+
+        Returns
+        -------
+        :
+            Topologically sorted node names
+        """
+        if selects is None:
+            return list(self.node_names)
+
+        selected = 0
+        for item in selects:
+            upstream = item.startswith("*")
+            downstream = item.endswith("*") and len(item) > 1
+            name = item[1 if upstream else None : -1 if downstream else None]
+
+            members = self._members.get(name)
+            if members is None:
+                raise ValueError(f"Invalid node, execution_task_name, or tag: {name}")
+
+            selected |= members
+            if upstream:
+                selected |= self._ancestors[name]
+            if downstream:
+                selected |= self._descendants[name]
+
+        return self.to_names(selected)
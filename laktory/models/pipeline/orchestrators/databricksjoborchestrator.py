@@ -15,6 +15,7 @@ from laktory.models.resources.databricks.job import JobTask
 from laktory.models.resources.databricks.job import JobTaskLibrary
 from laktory.models.resources.databricks.job import JobTaskLibraryPypi
 from laktory.models.resources.databricks.job import JobTaskPythonWheelTask
+from laktory.models.resources.databricks.workspacefile import WorkspaceFile
 
 logger = get_logger(__name__)
 
@@ -92,6 +93,10 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
             + self.inject_vars_into_dump({"path": self.config_file.path})["path"]
         )
 
+        def _task_path(task_name):
+            path = self.config_file.get_task_path(task_name)
+            return "/Workspace" + self.inject_vars_into_dump({"path": path})["path"]
+
         # Environment
         env_found = False
         envs = self.environment
@@ -138,7 +143,7 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
                     entry_point="models.pipeline._execute",
                     package_name="laktory",
                     named_parameters={
-                        "filepath": _path,
+                        "filepath": _task_path(pl_task.name),
                         "selects": ",".join(pl_task.node_names),
                     },
                 ),
@@ -241,14 +246,35 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
             "serverless_environment_version",
         ]
 
+    @property
+    def task_config_files(self) -> list[WorkspaceFile]:
+        """Workspace files storing the pipeline configuration slice of each task"""
+        pl = self.parent_pipeline
+        if pl is None:
+            return []
+
+        files = []
+        for task_name in sorted(pl.get_execution_plan().tasks_dict.keys()):
+            files += [
+                WorkspaceFile(
+                    source=self.config_file.get_task_source(task_name),
+                    path=self.config_file.get_task_path(task_name),
+                    access_controls=self.config_file.access_controls,
+                )
+            ]
+        return files
+
     @property
     def additional_core_resources(self) -> list:
         """
         - configuration workspace file
         - configuration workspace file permissions
+        - tasks configuration workspace files
+        - tasks configuration workspace files permissions
         """
 
         resources = super().additional_core_resources
         resources += [self.config_file]
+        resources += self.task_config_files
 
         return resources
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from pydantic import computed_field
 
+from laktory._build import write_if_changed
 from laktory._logger import get_logger
 from laktory._settings import settings
 from laktory.models.pipelinechild import PipelineChild
@@ -11,6 +12,80 @@ from laktory.models.resources.databricks.workspacefile import WorkspaceFile
 
 logger = get_logger(__name__)
 
+# Configuration of upstream nodes only read through their sinks
+REFERENCE_NODE_EXCLUDES = [
+    "cache",
+    "expectations",
+    "expectations_checkpoint_path",
+    "source",
+    "transformer",
+]
+
+
+def get_task_config(config: dict, pipeline, node_names: list[str]) -> dict:
+    """
+    Slice of pipeline configuration `config` required to execute nodes
+    `node_names`. Upstream nodes without sinks, executed implicitly, are
+    included. Upstream nodes with sinks are only included as references to
+    their sinks (and view definition for view sinks). Upstream nodes of views
+    are only included as references, as they are not executed by the task.
+
+    Parameters
+    ----------
+    config:
+        Pipeline configuration, as written in the configuration file
+    pipeline:
+        Pipeline
+    node_names:
+        Names of the nodes to execute
+
+    Returns
+    -------
+    :
+        Pipeline configuration slice
+    """
+    dag = pipeline.dag
+    nodes_dict = pipeline.nodes_dict
+
+    executed = set(node_names)
+    references = set()
+    views = []
+    stack = list(node_names)
+    while stack:
+        for name in dag.predecessors(stack.pop()):
+            if name in executed or name in references:
+                continue
+            node = nodes_dict[name]
+            if node.has_sinks:
+                references.add(name)
+                if node.is_view:
+                    views.append(name)
+            else:
+                executed.add(name)
+                stack.append(name)
+
+    # View definitions reference upstream nodes, which are not executed
+    while views:
+        for name in dag.predecessors(views.pop()):
+            if name in executed or name in references:
+                continue
+            references.add(name)
+            if nodes_dict[name].is_view:
+                views.append(name)
+
+    nodes = []
+    for node in config.get("nodes", []):
+        name = node["name"]
+        if name in executed:
+            nodes += [node]
+        elif name in references:
+            excludes = REFERENCE_NODE_EXCLUDES
+            if nodes_dict[name].is_view:
+                excludes = [k for k in excludes if k != "transformer"]
+            nodes += [{k: v for k, v in node.items() if k not in excludes}]
+
+    return {**config, "nodes": nodes}
+
 
 class PipelineConfigWorkspaceFile(WorkspaceFile, PipelineChild):
     """
@@ -71,17 +146,105 @@ class PipelineConfigWorkspaceFile(WorkspaceFile, PipelineChild):
 
         return _config
 
-    def build(self):
+    # ----------------------------------------------------------------------- #
+    # Tasks                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def has_tasks(self) -> bool:
+        """
+        `True` if pipeline is orchestrated by a Databricks job, with a
+        configuration slice for each job task.
+        """
+        pl = self.parent_pipeline
+        if not pl:
+            return False
+        return getattr(pl.orchestrator, "type", None) == "DATABRICKS_JOB"
+
+    def get_task_source(self, task_name: str) -> str:
+        """Path of the task configuration slice on local filesystem"""
+        source = Path(self.source)
+        return str(source.parent / source.stem / "tasks" / f"{task_name}.json")
+
+    def get_task_path(self, task_name: str) -> str | None:
+        """Workspace path of the task configuration slice"""
+        path = self.path
+        if path is None:
+            return None
+        return f"{path.removesuffix('.json')}/tasks/{task_name}.json"
+
+    def get_task_content_dicts(self, content_dict: dict = None) -> dict[str, dict]:
+        """
+        Configuration slice of each pipeline task, with only the task nodes,
+        the upstream nodes executed implicitly and references to the sinks of
+        other upstream nodes.
+
+        Parameters
+        ----------
+        content_dict:
+            Complete pipeline configuration. Computed if not provided.
+
+        Returns
+        -------
+        :
+            Configuration slice for each task name
+        """
+        if not self.has_tasks:
+            return {}
+
+        pl = self.parent_pipeline
+        if content_dict is None:
+            content_dict = self.content_dict
+
+        return {
+            task.name: get_task_config(content_dict, pl, task.node_names)
+            for task in pl.get_execution_plan().tasks
+        }
+
+    # ----------------------------------------------------------------------- #
+    # Build                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def build(self) -> list[Path]:
         """
         Write config file to `settings.build_root` if
         specified or default cache dir if not. These files may also be used when
         deployment is delegated to third parties like Databricks Declarative Bundles.
+
+        When pipeline is orchestrated by a Databricks job, a configuration
+        slice is also written for each job task so that a task only loads the
+        nodes it requires.
+
+        Files are only re-written when their content hash changed.
+
+        Returns
+        -------
+        :
+            Paths of the config files, written or unchanged
         """
+        content_dict = self.content_dict
+
         filepath = Path(self.source)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Writing config file at {filepath}")
-        with filepath.open(mode="w") as fp:
-            json.dump(self.content_dict, fp, indent=4)
+        if write_if_changed(filepath, json.dumps(content_dict, indent=4)):
+            logger.debug(f"Wrote config file at {filepath}")
+        filepaths = [filepath]
+
+        task_dicts = self.get_task_content_dicts(content_dict)
+        task_filepaths = []
+        for task_name, task_dict in task_dicts.items():
+            filepath = Path(self.get_task_source(task_name))
+            if write_if_changed(filepath, json.dumps(task_dict, indent=4)):
+                logger.debug(f"Wrote task config file at {filepath}")
+            task_filepaths += [filepath]
+
+        # Remove slices of tasks that no longer exist
+        if task_filepaths:
+            for filepath in task_filepaths[0].parent.glob("*.json"):
+                if filepath not in task_filepaths:
+                    logger.debug(f"Removing task config file {filepath}")
+                    filepath.unlink()
+
+        return filepaths + task_filepaths
 
     # ----------------------------------------------------------------------- #
     # Resource Properties                                                     #
@@ -1,5 +1,6 @@
 import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
     from databricks.sdk import WorkspaceClient
     from plotly.graph_objs import Figure
 
+    from laktory.models.pipeline._selection import SelectionIndex
     from laktory.models.pipeline.pipelineexecutionplan import PipelineExecutionPlan
 
 logger = get_logger(__name__)
@@ -281,6 +283,7 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
     )
     _imports_imported: bool = False
     _plan: "PipelineExecutionPlan" = None
+    _cache: dict[str, Any] = None
 
     @model_validator(mode="before")
     @classmethod
@@ -324,6 +327,12 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
 
         return self
 
+    @model_validator(mode="after")
+    def invalidate_nodes_cache(self) -> Any:
+        # Nodes (re-)assigned
+        self.invalidate_cache()
+        return self
+
     # ----------------------------------------------------------------------- #
     # Children                                                                #
     # ----------------------------------------------------------------------- #
@@ -423,6 +432,11 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
     def serialize_path(self, value: Path) -> str:
         return value.as_posix()
 
+    @property
+    def run_state_path(self) -> Path:
+        """Path of the file storing nodes last successful execution state"""
+        return self.root_path / "run_state.json"
+
     # ----------------------------------------------------------------------- #
     # Expectations                                                            #
     # ----------------------------------------------------------------------- #
@@ -438,6 +452,28 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
     # Nodes                                                                   #
     # ----------------------------------------------------------------------- #
 
+    def invalidate_cache(self) -> None:
+        """
+        Clear the memoized DAG, topological order, selection index and nodes
+        dictionary.
+
+        The cache is automatically invalidated when the nodes are re-assigned
+        and when a node attribute is assigned. It must be invalidated
+        explicitly after modifying in place the nodes list or nested
+        attributes of a node (sources, transformer, tags, etc.).
+        """
+        self._cache = None
+
+    def _get_cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """Memoized value for `key`, re-built after cache invalidation."""
+        if self._cache is None:
+            self._cache = {}
+
+        if key not in self._cache:
+            self._cache[key] = build()
+
+        return self._cache[key]
+
     @property
     def nodes_dict(self) -> dict[str, PipelineNode]:
         """
@@ -448,24 +484,24 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         :
             Nodes
         """
-        return {n.name: n for n in self.nodes}
+        return self._get_cached("nodes_dict", lambda: {n.name: n for n in self.nodes})
 
     @property
     def dag(self) -> nx.DiGraph:
         """
         Networkx Directed Acyclic Graph representation of the pipeline. Useful
-        to identify interdependencies between nodes.
+        to identify interdependencies between nodes. The graph is memoized and
+        must not be modified in place.
 
         Returns
         -------
         :
             Directed Acyclic Graph
         """
-        import networkx as nx
+        return self._get_cached("dag", self._build_dag)
 
-        # TODO: Review if this needs to be computed dynamically or if we can
-        #       compute it only after initialization. It depends if we believe
-        #       that the nodes will be changed after initialization.
+    def _build_dag(self) -> nx.DiGraph:
+        import networkx as nx
 
         dag = nx.DiGraph()
 
@@ -473,18 +509,19 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         for n in self.nodes:
             dag.add_node(n.name)
         # Build edges and assign nodes to pipeline node data sources
-        node_names = []
+        node_names = set()
+        nodes_dict = self.nodes_dict
         for n in self.nodes:
             if n.name in node_names:
                 raise ValueError(
                     f"Pipeline node '{n.name}' is declared twice in pipeline '{self.name}'"
                 )
-            node_names += [n.name]
+            node_names.add(n.name)
 
             # for s in n.get_sources(PipelineNodeDataSource):
             for _node_name in n.upstream_node_names:
                 dag.add_edge(_node_name, n.name)
-                if _node_name not in self.nodes_dict:
+                if _node_name not in nodes_dict:
                     raise ValueError(
                         f"Pipeline node data source '{_node_name}' is not defined in pipeline '{self.name}'"
                     )
@@ -502,10 +539,37 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         return dag
 
     @property
-    def sorted_node_names(self):
+    def sorted_node_names(self) -> list[str]:
+        """
+        Topologically sorted node names.
+
+        Returns
+        -------
+        :
+            List of topologically sorted node names.
+        """
         import networkx as nx
 
-        return list(nx.topological_sort(self.dag))
+        return list(
+            self._get_cached(
+                "sorted_node_names", lambda: tuple(nx.topological_sort(self.dag))
+            )
+        )
+
+    @property
+    def selection_index(self) -> "SelectionIndex":
+        """
+        Memoized index of nodes ancestors, descendants, execution tasks and
+        tags used to resolve nodes selections.
+
+        Returns
+        -------
+        :
+            Selection index
+        """
+        from laktory.models.pipeline._selection import SelectionIndex
+
+        return self._get_cached("selection_index", lambda: SelectionIndex(self))
 
     @property
     def sorted_nodes(self) -> list[PipelineNode]:
@@ -517,15 +581,8 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         :
             List of Topologically sorted nodes.
         """
-        node_names = self.sorted_node_names
-        nodes = []
-        for node_name in node_names:
-            for node in self.nodes:
-                if node.name == node_name:
-                    nodes += [node]
-                    break
-
-        return nodes
+        nodes_dict = self.nodes_dict
+        return [nodes_dict[name] for name in self.sorted_node_names]
 
     # ----------------------------------------------------------------------- #
     # Data Sources                                                            #
@@ -586,12 +643,22 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         named_dfs: dict[str, AnyFrame] = None,
         update_tables_metadata: bool = True,
         selects: list[str] | None = None,
+        max_workers: int | None = None,
+        skip_unchanged: bool = False,
+        pushdown: bool = False,
     ) -> None:
         """
         Execute the pipeline (read sources and write sinks) by sequentially
         executing each node. The selected orchestrator might impact how
         data sources or sinks are processed.
 
+        When `max_workers` is greater than 1, the nodes of all pipeline tasks
+        are executed concurrently on a single thread pool. Each node is started
+        as soon as all its upstream nodes have completed. Nodes without sinks
+        are executed only once, by the first downstream node reading them. If
+        a node fails, nodes not yet started are cancelled and the exception is
+        raised once running nodes are completed.
+
         Parameters
         ----------
         write_sinks:
@@ -610,11 +677,31 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
             - `*{node_name}`: Execute the node and its upstream dependencies.
             - `{node_name}*`: Execute the node and its downstream dependencies.
             - `*{node_name}*`: Execute the node, its upstream, and downstream dependencies.
+        max_workers:
+            Maximum number of nodes executed concurrently, across all pipeline
+            tasks. Nodes are executed sequentially if `None` or `1`.
+        skip_unchanged:
+            If `True`, nodes with sinks whose configuration, sources and
+            upstream nodes have not changed since their last successful
+            execution are skipped. Run state is stored at `run_state_path`.
+            Ignored with `full_refresh`, `named_dfs` or when `write_sinks` is
+            `False`.
+        pushdown:
+            If `True`, columns and rows of nodes without sinks that are not
+            required by downstream nodes are pruned from the node source read.
+            See `PipelineExecutionPlan.pushdowns`. Ignored with DLT
+            orchestrator.
         """
+        from laktory.models.pipeline._runstate import PipelineRunState
+        from laktory.models.pipeline.pipelinetask import execute_nodes
 
         logger.info(f"Executing pipeline '{self.name}'")
 
         plan = self.get_execution_plan(selects=selects)
+        plan._init_cache_consumers()
+        plan._init_implicit_executions()
+        if skip_unchanged:
+            plan._run_state = PipelineRunState(self.run_state_path)
         node_names = plan.node_names
 
         logger.info(f"Selected nodes: {node_names}")
@@ -622,21 +709,55 @@ class Pipeline(BaseModel, TerraformResource, PipelineChild):
         if named_dfs is None:
             named_dfs = {}
 
+        # Tasks nodes are scheduled together on a single thread pool
+        funcs = {}
         for task in plan.tasks:
-            task.execute(
+            execute_node = task._get_node_executor(
                 write_sinks=write_sinks,
                 full_refresh=full_refresh,
                 named_dfs=named_dfs,
                 update_tables_metadata=update_tables_metadata,
+                skip_unchanged=skip_unchanged,
             )
+            for node_name in task.node_names:
+                funcs[node_name] = execute_node
+
+        pushdown = pushdown and not self.is_orchestrator_dlt
+        if pushdown:
+            plan.apply_pushdowns()
+
+        try:
+            execute_nodes(pipeline=self, funcs=funcs, max_workers=max_workers)
+        finally:
+            if pushdown:
+                plan.reset_pushdowns()
+            plan.remove_cache_files()
+            plan._clear_implicit_executions()
+
+    def update_tables_metadata(self, max_workers: int | None = 8):
+        """
+        Update metadata of all pipeline tables. Current metadata is fetched
+        in batch and tables are updated concurrently.
+
+        Parameters
+        ----------
+        max_workers:
+            Maximum number of tables updated concurrently. If `None` or `1`,
+            tables are updated sequentially.
+        """
+        from laktory.models.datasinks.tabledatasinkmetadata import (
+            update_tables_metadata,
+        )
 
-    def update_tables_metadata(self):
         logger.info("Updating pipeline tables metadata")
 
-        for inode, node in enumerate(self.sorted_nodes):
-            for s in node.sinks:
-                if s.metadata:
-                    s.metadata.execute()
+        metadatas = []
+        for node in self.sorted_nodes:
+            for s in node.sinks or []:
+                if getattr(s, "metadata", None):
+                    metadatas += [s.metadata]
+
+        update_tables_metadata(metadatas, max_workers=max_workers)
 
     def update_quality_monitors(self, workspace_client: "WorkspaceClient" = None):
         if not self.databricks_quality_monitor_enabled:
@@ -1,4 +1,9 @@
+import os
+import threading
 from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 import networkx as nx
@@ -12,6 +17,10 @@ from laktory.models.pipeline._execute import _execute  # noqa: F401
 from laktory.models.pipeline._post_execute import _post_execute  # noqa: F401
 from laktory.models.pipeline.pipeline import Pipeline
 from laktory.models.pipeline.pipelinetask import PipelineTask
+from laktory.typing import AnyFrame
+
+if TYPE_CHECKING:
+    from laktory.models.pipeline._pushdown import NodePushdown
 
 logger = get_logger(__name__)
 
@@ -49,6 +58,16 @@ class PipelineExecutionPlan(BaseModel):
         """,
     )
 
+    _resolved: dict[str, Any] = None
+    _resolved_signature: tuple = None
+    _cache_consumers: dict[str, set[str]] = None
+    _cache_lock: Any = None
+    _cache_files: list[Path] = None
+    _implicit_lock: Any = None
+    _implicit_node_locks: dict[str, Any] = None
+    _implicit_executed: set[str] = None
+    _run_state: Any = None
+
     @model_validator(mode="after")
     def update_pipeline(self) -> Any:
         if self.pipeline is not None:
@@ -59,119 +78,222 @@ class PipelineExecutionPlan(BaseModel):
     # Nodes                                                                            #
     # -------------------------------------------------------------------------------- #
 
+    def _get_resolved(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Memoized value for `key`. The plan is resolved once for the pipeline
+        selection index and `selects`, and re-resolved only if one of them
+        changed.
+        """
+        selects = None if self.selects is None else tuple(self.selects)
+        signature = (self.pipeline.selection_index, selects)
+        if self._resolved is None or self._resolved_signature != signature:
+            self._resolved = {}
+            self._resolved_signature = signature
+
+        if key not in self._resolved:
+            self._resolved[key] = build()
+
+        return self._resolved[key]
+
     @property
     def node_names(self) -> list[str]:
         """Selected pipeline node names"""
-        # TODO: Refactor as a cached property??
-        if self.selects is None:
-            return self.pipeline.sorted_node_names
-
-        # Validate and resolve selected nodes/tasks/tags
-        selected_nodes = set()
-        dag = self.pipeline.dag
-
-        for item in self.selects:
-            if item.startswith("*") and item.endswith("*"):
-                # Node + both upstream and downstream dependencies
-                node_name = item[1:-1]
-                if node_name in self.pipeline.nodes_dict:
-                    selected_nodes.add(node_name)
-                    selected_nodes.update(nx.ancestors(dag, node_name))
-                    selected_nodes.update(nx.descendants(dag, node_name))
-                else:
-                    # Check if it's a task or tag
-                    task_or_tag_nodes = [
-                        n.name
-                        for n in self.pipeline.nodes
-                        if n.execution_task_name == node_name or node_name in n.tags
-                    ]
-                    if not task_or_tag_nodes:
-                        raise ValueError(
-                            f"Invalid node, execution_task_name, or tag: {node_name}"
-                        )
-                    for group_node in task_or_tag_nodes:
-                        selected_nodes.add(group_node)
-                        selected_nodes.update(nx.ancestors(dag, group_node))
-                        selected_nodes.update(nx.descendants(dag, group_node))
-            elif item.startswith("*"):
-                # Node + upstream dependencies
-                node_name = item[1:]
-                if node_name in self.pipeline.nodes_dict:
-                    selected_nodes.add(node_name)
-                    selected_nodes.update(nx.ancestors(dag, node_name))
-                else:
-                    # Check if it's a task or tag
-                    task_or_tag_nodes = [
-                        n.name
-                        for n in self.pipeline.nodes
-                        if n.execution_task_name == node_name or node_name in n.tags
-                    ]
-                    if not task_or_tag_nodes:
-                        raise ValueError(
-                            f"Invalid node, execution_task_name, or tag: {node_name}"
-                        )
-                    for group_node in task_or_tag_nodes:
-                        selected_nodes.add(group_node)
-                        selected_nodes.update(nx.ancestors(dag, group_node))
-            elif item.endswith("*"):
-                # Node + downstream dependencies
-                node_name = item[:-1]
-                if node_name in self.pipeline.nodes_dict:
-                    selected_nodes.add(node_name)
-                    selected_nodes.update(nx.descendants(dag, node_name))
-                else:
-                    # Check if it's a task or tag
-                    task_or_tag_nodes = [
-                        n.name
-                        for n in self.pipeline.nodes
-                        if n.execution_task_name == node_name or node_name in n.tags
-                    ]
-                    if not task_or_tag_nodes:
-                        raise ValueError(
-                            f"Invalid node, execution_task_name, or tag: {node_name}"
-                        )
-                    for group_node in task_or_tag_nodes:
-                        selected_nodes.add(group_node)
-                        selected_nodes.update(nx.descendants(dag, group_node))
-            else:
-                # Node only
-                if item in self.pipeline.nodes_dict:
-                    selected_nodes.add(item)
-                else:
-                    # Check if it's a task or tag
-                    task_or_tag_nodes = [
-                        n.name
-                        for n in self.pipeline.nodes
-                        if n.execution_task_name == item or item in n.tags
-                    ]
-                    if not task_or_tag_nodes:
-                        raise ValueError(
-                            f"Invalid node, execution_task_name, or tag: {item}"
-                        )
-                    selected_nodes.update(task_or_tag_nodes)
-
-        # Sort nodes based on DAG topological order
-        sorted_node_names = [
-            node for node in self.pipeline.sorted_node_names if node in selected_nodes
-        ]
-
-        return sorted_node_names
+        return list(
+            self._get_resolved(
+                "node_names",
+                lambda: tuple(self.pipeline.selection_index.resolve(self.selects)),
+            )
+        )
 
     @property
     def nodes_dict(self):
         """Selected pipeline nodes dict"""
-        return {k: self.pipeline.nodes_dict[k] for k in self.node_names}
+        nodes_dict = self.pipeline.nodes_dict
+        return {k: nodes_dict[k] for k in self.node_names}
 
     @property
     def nodes_dag(self) -> nx.DiGraph:
-        """Selected pipeline nodes DAG"""
-        selected_nodes = set(self.node_names)
+        """Selected pipeline nodes DAG. Memoized and must not be modified in place."""
+        return self._get_resolved(
+            "nodes_dag", lambda: self.pipeline.dag.subgraph(self.node_names).copy()
+        )
+
+    # -------------------------------------------------------------------------------- #
+    # Cache                                                                            #
+    # -------------------------------------------------------------------------------- #
+
+    def _init_cache_consumers(self) -> None:
+        """
+        Map each selected node with cache enabled to the selected downstream
+        nodes materializing its output. Downstream nodes without sinks only
+        return a lazy DataFrame and are traversed up to the nodes with sinks
+        (or leaf nodes) reading them.
+        """
         dag = self.pipeline.dag
-        for node_name in list(dag.nodes.keys()):
-            if node_name not in selected_nodes:
-                dag.remove_node(node_name)
+        nodes_dag = self.nodes_dag
+        nodes_dict = self.pipeline.nodes_dict
+        selected_nodes = set(self.node_names)
 
-        return dag
+        def get_consumers(node_name):
+            consumers = set()
+            stack = list(dag.successors(node_name))
+            seen = set()
+            while stack:
+                name = stack.pop()
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                if name in selected_nodes and (
+                    nodes_dict[name].has_sinks or nodes_dag.out_degree[name] == 0
+                ):
+                    consumers.add(name)
+                    continue
+
+                # Skip through nodes without sinks (executed implicitly)
+                if not nodes_dict[name].has_sinks:
+                    stack.extend(dag.successors(name))
+
+            return consumers
+
+        self._cache_lock = threading.Lock()
+        self._cache_files = []
+        self._cache_consumers = {
+            node_name: get_consumers(node_name)
+            for node_name in self.node_names
+            if nodes_dict[node_name].cache_options is not None
+        }
+
+    def release_caches(self, node_name: str) -> None:
+        """
+        Register the execution of node `node_name` and release the cache of
+        upstream nodes (and of the node itself) that have no remaining
+        downstream node to be executed.
+
+        Parameters
+        ----------
+        node_name:
+            Name of the executed node
+        """
+        if not self._cache_consumers:
+            return
+
+        to_release = []
+        with self._cache_lock:
+            for name, consumers in list(self._cache_consumers.items()):
+                if name != node_name and node_name not in consumers:
+                    continue
+                consumers.discard(node_name)
+                if not consumers:
+                    del self._cache_consumers[name]
+                    to_release += [name]
+
+        # Spill files are removed once the pipeline execution is completed
+        # because outputs of downstream nodes are lazy and might still scan
+        # them.
+        for name in to_release:
+            node = self.pipeline.nodes_dict[name]
+            node.release_cache(remove_cache_file=False)
+            with self._cache_lock:
+                self._cache_files += [node.cache_path]
+
+    def remove_cache_files(self) -> None:
+        """
+        Remove the files used to spill the released caches of the nodes
+        executed since the pipeline execution started.
+        """
+        if not self._cache_files:
+            return
+
+        for path in self._cache_files:
+            if path.exists():
+                logger.info(f"Removing cache file {path}")
+                os.remove(path)
+        self._cache_files = []
+
+    # -------------------------------------------------------------------------------- #
+    # Implicit Execution                                                               #
+    # -------------------------------------------------------------------------------- #
+
+    def _init_implicit_executions(self) -> None:
+        """
+        Reset the nodes without sinks executed implicitly by their downstream
+        nodes.
+        """
+        self._implicit_lock = threading.Lock()
+        self._implicit_node_locks = {}
+        self._implicit_executed = set()
+
+    def _clear_implicit_executions(self) -> None:
+        """
+        Clear the nodes executed implicitly once the pipeline execution is
+        completed. Downstream nodes read afterward use the node output
+        DataFrame.
+        """
+        self._implicit_lock = None
+        self._implicit_node_locks = None
+        self._implicit_executed = None
+
+    def execute_implicit_node(self, node_name: str) -> AnyFrame:
+        """
+        Execute node `node_name` (without sinks) on behalf of a downstream node
+        reading it and return its output DataFrame. The node is executed only
+        once per pipeline execution: concurrent downstream nodes wait for the
+        execution to complete instead of executing it again.
+
+        Parameters
+        ----------
+        node_name:
+            Name of the node to execute
+
+        Returns
+        -------
+        output:
+            Node output DataFrame
+        """
+        with self._implicit_lock:
+            lock = self._implicit_node_locks.setdefault(node_name, threading.Lock())
+
+        node = self.pipeline.nodes_dict[node_name]
+        with lock:
+            if node_name not in self._implicit_executed:
+                logger.info(f"Executing parent pipeline node '{node_name}'")
+                node.execute()
+                self._implicit_executed.add(node_name)
+            return node.output_df
+
+    # -------------------------------------------------------------------------------- #
+    # Pushdown                                                                         #
+    # -------------------------------------------------------------------------------- #
+
+    @property
+    def pushdowns(self) -> dict[str, "NodePushdown"]:
+        """
+        Columns and rows of each selected node output required by downstream
+        nodes and columns pruned from the node source. Computed from the
+        complete pipeline DAG so that downstream nodes not selected are also
+        accounted for.
+        """
+        from laktory.models.pipeline._pushdown import get_pushdowns
+
+        pushdowns = get_pushdowns(self.pipeline)
+        return {k: pushdowns[k] for k in self.node_names}
+
+    def apply_pushdowns(self) -> None:
+        """
+        Push columns and rows required by downstream nodes into the source of
+        the pipeline nodes. Use `reset_pushdowns` to restore complete reads.
+        """
+        from laktory.models.pipeline._pushdown import apply_pushdowns
+        from laktory.models.pipeline._pushdown import get_pushdowns
+
+        apply_pushdowns(self.pipeline, get_pushdowns(self.pipeline))
+
+    def reset_pushdowns(self) -> None:
+        """Remove columns and rows pushed into the pipeline nodes sources."""
+        from laktory.models.pipeline._pushdown import reset_pushdowns
+
+        reset_pushdowns(self.pipeline)
 
     # -------------------------------------------------------------------------------- #
     # Tasks                                                                            #
@@ -180,18 +302,23 @@ class PipelineExecutionPlan(BaseModel):
     @property
     def dag(self) -> nx.DiGraph:
         """
-        Constructs a DAG for the execution plan, where each node is either:
+        DAG for the execution plan, where each node is either:
         - A single pipeline node (default `execute_task_name`), or
         - A group of nodes (if they share the same `execute_task_name`).
 
         Pipeline nodes without sink(s) are omitted unless they are leaf (terminal) nodes
         as they will be executed implicitly when executing their downstream nodes.
 
+        The DAG is memoized and must not be modified in place.
+
         Returns
         -------
         nx.DiGraph
             A directed acyclic graph representing the execution plan.
         """
+        return self._get_resolved("dag", self._build_dag)
+
+    def _build_dag(self) -> nx.DiGraph:
         nodes_dag = self.nodes_dag
         nodes_dict = self.nodes_dict
 
@@ -280,17 +407,23 @@ class PipelineExecutionPlan(BaseModel):
         -------
         output: list[PipelineTask]
         """
+        return list(self._get_resolved("tasks", self._build_tasks))
+
+    def _build_tasks(self) -> tuple[PipelineTask, ...]:
+        dag = self.dag
         tasks = []
-        for dag_node, attr in self.dag.nodes(data=True):
-            tasks += [
-                PipelineTask(
-                    name=dag_node,
-                    pipeline=self.pipeline,
-                    node_names=attr["node_names"],
-                )
+        for dag_node, attr in dag.nodes(data=True):
+            task = PipelineTask(
+                name=dag_node,
+                pipeline=self.pipeline,
+                node_names=attr["node_names"],
+            )
+            task._upstream_task_names = [
+                u for u, _ in dag.in_edges(dag_node) if u != dag_node
             ]
+            tasks += [task]
 
-        return tasks
+        return tuple(tasks)
 
     @property
     def tasks_dict(self):
@@ -20,12 +20,15 @@ from laktory.exceptions import DataQualityExpectationsNotSupported
 from laktory.models.basemodel import BaseModel
 from laktory.models.dataframe.dataframetransformer import DataFrameTransformer
 from laktory.models.dataquality.expectation import DataQualityExpectation
+from laktory.models.dataquality.expectation import run_checks
 from laktory.models.datasinks import DataSinksUnion
 from laktory.models.datasinks import TableDataSink
 from laktory.models.datasources import BaseDataSource
 from laktory.models.datasources import DataSourcesUnion
 from laktory.models.datasources import PipelineNodeDataSource
 from laktory.models.datasources import TableDataSource
+from laktory.models.pipeline._batchmarker import BatchMarker
+from laktory.models.pipeline.pipelinenodecacheoptions import PipelineNodeCacheOptions
 from laktory.models.pipelinechild import PipelineChild
 from laktory.typing import AnyFrame
 
@@ -118,6 +121,14 @@ class PipelineNode(BaseModel, PipelineChild):
         """,
         validation_alias=AliasChoices("execution_task_name", "execution_task_name_"),
     )
+    cache: bool | PipelineNodeCacheOptions = Field(
+        False,
+        description="""
+        If `True` or cache options are provided, output DataFrame is materialized once and re-used by sinks and 
+        downstream nodes. When executed as part of a pipeline, the cache is released after the last downstream node 
+        has been executed.
+        """,
+    )
     comment: str = Field(
         None,
         description="Comment for the associated table or view",
@@ -155,6 +166,15 @@ class PipelineNode(BaseModel, PipelineChild):
         None,
         description="Definition of the data sink(s). Set `is_quarantine` to True to store node quarantine DataFrame.",
     )
+    shared_sinks_checkpoint: bool = Field(
+        False,
+        description="""
+        If `True`, multiple sinks of a Spark streaming node are written from a single `foreachBatch` stream with a 
+        checkpoint stored in `{root_path}/checkpoints/sinks`, reading the source only once. Otherwise, each sink is 
+        written by its own stream using the sink checkpoint. Enabling this option on an existing node starts the 
+        stream from a new checkpoint and re-processes the complete source.
+        """,
+    )
     tags: list[str] = Field([], description="Node tags for selective execution.")
     time_column: str | None = Field(
         None,
@@ -181,6 +201,10 @@ class PipelineNode(BaseModel, PipelineChild):
     _stage_df: Any = None
     _output_df: Any = None
     _quarantine_df: Any = None
+    _uncached_df: Any = None
+    _keep_filter: Any = None
+    _quarantine_filter: Any = None
+    _micro_batch_expectations: list[DataQualityExpectation] = None
 
     @model_validator(mode="after")
     def push_primary_keys(self) -> Any:
@@ -193,6 +217,15 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return self
 
+    @model_validator(mode="after")
+    def invalidate_pipeline_cache(self) -> Any:
+        # Node re-assigned fields (e.g. source) may change pipeline DAG
+        pl = self._parent
+        if pl is not None and hasattr(pl, "invalidate_cache"):
+            pl.invalidate_cache()
+
+        return self
+
     @model_validator(mode="after")
     def validate_expectations(self):
         if self.source and self.source.as_stream:
@@ -441,6 +474,24 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return None
 
+    @property
+    def sinks_checkpoint_path(self) -> Path | None:
+        """
+        Checkpoint of the stream writing micro-batches to all the sinks of a
+        streaming node. A single sink uses its own checkpoint. Multiple sinks
+        share a checkpoint only if `shared_sinks_checkpoint` is `True`.
+        """
+        if not self.sinks:
+            return None
+
+        if len(self.sinks) == 1:
+            return self.sinks[0].checkpoint_path
+
+        if self.shared_sinks_checkpoint and self.root_path:
+            return Path(self.root_path) / "checkpoints" / "sinks"
+
+        return None
+
     @property
     def checks(self):
         return [e.check for e in self.expectations]
@@ -483,6 +534,96 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return sources
 
+    # ----------------------------------------------------------------------- #
+    # Cache                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def cache_options(self) -> PipelineNodeCacheOptions | None:
+        """Output DataFrame cache options. `None` if cache is disabled."""
+        if isinstance(self.cache, PipelineNodeCacheOptions):
+            return self.cache
+        if self.cache:
+            return PipelineNodeCacheOptions()
+        return None
+
+    @property
+    def cache_path(self) -> Path:
+        """Path of the Arrow IPC file used to spill cached Polars DataFrame"""
+        return self.root_path / "cache" / "output.arrow"
+
+    @property
+    def is_cached(self) -> bool:
+        """`True` if output DataFrame is currently cached"""
+        return self._uncached_df is not None
+
+    def _cache_output_df(self) -> None:
+        options = self.cache_options
+        if options is None or self._output_df is None or self.is_view:
+            return
+
+        df = self._output_df
+        df_native = nw.to_native(df)
+        backend = DataFrameBackends.from_df(df)
+
+        if backend == DataFrameBackends.PYSPARK:
+            from pyspark import StorageLevel
+
+            if df_native.isStreaming:
+                logger.info(f"Node {self.name} output is streaming. Skipping cache.")
+                return
+
+            logger.info(
+                f"Persisting node {self.name} output with storage level {options.storage_level}"
+            )
+            df_native = df_native.persist(getattr(StorageLevel, options.storage_level))
+
+        elif backend == DataFrameBackends.POLARS:
+            import polars as pl
+
+            if options.storage_level == "DISK_ONLY":
+                path = self.cache_path
+                logger.info(f"Spilling node {self.name} output to {path}")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                df_native.lazy().sink_ipc(path, engine="streaming")
+                df_native = pl.scan_ipc(path, memory_map=True)
+            else:
+                logger.info(f"Collecting node {self.name} output in memory")
+                df_native = df_native.lazy().collect().lazy()
+
+        else:
+            logger.info(f"Cache not supported for backend {backend}. Skipping cache.")
+            return
+
+        self._uncached_df = df
+        self._output_df = nw.from_native(df_native)
+
+    def release_cache(self, remove_cache_file: bool = True) -> None:
+        """
+        Release cached output DataFrame. The output DataFrame is reverted to
+        its un-materialized (lazy) definition.
+
+        Parameters
+        ----------
+        remove_cache_file:
+            If `False`, the file used to spill the Polars DataFrame is kept as
+            downstream nodes output DataFrames might still lazily scan it.
+        """
+        if not self.is_cached:
+            return
+
+        logger.info(f"Releasing node {self.name} output cache")
+
+        df_native = nw.to_native(self._output_df)
+        if hasattr(df_native, "unpersist"):
+            df_native.unpersist()
+
+        self._output_df = self._uncached_df
+        self._uncached_df = None
+
+        if remove_cache_file and self.cache_path.exists():
+            os.remove(self.cache_path)
+
     # ----------------------------------------------------------------------- #
     # Execution                                                               #
     # ----------------------------------------------------------------------- #
@@ -494,6 +635,14 @@ class PipelineNode(BaseModel, PipelineChild):
             for s in self.sinks:
                 s.purge()
 
+            # Checkpoint shared by sinks
+            if len(self.sinks) > 1 and self.sinks_checkpoint_path:
+                if os.path.exists(self.sinks_checkpoint_path):
+                    logger.info(
+                        f"Deleting sinks checkpoint at {self.sinks_checkpoint_path}",
+                    )
+                    shutil.rmtree(self.sinks_checkpoint_path)
+
         if self.expectations_checkpoint_path:
             if os.path.exists(self.expectations_checkpoint_path):
                 logger.info(
@@ -615,14 +764,22 @@ class PipelineNode(BaseModel, PipelineChild):
             )
 
         # Check expectations
+        self.release_cache()
         self._output_df = self._stage_df
         self._quarantine_df = None
-        self.check_expectations()
+        micro_batches = self._use_micro_batches(write_sinks=write_sinks)
+        self.check_expectations(with_sinks=micro_batches)
+
+        # Cache output
+        self._cache_output_df()
 
         # Output and Quarantine to Sinks
         if write_sinks and self.sinks:
             view_definition = self.view_definition
 
+            def _is_update_metadata(s):
+                return update_tables_metadata and s.metadata and not self.is_dlt_execute
+
             for s in self.sinks:
                 # Get DataFrame
                 _df = self._output_df
@@ -632,27 +789,42 @@ class PipelineNode(BaseModel, PipelineChild):
                 # Create Sink
                 s.create(df=_df)
 
-                _is_update_metadata = (
-                    update_tables_metadata and s.metadata and not self.is_dlt_execute
-                )
-
                 if self.is_view:
                     s.write(view_definition=view_definition)
-                    if _is_update_metadata:
+                    if _is_update_metadata(s):
                         s.metadata.execute()
                     self._output_df = s.as_source().read()
                 else:
-                    if _is_update_metadata:
+                    if _is_update_metadata(s):
                         s.metadata.execute()
-                    s.write(df=self._output_df)
+
+                    # Micro-batches are written to all sinks at once
+                    if micro_batches:
+                        continue
+
+                    s.write(df=_df)
 
                     # Metadata update required because of schema overwrite
-                    if _is_update_metadata and s.metadata.update_required:
+                    if _is_update_metadata(s) and s.metadata.update_required:
                         s.metadata.execute()
 
+            if micro_batches:
+                if len(self.sinks) == 1 or self.shared_sinks_checkpoint:
+                    self._write_micro_batches(self.sinks, self.sinks_checkpoint_path)
+                else:
+                    for s in self.sinks:
+                        self._write_micro_batches([s], s.checkpoint_path)
+                for s in self.sinks:
+                    if _is_update_metadata(s) and s.metadata.update_required:
+                        s.metadata.execute()
+
+        # Release upstream caches no longer required by the execution plan
+        if pl and pl._plan:
+            pl._plan.release_caches(self.name)
+
         return self._output_df
 
-    def check_expectations(self):
+    def check_expectations(self, with_sinks: bool = False):
         """
         Check expectations, raise errors, warnings where required and build
         filtered and quarantine DataFrames.
@@ -662,11 +834,21 @@ class PipelineNode(BaseModel, PipelineChild):
 
         * Raising error on Failure when expectation is supported by DLT
         * Dropping rows when expectation is supported by DLT
+
+        Parameters
+        ----------
+        with_sinks:
+            If `True`, expectations on a streaming DataFrame are checked on
+            each micro-batch written to the sinks instead of by a separate
+            stream, so that the source is only read once.
         """
 
         # Data Quality Checks
         qfilter = None  # Quarantine filter
         kfilter = None  # Keep filter
+        self._keep_filter = None
+        self._quarantine_filter = None
+        self._micro_batch_expectations = None
         if self._stage_df is None:
             # Node without source or transformer
             return
@@ -675,14 +857,13 @@ class PipelineNode(BaseModel, PipelineChild):
             return
 
         def _batch_check(df, node):
-            for e in node.expectations:
-                # Run Check: this only warn or raise exceptions.
-                if not e.is_dlt_managed:
-                    e.run_check(
-                        df,
-                        raise_or_warn=True,
-                        node=node,
-                    )
+            # Run Checks in a single pass: this only warn or raise exceptions.
+            run_checks(
+                [e for e in node.expectations if not e.is_dlt_managed],
+                df,
+                raise_or_warn=True,
+                node=node,
+            )
 
         def _stream_check(batch_df, batch_id, node):
             _batch_check(
@@ -719,13 +900,22 @@ class PipelineNode(BaseModel, PipelineChild):
                     f"DataFrame backend {backend} is not supported for streaming operations"
                 )
 
-            if self.expectations_checkpoint_path is None:
-                raise ValueError(
-                    f"Expectations Checkpoint not specified for node '{self.name}'"
-                )
-
             # TODO: Refactor for backend other than spark
-            if not skip:
+            if skip:
+                logger.info("Expectations are checked by DLT")
+
+            elif with_sinks:
+                logger.info("Expectations are checked on sinks micro-batches")
+                self._micro_batch_expectations = [
+                    e for e in self.expectations if not e.is_dlt_managed
+                ]
+
+            else:
+                if self.expectations_checkpoint_path is None:
+                    raise ValueError(
+                        f"Expectations Checkpoint not specified for node '{self.name}'"
+                    )
+
                 query = (
                     self._stage_df.to_native()
                     .writeStream.foreachBatch(
@@ -760,6 +950,9 @@ class PipelineNode(BaseModel, PipelineChild):
                 else:
                     qfilter = qfilter & _filter
 
+        self._keep_filter = kfilter
+        self._quarantine_filter = qfilter
+
         if qfilter is not None:
             logger.info("Building quarantine DataFrame")
             self._quarantine_df = self._stage_df.filter(qfilter)
@@ -771,3 +964,103 @@ class PipelineNode(BaseModel, PipelineChild):
             self._output_df = self._stage_df.filter(kfilter)
         else:
             self._output_df = self._stage_df
+
+    def _use_micro_batches(self, write_sinks: bool = True) -> bool:
+        """
+        Sinks of a Spark streaming node are written from `foreachBatch` streams
+        when the node has expectations or multiple sinks sharing a checkpoint
+        and all sinks support micro-batch writes.
+        """
+        if not (write_sinks and self.sinks) or self.is_view or self._stage_df is None:
+            return False
+        if not getattr(nw.to_native(self._stage_df), "isStreaming", False):
+            return False
+        shared = len(self.sinks) > 1 and self.shared_sinks_checkpoint
+        if not (shared or self.expectations):
+            return False
+        return all(s.supports_micro_batch for s in self.sinks)
+
+    def _write_micro_batches(self, sinks: list, checkpoint_path: Path) -> None:
+        """
+        Write streaming stage DataFrame to `sinks` using a single `foreachBatch`
+        stream. Each micro-batch is persisted, checked against expectations and
+        written to each sink after filtering output or quarantine rows. The last
+        micro-batch written to each sink is recorded so that a sink is not
+        written twice when a micro-batch is replayed after a failure.
+
+        Parameters
+        ----------
+        sinks:
+            Sinks written by the stream
+        checkpoint_path:
+            Checkpoint of the stream
+        """
+        if checkpoint_path is None:
+            raise ValueError(
+                f"Checkpoint location not specified for node '{self.name}'"
+            )
+        checkpoint_path = Path(checkpoint_path)
+
+        expectations = self._micro_batch_expectations or []
+        filters = []
+        markers = []
+        for s in sinks:
+            _filter = self._keep_filter
+            if s.is_quarantine:
+                _filter = self._quarantine_filter
+            filters += [_filter]
+            # DELTA writes are already idempotent (txnAppId / txnVersion)
+            marker = None
+            if not s.is_micro_batch_idempotent:
+                marker = BatchMarker(checkpoint_path / "sinks" / s._uuid)
+            markers += [marker]
+
+        checks = [None] * len(expectations)
+
+        def _write_batch(batch_df, batch_id):
+            persist = len(sinks) > 1
+            if persist:
+                batch_df.persist()
+
+            try:
+                df = nw.from_native(batch_df)
+
+                # Checks
+                if expectations:
+                    run_checks(expectations, df, raise_or_warn=True, node=self)
+                    for i, e in enumerate(expectations):
+                        if checks[i] is not None:
+                            e._check = checks[i] + e._check
+                        checks[i] = e._check
+
+                # Write
+                for s, _filter, marker in zip(sinks, filters, markers):
+                    last_batch_id = None if marker is None else marker.get()
+                    if last_batch_id is not None and last_batch_id >= batch_id:
+                        logger.info(
+                            f"Micro-batch {batch_id} already written to sink '{s._id}'. Skipping."
+                        )
+                        continue
+
+                    _df = df
+                    if _filter is not None:
+                        _df = df.filter(_filter)
+                    s.write_micro_batch(_df, batch_id=batch_id)
+                    if marker is not None:
+                        marker.set(batch_id)
+
+            finally:
+                if persist:
+                    batch_df.unpersist()
+
+        logger.info(
+            f"Writing micro-batches to {len(sinks)} sink(s) with checkpoint {checkpoint_path}"
+        )
+        query = (
+            self._stage_df.to_native()
+            .writeStream.foreachBatch(_write_batch)
+            .trigger(availableNow=True)
+            .options(checkpointLocation=checkpoint_path.as_posix())
+            .start()
+        )
+        query.awaitTermination()
@@ -0,0 +1,47 @@
+from typing import Literal
+
+from pydantic import Field
+
+from laktory.models.basemodel import BaseModel
+
+
+class PipelineNodeCacheOptions(BaseModel):
+    """
+    Pipeline node output DataFrame cache options. When enabled, the node output
+    is materialized once after data quality checks so that sinks and downstream
+    nodes reading it do not re-compute the full upstream plan. When executed
+    as part of a pipeline, the cache is released once the last downstream node
+    of the execution plan has been executed.
+
+    With Spark, the DataFrame is persisted using the selected storage level.
+    With Polars, the DataFrame is collected in memory, unless `DISK_ONLY` is
+    selected in which case it is spilled to an Arrow IPC file stored in the
+    node root path and scanned lazily.
+
+    Examples
+    --------
+    ```py
+    import laktory as lk
+
+    node = lk.models.PipelineNode(
+        name="slv_stock_prices",
+        source={"node_name": "brz_stock_prices"},
+        cache={"storage_level": "DISK_ONLY"},
+    )
+    print(node.cache_options.storage_level)
+    # > DISK_ONLY
+    ```
+    """
+
+    storage_level: Literal[
+        "MEMORY_ONLY",
+        "MEMORY_AND_DISK",
+        "MEMORY_AND_DISK_DESER",
+        "DISK_ONLY",
+    ] = Field(
+        "MEMORY_AND_DISK",
+        description="""
+        Storage level of the cached DataFrame. Spark storage level names are used. With Polars, all levels except
+        `DISK_ONLY` collect the DataFrame in memory.
+        """,
+    )
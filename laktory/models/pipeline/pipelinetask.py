@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from pydantic import Field
 from pydantic import SkipValidation
 
@@ -16,6 +18,44 @@ logger = get_logger(__name__)
 # --------------------------------------------------------------------------- #
 
 
+def execute_nodes(
+    pipeline: Pipeline,
+    funcs: dict[str, Callable[[str], None]],
+    max_workers: int | None = None,
+) -> None:
+    """
+    Execute pipeline nodes, each with its own function. When `max_workers` is
+    greater than 1, nodes are executed concurrently on a single thread pool as
+    soon as their upstream nodes have completed.
+
+    Parameters
+    ----------
+    pipeline:
+        Pipeline
+    funcs:
+        Mapping between each node name and the function executing it, given
+        its name. Nodes are executed in the order of the mapping when executed
+        sequentially.
+    max_workers:
+        Maximum number of nodes executed concurrently.
+    """
+    from laktory.models.pipeline._scheduler import execute_dag
+
+    # Nodes may depend on each other through nodes that are not executed
+    # explicitly (nodes without sinks), hence the use of ancestors.
+    upstreams = {node_name: set() for node_name in funcs}
+    if max_workers is not None and max_workers > 1 and len(funcs) > 1:
+        index = pipeline.selection_index
+        for node_name in funcs:
+            upstreams[node_name] = index.ancestors(node_name) & upstreams.keys()
+
+    execute_dag(
+        upstreams=upstreams,
+        func=lambda node_name: funcs[node_name](node_name),
+        max_workers=max_workers,
+    )
+
+
 # --------------------------------------------------------------------------- #
 # Main Class                                                                  #
 # --------------------------------------------------------------------------- #
@@ -37,6 +77,7 @@ class PipelineTask(BaseModel):
     node_names: list[str] = Field(
         ..., description="""List of node names in sorted order of execution"""
     )
+    _upstream_task_names: list[str] = None
 
     def execute(
         self,
@@ -44,9 +85,13 @@ class PipelineTask(BaseModel):
         full_refresh: bool = False,
         named_dfs: dict[str, AnyFrame] = None,
         update_tables_metadata: bool = True,
+        max_workers: int | None = None,
+        skip_unchanged: bool = False,
     ) -> None:
         """
-        Execute the pipeline task.
+        Execute the pipeline task. When `max_workers` is greater than 1, task
+        nodes are executed concurrently as soon as their upstream nodes have
+        completed.
 
         Parameters
         ----------
@@ -59,15 +104,75 @@ class PipelineTask(BaseModel):
             Named DataFrames to be passed to pipeline nodes transformer.
         update_tables_metadata:
             Update tables metadata
+        max_workers:
+            Maximum number of nodes executed concurrently. Nodes are executed
+            sequentially if `None` or `1`.
+        skip_unchanged:
+            If `True`, nodes with sinks whose configuration, sources and
+            upstream nodes have not changed since their last successful
+            execution are skipped.
         """
-
         logger.info(f"Executing pipeline task '{self.name}'")
 
-        # Execute nodes
-        for node_name in self.node_names:
-            node = self.pipeline.nodes_dict[node_name]
-            if named_dfs is None:
-                named_dfs = {}
+        # Implicit executions are tracked by the pipeline execution if any
+        plan = self.pipeline._plan
+        standalone = plan is not None and plan._implicit_executed is None
+        if standalone:
+            plan._init_implicit_executions()
+
+        execute_node = self._get_node_executor(
+            write_sinks=write_sinks,
+            full_refresh=full_refresh,
+            named_dfs=named_dfs,
+            update_tables_metadata=update_tables_metadata,
+            skip_unchanged=skip_unchanged,
+        )
+
+        try:
+            execute_nodes(
+                pipeline=self.pipeline,
+                funcs={node_name: execute_node for node_name in self.node_names},
+                max_workers=max_workers,
+            )
+        finally:
+            if standalone:
+                plan._clear_implicit_executions()
+
+    def _get_node_executor(
+        self,
+        write_sinks=True,
+        full_refresh: bool = False,
+        named_dfs: dict[str, AnyFrame] | None = None,
+        update_tables_metadata: bool = True,
+        skip_unchanged: bool = False,
+    ) -> Callable[[str], None]:
+        """
+        Function executing a task node, given its name. See `execute` for
+        parameters.
+        """
+        from laktory.models.pipeline._runstate import PipelineRunState
+
+        if named_dfs is None:
+            named_dfs = {}
+
+        nodes_dict = self.pipeline.nodes_dict
+        plan = self.pipeline._plan
+
+        # Run state
+        run_state = None
+        if skip_unchanged and write_sinks and not full_refresh and not named_dfs:
+            run_state = getattr(plan, "_run_state", None)
+            if run_state is None:
+                run_state = PipelineRunState(self.pipeline.run_state_path)
+
+        def _execute_node(node_name):
+            node = nodes_dict[node_name]
+
+            if run_state is not None and run_state.is_unchanged(node):
+                logger.info(f"Node '{node_name}' is unchanged. Skipping execution.")
+                if plan is not None:
+                    plan.release_caches(node_name)
+                return
 
             node.execute(
                 write_sinks=write_sinks,
@@ -76,9 +181,17 @@ class PipelineTask(BaseModel):
                 update_tables_metadata=update_tables_metadata,
             )
 
+            if run_state is not None:
+                run_state.set_success(node)
+
+        return _execute_node
+
     @property
     def upstream_task_names(self) -> list[str]:
         """Get upstream task names"""
+        if self._upstream_task_names is not None:
+            return list(self._upstream_task_names)
+
         plan = self.pipeline._plan
         names = []
         for edges in plan.dag.in_edges(self.name):
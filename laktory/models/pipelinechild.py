@@ -1,3 +1,4 @@
+from typing import Any
 from typing import Literal
 
 from pydantic import AliasChoices
@@ -41,24 +42,22 @@ class PipelineChild(BaseChild):
     def dataframe_backend(self) -> DataFrameBackends:
         backend = self.dataframe_backend_
 
-        # Direct value
-        if backend is not None:
-            if not isinstance(backend, DataFrameBackends):
-                try:
-                    backend = DataFrameBackends(backend)
-                except ValueError:
-                    # TODO: Review why this might occur
-                    pass
-
-            return backend
-
         # Value from parent
-        parent = self._parent
-        if parent is not None:
-            return parent.dataframe_backend
+        if backend is None:
+            backend = self._get_parent_value("dataframe_backend_")
 
         # Value from settings
-        return DataFrameBackends(settings.dataframe_backend.upper())
+        if backend is None:
+            return DataFrameBackends(settings.dataframe_backend.upper())
+
+        if not isinstance(backend, DataFrameBackends):
+            try:
+                backend = DataFrameBackends(backend)
+            except ValueError:
+                # TODO: Review why this might occur
+                pass
+
+        return backend
 
     @computed_field(description="dataframe_api")
     @property
@@ -68,9 +67,9 @@ class PipelineChild(BaseChild):
             return self.dataframe_api_
 
         # Value from parent
-        parent = self._parent
-        if parent is not None:
-            return parent.dataframe_api
+        api = self._get_parent_value("dataframe_api_")
+        if api:
+            return api
 
         # Value from settings
         return settings.dataframe_api.upper()
@@ -79,30 +78,45 @@ class PipelineChild(BaseChild):
     def parent_pipeline(self):
         from laktory.models.pipeline.pipeline import Pipeline
 
-        def _get_pl(o):
-            parent = getattr(o, "_parent", None)
-            if parent is None:
-                return None
-
-            if isinstance(parent, Pipeline):
-                return parent
-
-            return _get_pl(parent)
-
-        return _get_pl(self)
+        return self._find_parent(Pipeline)
 
     @property
     def parent_pipeline_node(self):
         from laktory.models.pipeline.pipelinenode import PipelineNode
 
-        def _get_pl(o):
-            parent = getattr(o, "_parent", None)
+        return self._find_parent(PipelineNode)
+
+    # ----------------------------------------------------------------------- #
+    # Parent Chain                                                            #
+    # ----------------------------------------------------------------------- #
+
+    def _get_parent_value(self, name: str) -> Any:
+        """
+        Value of field `name` set on the closest ancestor, `None` if not set
+        on any ancestor. Settings are not resolved here so that they are
+        always read at access time.
+        """
+
+        def _resolve():
+            parent = self._parent
             if parent is None:
                 return None
+            value = getattr(parent, name, None)
+            if value is None and isinstance(parent, PipelineChild):
+                value = parent._get_parent_value(name)
+            return value
 
-            if isinstance(parent, PipelineNode):
-                return parent
+        return self._get_parent_cached(name, _resolve)
 
-            return _get_pl(parent)
+    def _find_parent(self, cls: type) -> Any:
+        """Closest ancestor of type `cls`, `None` if not found"""
+
+        def _resolve():
+            parent = self._parent
+            if parent is None or isinstance(parent, cls):
+                return parent
+            if isinstance(parent, PipelineChild):
+                return parent._find_parent(cls)
+            return None
 
-        return _get_pl(self)
+        return self._get_parent_cached(f"parent_{cls.__name__}", _resolve)
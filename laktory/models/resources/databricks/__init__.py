@@ -1,55 +1,121 @@
-from .accesscontrol import AccessControl
-from .accesscontrolruleset import AccessControlRuleSet
-from .alert import Alert
-from .app import App
-from .catalog import Catalog
-from .cluster import Cluster
-from .clusterpolicy import ClusterPolicy
-from .connection import Connection
-from .currentuser import CurrentUser
-from .dashboard import Dashboard
-from .dbfsfile import DbfsFile
-from .directory import Directory
-from .externallocation import ExternalLocation
-from .grant import Grant
-from .grants import Grants
-from .group import Group
-from .groupmember import GroupMember
-from .job import Job
-from .metastore import Metastore
-from .metastoreassignment import MetastoreAssignment
-from .metastoredataaccess import MetastoreDataAccess
-from .mlflowexperiment import MLflowExperiment
-from .mlflowmodel import MLflowModel
-from .mlflowwebhook import MLflowWebhook
-from .mwsnccbinding import MwsNccBinding
-from .mwsnetworkconnectivityconfig import MwsNetworkConnectivityConfig
-from .mwspermissionassignment import MwsPermissionAssignment
-from .notebook import Notebook
-from .notificationdestination import NotificationDestination
-from .obotoken import OboToken
-from .permissions import Permissions
-from .pipeline import Pipeline
-from .pythonpackage import PythonPackage
-from .qualitymonitor import QualityMonitor
-from .query import Query
-from .recipient import Recipient
-from .repo import Repo
-from .schema import Schema
-from .secret import Secret
-from .secretacl import SecretAcl
-from .secretscope import SecretScope
-from .serviceprincipal import ServicePrincipal
-from .serviceprincipalrole import ServicePrincipalRole
-from .share import Share
-from .storagecredential import StorageCredential
-from .table import Table
-from .user import User
-from .userrole import UserRole
-from .vectorsearchendpoint import VectorSearchEndpoint
-from .vectorsearchindex import VectorSearchIndex
-from .volume import Volume
-from .warehouse import Warehouse
-from .workspacebinding import WorkspaceBinding
-from .workspacefile import WorkspaceFile
-from .workspacetree import WorkspaceTree
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+# Resources imported on first access (PEP 562)
+_RESOURCES = {
+    "AccessControl": "accesscontrol",
+    "AccessControlRuleSet": "accesscontrolruleset",
+    "Alert": "alert",
+    "App": "app",
+    "Catalog": "catalog",
+    "Cluster": "cluster",
+    "ClusterPolicy": "clusterpolicy",
+    "Connection": "connection",
+    "CurrentUser": "currentuser",
+    "Dashboard": "dashboard",
+    "DbfsFile": "dbfsfile",
+    "Directory": "directory",
+    "ExternalLocation": "externallocation",
+    "Grant": "grant",
+    "Grants": "grants",
+    "Group": "group",
+    "GroupMember": "groupmember",
+    "Job": "job",
+    "Metastore": "metastore",
+    "MetastoreAssignment": "metastoreassignment",
+    "MetastoreDataAccess": "metastoredataaccess",
+    "MLflowExperiment": "mlflowexperiment",
+    "MLflowModel": "mlflowmodel",
+    "MLflowWebhook": "mlflowwebhook",
+    "MwsNccBinding": "mwsnccbinding",
+    "MwsNetworkConnectivityConfig": "mwsnetworkconnectivityconfig",
+    "MwsPermissionAssignment": "mwspermissionassignment",
+    "Notebook": "notebook",
+    "NotificationDestination": "notificationdestination",
+    "OboToken": "obotoken",
+    "Permissions": "permissions",
+    "Pipeline": "pipeline",
+    "PythonPackage": "pythonpackage",
+    "QualityMonitor": "qualitymonitor",
+    "Query": "query",
+    "Recipient": "recipient",
+    "Repo": "repo",
+    "Schema": "schema",
+    "Secret": "secret",
+    "SecretAcl": "secretacl",
+    "SecretScope": "secretscope",
+    "ServicePrincipal": "serviceprincipal",
+    "ServicePrincipalRole": "serviceprincipalrole",
+    "Share": "share",
+    "StorageCredential": "storagecredential",
+    "Table": "table",
+    "User": "user",
+    "UserRole": "userrole",
+    "VectorSearchEndpoint": "vectorsearchendpoint",
+    "VectorSearchIndex": "vectorsearchindex",
+    "Volume": "volume",
+    "Warehouse": "warehouse",
+    "WorkspaceBinding": "workspacebinding",
+    "WorkspaceFile": "workspacefile",
+    "WorkspaceTree": "workspacetree",
+}
+
+__getattr__, __dir__ = attach(__name__, objects=_RESOURCES)
+
+if TYPE_CHECKING:
+    from .accesscontrol import AccessControl
+    from .accesscontrolruleset import AccessControlRuleSet
+    from .alert import Alert
+    from .app import App
+    from .catalog import Catalog
+    from .cluster import Cluster
+    from .clusterpolicy import ClusterPolicy
+    from .connection import Connection
+    from .currentuser import CurrentUser
+    from .dashboard import Dashboard
+    from .dbfsfile import DbfsFile
+    from .directory import Directory
+    from .externallocation import ExternalLocation
+    from .grant import Grant
+    from .grants import Grants
+    from .group import Group
+    from .groupmember import GroupMember
+    from .job import Job
+    from .metastore import Metastore
+    from .metastoreassignment import MetastoreAssignment
+    from .metastoredataaccess import MetastoreDataAccess
+    from .mlflowexperiment import MLflowExperiment
+    from .mlflowmodel import MLflowModel
+    from .mlflowwebhook import MLflowWebhook
+    from .mwsnccbinding import MwsNccBinding
+    from .mwsnetworkconnectivityconfig import MwsNetworkConnectivityConfig
+    from .mwspermissionassignment import MwsPermissionAssignment
+    from .notebook import Notebook
+    from .notificationdestination import NotificationDestination
+    from .obotoken import OboToken
+    from .permissions import Permissions
+    from .pipeline import Pipeline
+    from .pythonpackage import PythonPackage
+    from .qualitymonitor import QualityMonitor
+    from .query import Query
+    from .recipient import Recipient
+    from .repo import Repo
+    from .schema import Schema
+    from .secret import Secret
+    from .secretacl import SecretAcl
+    from .secretscope import SecretScope
+    from .serviceprincipal import ServicePrincipal
+    from .serviceprincipalrole import ServicePrincipalRole
+    from .share import Share
+    from .storagecredential import StorageCredential
+    from .table import Table
+    from .user import User
+    from .userrole import UserRole
+    from .vectorsearchendpoint import VectorSearchEndpoint
+    from .vectorsearchindex import VectorSearchIndex
+    from .volume import Volume
+    from .warehouse import Warehouse
+    from .workspacebinding import WorkspaceBinding
+    from .workspacefile import WorkspaceFile
+    from .workspacetree import WorkspaceTree
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from typing import Union
@@ -7,6 +8,8 @@ from pydantic import Field
 from pydantic import computed_field
 
 from laktory import settings
+from laktory._build import hash_content
+from laktory._build import hash_sources
 from laktory._logger import get_logger
 from laktory.models.basemodel import BaseModel
 from laktory.models.resources.databricks.accesscontrol import AccessControl
@@ -14,6 +17,9 @@ from laktory.models.resources.terraformresource import TerraformResource
 
 logger = get_logger(__name__)
 
+# Sources hash and wheel filename of the last build, stored in `dist`
+BUILD_INFO_FILENAME = ".laktory-build.json"
+
 
 class PythonPackage(BaseModel, TerraformResource):
     """
@@ -117,6 +123,20 @@ class PythonPackage(BaseModel, TerraformResource):
             package_root = Path(self.config_filepath).parent
             dist_path = package_root / "dist"
 
+            # Skip build if sources are unchanged since last build
+            sources_hash = hash_sources(package_root)
+            sources_hash = hash_content(f"{sources_hash}{self.build_command}")
+            build_filepath = dist_path / BUILD_INFO_FILENAME
+            if build_filepath.exists():
+                build_info = json.loads(build_filepath.read_text())
+                wheel_path = dist_path / build_info.get("wheel", "")
+                if build_info.get("hash") == sources_hash and wheel_path.is_file():
+                    logger.info(
+                        f"Package '{self.package_name}' sources are unchanged. Using {wheel_path}"
+                    )
+                    self._wheel_path = wheel_path.absolute().resolve()
+                    return self._wheel_path
+
             worker = Worker()
 
             cmd = self.build_command.split(" ")
@@ -139,6 +159,10 @@ class PythonPackage(BaseModel, TerraformResource):
 
             self._wheel_path = file
 
+            build_filepath.write_text(
+                json.dumps({"hash": sources_hash, "wheel": file.name})
+            )
+
             # Renaming wheel file
             # if self.wheel_filename:
             #     new_path = self._wheel_path.with_name(self.wheel_filename)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Literal
 from typing import Union
@@ -351,7 +352,12 @@ class Stack(BaseModel):
     # Methods                                                                 #
     # ----------------------------------------------------------------------- #
 
-    def build(self, env_name: str | None, inject_vars: bool = True):
+    def build(
+        self,
+        env_name: str | None,
+        inject_vars: bool = True,
+        max_workers: int | None = None,
+    ):
         """
         Build stack artifacts before preview or deploy.
 
@@ -362,12 +368,20 @@ class Stack(BaseModel):
         project-local path (e.g. ``.laktory/.resources/``) so that DABs can
         sync the files to the workspace.
 
+        Python packages wheels, then pipeline config files, are built
+        concurrently. Wheels are not rebuilt when the package sources are
+        unchanged and config files are only re-written when their content
+        changed.
+
         Parameters
         ----------
         env_name:
             Name of the environment
         inject_vars:
             Inject stack variables
+        max_workers:
+            Maximum number of artifacts built concurrently. If `None`, the
+            thread pool default is used. Set to `1` to build sequentially.
         """
 
         logger.info("Building artifacts...")
@@ -379,12 +393,20 @@ class Stack(BaseModel):
         if env.resources is None:
             return
 
-        for k, r in env.resources._get_all(providers_excluded=True).items():
+        resources = env.resources._get_all(providers_excluded=True).values()
+
+        # Packages sharing the same sources are built by the same worker
+        packages = {}
+        for r in resources:
             if isinstance(r, PythonPackage):
-                r.build()
+                packages.setdefault(r.config_filepath, []).append(r)
+
+        def _build_packages(_packages):
+            for p in _packages:
+                p.build()
 
-        logger.info("Writing pipeline config files...")
-        for k, r in env.resources._get_all(providers_excluded=True).items():
+        config_files = []
+        for r in resources:
             if isinstance(r, Pipeline):
                 orchestrator = r.orchestrator
                 if not orchestrator:
@@ -392,7 +414,19 @@ class Stack(BaseModel):
 
                 config_file = getattr(r.orchestrator, "config_file", None)
                 if config_file:
-                    config_file.build()
+                    config_files += [config_file]
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="laktory-build"
+        ) as executor:
+            futures = [executor.submit(_build_packages, p) for p in packages.values()]
+            for future in futures:
+                future.result()
+
+            logger.info("Writing pipeline config files...")
+            futures = [executor.submit(f.build) for f in config_files]
+            for future in futures:
+                future.result()
 
         logger.info("Build completed.")
 
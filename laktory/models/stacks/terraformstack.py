@@ -1,22 +1,159 @@
+import hashlib
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 from typing import Union
 
 from pydantic import model_validator
+from pydantic_core import to_json
 
 from laktory._logger import get_logger
-from laktory._parsers import _resolve_values
 from laktory._settings import settings
 from laktory._useragent import set_databricks_sdk_upstream
 from laktory.constants import CACHE_ROOT
 from laktory.models.basemodel import BaseModel
-from laktory.models.resources.providers.baseprovider import BaseProvider
 
 logger = get_logger(__name__)
 
+REFERENCE_PATTERN = re.compile(r"\$\{resources\.([^}]*)\}")
+
+
+# --------------------------------------------------------------------------- #
+# Fragments                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+class FragmentsCache:
+    """
+    Content-addressed cache of resources Terraform JSON fragments. Fragments
+    are keyed by the hash of the resource type and serialized content so that
+    only new or modified resources are serialized again when a stack is
+    converted to Terraform multiple times. Fragments are stored indented and
+    are written to the Terraform file without being parsed again.
+
+    The key includes the model fields and the scalar private attributes (such
+    as a built wheel path). Private attributes holding models (parent links,
+    derived resources) are not part of the key: they must be derived from
+    the fields for the cache to remain valid.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of fragments kept in memory.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(resource) -> str | None:
+        from laktory import __version__
+
+        # Fields excluded from serialization (lookup, resource options) also
+        # define the Terraform properties
+        fields = {k: getattr(resource, k) for k in type(resource).model_fields}
+        try:
+            content = to_json(fields, by_alias=True).decode()
+            private = {
+                k: v
+                for k, v in (resource.__pydantic_private__ or {}).items()
+                if isinstance(v, (str, int, float, bool, Path))
+            }
+            content += to_json(private).decode()
+        except Exception:
+            return None
+
+        h = hashlib.sha256(__version__.encode())
+        h.update(type(resource).__module__.encode())
+        h.update(type(resource).__qualname__.encode())
+        h.update(content.encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def build(resource) -> str:
+        """Terraform JSON fragment of `resource`, with unresolved references"""
+        d = resource.terraform_properties
+        if resource.lookup_existing:
+            _d = resource.lookup_existing.model_dump()
+            for k in resource.resource_options.terraform_options:
+                if k in d:
+                    _d[k] = d[k]
+            d = _d
+        return json.dumps(d, indent=4)
+
+    def get(self, resource) -> str:
+        """Cached or newly built Terraform JSON fragment of `resource`"""
+        key = self.get_key(resource)
+        if key is None:
+            return self.build(resource)
+
+        with self._lock:
+            text = self._fragments.get(key)
+            if text is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return text
+            self.misses += 1
+
+        text = self.build(resource)
+
+        # Building the properties may normalize some of the resource fields
+        keys = {key, self.get_key(resource)} - {None}
+
+        with self._lock:
+            for key in keys:
+                self._fragments[key] = text
+            while len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+
+        return text
+
+    def clear(self) -> None:
+        """Clear cache and statistics"""
+        with self._lock:
+            self._fragments.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+fragments_cache = FragmentsCache()
+
+
+class _RawJSON(str):
+    """JSON text, indented with 4 spaces, inserted as-is by `_iter_json`"""
+
+
+def _iter_json(o: Any, level: int = 0) -> Iterator[str]:
+    """
+    Iterate over chunks of the JSON text of `o`, formatted as
+    `json.dumps(o, indent=4)`. `o` may be a list of `(key, value)` tuples to
+    support repeated keys and values may be `_RawJSON` text fragments.
+    """
+    if isinstance(o, dict):
+        o = list(o.items())
+
+    if isinstance(o, list) and o and all(isinstance(i, tuple) for i in o):
+        indent = " " * 4 * (level + 1)
+        yield "{"
+        for i, (k, v) in enumerate(o):
+            yield ("," if i else "") + "\n" + indent + json.dumps(k) + ": "
+            yield from _iter_json(v, level + 1)
+        yield "\n" + " " * 4 * level + "}"
+        return
+
+    text = o if isinstance(o, _RawJSON) else json.dumps(o, indent=4)
+    yield text.replace("\n", "\n" + " " * 4 * level)
+
 
 class ConfigValue(BaseModel):
     type: str = "String"
@@ -64,35 +201,102 @@ class TerraformStack(BaseModel):
 
         return self
 
-    def model_dump(self, *args, **kwargs) -> dict[str, Any]:
-        """Serialize model to match the structure of a Terraform json file."""
+    # ----------------------------------------------------------------------- #
+    # Serialization                                                           #
+    # ----------------------------------------------------------------------- #
+
+    def _get_references(self) -> dict[str, tuple[str, bool]]:
+        """
+        Mapping between resource names and their Terraform address, with a
+        flag indicating if the resource is a provider.
+        """
+        refs = {}
+        for r in self.resources.values():
+            address = f"{r.terraform_resource_type}.{r.resource_name}"
+            # special treatment for data sources
+            if r.lookup_existing:
+                address = f"data.{r.terraform_resource_lookup_type}.{r.resource_name}"
+            refs[r.resource_name] = (address, False)
+        for p in self.providers.values():
+            refs[p.resource_name] = (p.resource_name, True)
+        return refs
+
+    @staticmethod
+    def _resolve_references(text: str, refs: dict[str, tuple[str, bool]]) -> str:
+        """
+        Terraform JSON requires the keyword "resources." to be removed and the
+        resource_name to be replaced with resource_type.resource_name. All
+        references are resolved in a single pass.
+        """
+        if "${resources." not in text:
+            return text
+
+        def _sub(match):
+            path = match.group(1)
+            parts = path.split(".")
+            # Resource names (providers with aliases) may include dots
+            for i in range(len(parts), 0, -1):
+                name = ".".join(parts[:i])
+                if name not in refs:
+                    continue
+                address, is_provider = refs[name]
+                attribute = ".".join(parts[i:])
+
+                if not attribute:
+                    # ${resources.resource_name} -> resource_type.resource_name
+                    return address
+                if not is_provider:
+                    # ${resources.resource_name.property} -> ${resource_type.resource_name.property}
+                    return f"${{{address}.{attribute}}}"
+
+            return match.group(0)
+
+        return REFERENCE_PATTERN.sub(_sub, text)
+
+    def _get_fragments(
+        self, refs: dict[str, tuple[str, bool]]
+    ) -> dict[str, dict[str, dict[str, str]]]:
+        """
+        Terraform JSON (text) of each resource, grouped by block (`resource` or
+        `data`) and resource type, with resolved references.
+        """
+        blocks = {"resource": defaultdict(dict), "data": defaultdict(dict)}
+        for r in self.resources.values():
+            if r.lookup_existing:
+                block = "data"
+                rtype = r.terraform_resource_lookup_type
+            else:
+                block = "resource"
+                rtype = r.terraform_resource_type
+            text = self._resolve_references(fragments_cache.get(r), refs)
+            blocks[block][rtype][r.resource_name] = text
+
+        return {k: dict(v) for k, v in blocks.items()}
+
+    def _get_blocks(self, *args, **kwargs) -> list[tuple[str, Any]]:
+        """
+        Top-level blocks of the Terraform json file. Resources blocks values
+        are JSON text fragments. Moved and import blocks are repeated and are
+        suffixed with an index to make keys unique.
+        """
         kwargs["exclude_none"] = kwargs.get("exclude_none", True)
+        kwargs["exclude"] = set(kwargs.get("exclude", None) or set()) | {"resources"}
         d = super().model_dump(*args, **kwargs)
 
         # Terraform uses singular top-level block names
         d["provider"] = d.pop("providers", {})
-        d.pop("resources", None)
+
+        # Providers and backend may also reference resources
+        refs = self._get_references()
+        d = json.loads(self._resolve_references(json.dumps(d), refs))
+
+        blocks = list(d.items())
 
         # Special treatment of resources
-        d["resource"] = defaultdict(lambda: {})
-        d["data"] = defaultdict(lambda: {})
-        for r in self.resources.values():
-            _d = r.terraform_properties
-            if r.lookup_existing:
-                d["data"][r.terraform_resource_lookup_type][r.resource_name] = (
-                    r.lookup_existing.model_dump()
-                )
-                for k in r.resource_options.terraform_options:
-                    if k in _d:
-                        d["data"][r.terraform_resource_lookup_type][r.resource_name][
-                            k
-                        ] = _d[k]
-            else:
-                d["resource"][r.terraform_resource_type][r.resource_name] = _d
-        d["data"] = dict(d["data"])
-        if len(d["data"]) == 0:
-            del d["data"]
-        d["resource"] = dict(d["resource"])
+        fragments = self._get_fragments(refs)
+        blocks += [("resource", fragments["resource"])]
+        if fragments["data"]:
+            blocks += [("data", fragments["data"])]
 
         # Special treatment of moved blocks
         i = -1
@@ -100,10 +304,15 @@ class TerraformStack(BaseModel):
             _from = r.resource_options.moved_from
             if _from:
                 i += 1
-                d[f"moved_{i:05d}"] = {
-                    "from": f"{r.terraform_resource_type}.{_from}",
-                    "to": f"{r.terraform_resource_type}.{r.resource_name}",
-                }
+                blocks += [
+                    (
+                        f"moved_{i:05d}",
+                        {
+                            "from": f"{r.terraform_resource_type}.{_from}",
+                            "to": f"{r.terraform_resource_type}.{r.resource_name}",
+                        },
+                    )
+                ]
 
         # Special treatment of import
         i = -1
@@ -111,39 +320,28 @@ class TerraformStack(BaseModel):
             import_ = r.resource_options.import_
             if import_:
                 i += 1
-                d[f"import_{i:05d}"] = {
-                    "id": import_,
-                    "to": f"{r.terraform_resource_type}.{r.resource_name}",
-                }
-
-        # Terraform JSON requires the keyword "resources." to be removed and the
-        # resource_name to be replaced with resource_type.resource_name.
-        _vars = {}
-        for r in list(self.resources.values()) + list(self.providers.values()):
-            k0 = r.resource_name
-
-            k1 = f"{r.terraform_resource_type}.{r.resource_name}"
-            # special treatment for data sources
-            if r.lookup_existing:
-                k1 = f"data.{r.terraform_resource_lookup_type}.{r.resource_name}"
-
-            if isinstance(r, BaseProvider):
-                pattern = r"\$\{resources." + k0 + "}"
-                _vars[pattern] = k0
-
-            else:
-                # ${resources.resource_name} -> resource_type.resource_name
-                pattern = r"\$\{resources\." + k0 + r"\}"
-                _vars[pattern] = k1
-
-                # ${resources.resource_name.property} -> ${resource_type.resource_name.property}
-                pattern = r"\$\{resources\." + k0 + r"\.(.*?)\}"
-                _vars[pattern] = rf"${{{k1}.\1}}"
-
-        # Because all variables are mapped to a string, it is more efficient
-        # (>10x) to convert the dict to string before substitution.
-        d = json.loads(_resolve_values(json.dumps(d), vars=_vars, objs={}))
+                blocks += [
+                    (
+                        f"import_{i:05d}",
+                        {
+                            "id": import_,
+                            "to": f"{r.terraform_resource_type}.{r.resource_name}",
+                        },
+                    )
+                ]
+
+        return blocks
 
+    def model_dump(self, *args, **kwargs) -> dict[str, Any]:
+        """Serialize model to match the structure of a Terraform json file."""
+        d = {}
+        for k, v in self._get_blocks(*args, **kwargs):
+            if k in ["resource", "data"]:
+                v = {
+                    rtype: {name: json.loads(text) for name, text in _v.items()}
+                    for rtype, _v in v.items()
+                }
+            d[k] = v
         return d
 
     # ----------------------------------------------------------------------- #
@@ -152,7 +350,8 @@ class TerraformStack(BaseModel):
 
     def write(self) -> str:
         """
-        Write Terraform json configuration file
+        Write Terraform json configuration file. Resources JSON fragments are
+        streamed to the file.
 
         Returns
         -------
@@ -165,28 +364,33 @@ class TerraformStack(BaseModel):
         if not os.path.exists(CACHE_ROOT):
             os.makedirs(CACHE_ROOT)
 
-        text = json.dumps(self.model_dump(), indent=4)
-
         # Terraform stack file is not a strict format. Some keys might be
         # repeated and require special treatment.
+        blocks = []
+        for k, v in self._get_blocks():
+            # Special treatment of providers with aliases
+            if k == "provider":
+                names = {
+                    p.resource_name: p.resource_name_without_alias
+                    for p in self.providers.values()
+                }
+                v = [(names.get(name, name), _v) for name, _v in v.items()]
 
-        # Special treatment of providers with aliases
-        for _, p in self.providers.items():
-            if p.alias is not None:
-                text = text.replace(
-                    f'"{p.resource_name}":',
-                    f'"{p.resource_name_without_alias}":',
-                )
+            # Special treatment of resources
+            elif k in ["resource", "data"]:
+                v = {
+                    rtype: {name: _RawJSON(text) for name, text in _v.items()}
+                    for rtype, _v in v.items()
+                }
 
-        # Special treatment of moved
-        text = re.sub(r'"moved_\d+": {', '"moved": {', text)
+            # Special treatment of moved and import
+            k = re.sub(r"^(moved|import)_\d+$", r"\1", k)
 
-        # Special treatment of import
-        text = re.sub(r'"import_\d+": {', '"import": {', text)
+            blocks += [(k, v)]
 
-        # Output
         with open(filepath, "w") as fp:
-            fp.write(text)
+            for chunk in _iter_json(blocks):
+                fp.write(chunk)
 
         return filepath
 
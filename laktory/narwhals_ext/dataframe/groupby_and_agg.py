@@ -1,16 +1,20 @@
+from typing import TYPE_CHECKING
+
 import narwhals as nw
 
 from laktory._logger import get_logger
-from laktory.models.dataframe.dataframecolumnexpr import DataFrameColumnExpr
 from laktory.typing import AnyFrame
 
+if TYPE_CHECKING:
+    from laktory.models.dataframe.dataframecolumnexpr import DataFrameColumnExpr
+
 logger = get_logger(__name__)
 
 
 def groupby_and_agg(
     self,
     groupby_columns: list[str] = None,
-    agg_expressions: list[DataFrameColumnExpr | str | nw.Expr] = None,
+    agg_expressions: list["DataFrameColumnExpr | str | nw.Expr"] = None,
 ) -> AnyFrame:
     """
     Apply a groupby and create aggregation columns.
@@ -1,7 +1,5 @@
 import narwhals as nw
 
-from laktory.sqlparser import SQLParser
-
 
 def sql_expr(sql: str) -> nw.Expr:
     """
@@ -17,5 +15,7 @@ def sql_expr(sql: str) -> nw.Expr:
     :
         Narwhals expression
     """
+    from laktory.sqlparser import SQLParser
+
     parser = SQLParser()
     return parser.parse(sql)
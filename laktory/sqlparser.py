@@ -1,4 +1,9 @@
 import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
 
 import narwhals as nw
 import sqlglot
@@ -8,6 +13,74 @@ engine = nw
 # engine = pl
 
 
+class ExprCache:
+    """
+    Thread-safe cache of parsed SQL expressions. Expressions are keyed by
+    their SQL text and the backend used to build them so that an expression
+    evaluated multiple times (for each read, expectation check or streaming
+    micro-batch) is only parsed once. Expressions are immutable and can be
+    shared. Least-recently-used expressions are evicted first.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of expressions kept in memory.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._exprs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Cached expression for `key` or expression built with `func` if it is
+        not found. Expressions failing to build are not cached.
+
+        Parameters
+        ----------
+        key:
+            Cache key, typically a tuple of the backend and the SQL text
+        func:
+            Function building the expression
+
+        Returns
+        -------
+        :
+            Expression
+        """
+        with self._lock:
+            if key in self._exprs:
+                self._exprs.move_to_end(key)
+                self.hits += 1
+                return self._exprs[key]
+            self.misses += 1
+
+        expr = func()
+
+        with self._lock:
+            self._exprs[key] = expr
+            while len(self._exprs) > self.maxsize:
+                self._exprs.popitem(last=False)
+
+        return expr
+
+    def __len__(self) -> int:
+        return len(self._exprs)
+
+    def clear(self) -> None:
+        """Clear cache and statistics"""
+        with self._lock:
+            self._exprs.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+expr_cache = ExprCache()
+
+
 class SQLParser:
     """
     SQL Parser translating SQL string expression to a Narwhals Expression.
@@ -18,7 +91,8 @@ class SQLParser:
 
     def parse(self, sql: str) -> nw.Expr:
         """
-        Parse SQL expression.
+        Parse SQL expression. Parsed expressions are cached in
+        `laktory.sqlparser.expr_cache`.
 
         Parameters
         ----------
@@ -41,9 +115,9 @@ class SQLParser:
         # > lit(value=2, dtype=None).__mul__(col(x)).__add__(col(y))
         ```
         """
-        parsed_expr = sqlglot.parse_one(sql)
-        # visitor = SQLExprVisitor(self.context)
-        return self.visit_expr(parsed_expr)
+        return expr_cache.get(
+            (engine.__name__, sql), lambda: self.visit_expr(sqlglot.parse_one(sql))
+        )
 
     def visit_expr(self, expr):
         # print(f"Visiting expression {expr} of type {type(expr)}")
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import yaml
+
+from laktory._cache import cache_dir
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ParseCache:
+    """
+    Cache of parsed (composed) YAML documents used by `RecursiveLoader`.
+
+    Documents are keyed by the hash of their content so that a file included
+    multiple times, from multiple files or across CLI invocations is only
+    parsed once. Only the YAML node graph is cached: custom tags and variables
+    are still resolved each time the document is constructed.
+
+    A file whose modification time and size have not changed since it was
+    last read is not read nor hashed again. Documents are stored in memory
+    with a least-recently-used eviction policy and, optionally, on disk under
+    `laktory._cache.cache_dir`.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of documents kept in memory.
+    dirpath:
+        Directory in which documents are stored when disk cache is enabled.
+    """
+
+    def __init__(self, maxsize: int = 256, dirpath: str | Path = None):
+        if dirpath is None:
+            dirpath = cache_dir / "yaml"
+        self.maxsize = maxsize
+        self.dirpath = Path(dirpath)
+        self.hits = 0
+        self.misses = 0
+        self._nodes = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @property
+    def disk_enabled(self) -> bool:
+        from laktory._settings import settings
+
+        return settings.yaml_cache_disk
+
+    # ----------------------------------------------------------------------- #
+    # Keys                                                                    #
+    # ----------------------------------------------------------------------- #
+
+    @staticmethod
+    def hash(content: str) -> str:
+        """Cache key of a (pre-processed) YAML content"""
+        h = hashlib.sha256(yaml.__version__.encode())
+        h.update(content.encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def _stat(filepath: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_key(self, filepath: str) -> str | None:
+        """
+        Cache key of the file at `filepath` if it has not been modified since
+        it was last read, `None` otherwise.
+        """
+        stat = self._stat(filepath)
+        if stat is None:
+            return None
+        with self._lock:
+            entry = self._stats.get(filepath)
+        if entry is None or entry[0] != stat:
+            return None
+        return entry[1]
+
+    def set_key(self, filepath: str, key: str) -> None:
+        """Store the cache key of the file at `filepath`"""
+        stat = self._stat(filepath)
+        if stat is None:
+            return
+        with self._lock:
+            self._stats[filepath] = (stat, key)
+
+    # ----------------------------------------------------------------------- #
+    # Nodes                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def _get_filepath(self, key: str) -> Path:
+        return self.dirpath / f"{key}.pickle"
+
+    def get(self, key: str) -> yaml.Node | None:
+        """Parsed document for `key` or `None` if not cached"""
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is not None:
+                self._nodes.move_to_end(key)
+                self.hits += 1
+                return node
+
+        if self.disk_enabled:
+            filepath = self._get_filepath(key)
+            if filepath.exists():
+                try:
+                    with filepath.open("rb") as fp:
+                        node = pickle.load(fp)
+                except Exception as e:
+                    logger.warning(f"Could not read YAML cache {filepath}: {e}")
+                    node = None
+                if node is not None:
+                    self._set_memory(key, node)
+                    with self._lock:
+                        self.hits += 1
+                    return node
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _set_memory(self, key: str, node: yaml.Node) -> None:
+        with self._lock:
+            self._nodes[key] = node
+            self._nodes.move_to_end(key)
+            while len(self._nodes) > self.maxsize:
+                self._nodes.popitem(last=False)
+
+    def set(self, key: str, node: yaml.Node) -> None:
+        """Store parsed document `node` for `key`"""
+        if node is None:
+            return
+
+        self._set_memory(key, node)
+
+        if self.disk_enabled:
+            filepath = self._get_filepath(key)
+            try:
+                self.dirpath.mkdir(parents=True, exist_ok=True)
+                tmp_filepath = filepath.with_suffix(f".{os.getpid()}.tmp")
+                with tmp_filepath.open("wb") as fp:
+                    pickle.dump(node, fp)
+                os.replace(tmp_filepath, filepath)
+            except Exception as e:
+                logger.warning(f"Could not write YAML cache {filepath}: {e}")
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Clear memory cache and statistics.
+
+        Parameters
+        ----------
+        disk:
+            If `True`, documents stored on disk are also deleted.
+        """
+        with self._lock:
+            self._nodes.clear()
+            self._stats.clear()
+            self.hits = 0
+            self.misses = 0
+
+        if disk and self.dirpath.exists():
+            for filepath in self.dirpath.glob("*.pickle"):
+                filepath.unlink(missing_ok=True)
+
+
+parse_cache = ParseCache()
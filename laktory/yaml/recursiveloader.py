@@ -3,6 +3,7 @@ from pathlib import Path
 import yaml
 
 from laktory._parsers import _resolve_value
+from laktory.yaml.parsecache import parse_cache
 
 MERGE_KEY = "__merge_here"
 VARIABLES_KEY = "variables"
@@ -12,6 +13,8 @@ VARIABLES_KEY = "variables"
 class RecursiveLoader(yaml.SafeLoader):
     def __init__(self, stream, parent_loader=None, vars=None):
         self.dirpath = Path("./")
+        self.cache_key = None
+        self.cached_node = None
         stream = self.preprocess_stream(stream)
 
         self.variables = []
@@ -24,8 +27,16 @@ class RecursiveLoader(yaml.SafeLoader):
     def preprocess_stream(self, stream):
         """Reformat content to be YAML safe"""
 
-        if hasattr(stream, "name"):
-            self.dirpath = Path(stream.name).parent
+        filepath = getattr(stream, "name", None)
+        if filepath is not None:
+            self.dirpath = Path(filepath).parent
+
+            # Unchanged file already parsed
+            self.cache_key = parse_cache.get_key(filepath)
+            if self.cache_key is not None:
+                self.cached_node = parse_cache.get(self.cache_key)
+                if self.cached_node is not None:
+                    return ""
 
         _lines = []
         for line in stream.readlines():
@@ -34,8 +45,22 @@ class RecursiveLoader(yaml.SafeLoader):
                     "The `${include.}` syntax has been deprecated in laktory 0.6.0. Please use `!use`, `!update` and `!extend` tags instead."
                 )
             _lines += [line.replace("<<:", MERGE_KEY + ":")]
-
-        return "\n".join(_lines)
+        content = "\n".join(_lines)
+
+        self.cache_key = parse_cache.hash(content)
+        self.cached_node = parse_cache.get(self.cache_key)
+        if filepath is not None:
+            parse_cache.set_key(filepath, self.cache_key)
+
+        return content
+
+    def get_single_node(self):
+        """Parse document or fetch it from the parse cache"""
+        if self.cached_node is not None:
+            return self.cached_node
+        node = super().get_single_node()
+        parse_cache.set(self.cache_key, node)
+        return node
 
     @classmethod
     def load(cls, stream, parent_loader: "RecursiveLoader" = None, vars=None):
@@ -70,3 +70,21 @@ def test_sql_with_curly(backend):
             }
         ),
     )
+
+
+def test_safe_expr_suffix():
+    from laktory.models.dataframe.dataframeexpr import DataFrameExprContext
+    from laktory.models.dataframe.dataframeexpr import to_safe_expr
+
+    # Spark temporary views are unique to each context
+    c0 = DataFrameExprContext()
+    c1 = DataFrameExprContext()
+    assert c0.view_suffix != c1.view_suffix
+
+    expr = to_safe_expr(
+        "SELECT * FROM {df} JOIN {nodes.slv} USING (id)", suffix=c0.view_suffix
+    )
+    assert expr == (
+        f"SELECT * FROM __df__{c0.view_suffix} "
+        f"JOIN __nodes_slv___{c0.view_suffix} USING (id)"
+    )
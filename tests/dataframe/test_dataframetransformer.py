@@ -27,3 +27,34 @@ def test_transformer(backend):
 
     assert df.columns == ["id", "x1", "y1"]
     assert transformer.data_sources == []
+
+
+def test_transformer_sql_context(mocker):
+    import polars as pl
+
+    df0 = get_df0("POLARS")
+    source = pl.DataFrame({"id": ["a", "b", "c"], "x2": [1, 2, 3]}).lazy()
+
+    transformer = DataFrameTransformer(
+        nodes=[
+            DataFrameExpr(
+                expr="select {df}.id, x1, x2 from {df} join {source} using (id)"
+            ),
+            DataFrameMethod(func_name="with_columns", func_kwargs={"y1": "x1"}),
+            DataFrameExpr(expr="select id, x1 + x2 as x3, y1 from {df}"),
+            DataFrameExpr(expr="select x3, x2 from {df} join {source} using (id)"),
+        ]
+    )
+
+    spy = mocker.spy(pl.SQLContext, "register")
+    df = transformer.execute(df0, named_dfs={"source": source})
+
+    # Named DataFrame is only registered once
+    names = [c.args[1] for c in spy.call_args_list]
+    assert names == ["__df__", "__source__", "__df__", "__df__"]
+    assert isinstance(df.to_native(), pl.LazyFrame)
+    assert df.collect().sort("x3").to_native().to_dicts() == [
+        {"x3": 2, "x2": 1},
+        {"x3": 4, "x2": 2},
+        {"x3": 6, "x2": 3},
+    ]
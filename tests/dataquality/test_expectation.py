@@ -4,6 +4,7 @@ import pytest
 from laktory import models
 from laktory._testing import get_df0
 from laktory.exceptions import DataQualityCheckFailedError
+from laktory.models.dataquality.expectation import run_checks
 
 
 @pytest.mark.parametrize("backend", ["POLARS", "PYSPARK"])
@@ -164,3 +165,57 @@ def test_expectations_exceptions_warnings(backend):
     )
     with pytest.raises(DataQualityCheckFailedError):
         dqe.run_check(df0, raise_or_warn=True)
+
+
+@pytest.mark.parametrize("backend", ["POLARS", "PYSPARK"])
+def test_run_checks(backend):
+    df0 = get_df0(backend, lazy=True)
+
+    dqes = [
+        models.DataQualityExpectation(name="abs", expr="x1 < 3"),
+        models.DataQualityExpectation(
+            name="rel", expr="nw.col('x1') < 3", tolerance={"rel": 0.5}
+        ),
+        models.DataQualityExpectation(
+            name="count", expr="COUNT(x1) > 2", type="AGGREGATE"
+        ),
+        models.DataQualityExpectation(
+            name="max", expr="nw.max('x1') > 5", type="AGGREGATE"
+        ),
+    ]
+
+    # Fused checks must match individual checks
+    checks = run_checks(dqes, df0)
+    assert [c.status for c in checks] == ["FAIL", "PASS", "PASS", "FAIL"]
+    assert [c.fails_count for c in checks] == [1, 1, None, None]
+    assert [c.rows_count for c in checks] == [3, 3, 3, 3]
+    assert [dqe.check for dqe in dqes] == checks
+    for dqe, check in zip(dqes, checks):
+        assert dqe.run_check(df0) == check
+
+    # Empty DataFrame
+    checks = run_checks(dqes, df0.filter(nw.col("x1") < 0))
+    assert [c.status for c in checks] == ["PASS"] * 4
+    assert [c.rows_count for c in checks] == [0] * 4
+
+    # Raise Exception
+    dqes[0].action = "FAIL"
+    with pytest.raises(DataQualityCheckFailedError):
+        run_checks(dqes, df0, raise_or_warn=True)
+
+
+def test_check_add():
+    c0 = models.DataQualityCheck(rows_count=10, fails_count=0, status="PASS")
+    c1 = models.DataQualityCheck(rows_count=5, fails_count=2, status="FAIL")
+    c = c0 + c1
+    assert c.rows_count == 15
+    assert c.fails_count == 2
+    assert c.status == "FAIL"
+    assert c.failure_rate == 2 / 15
+
+    # Aggregate
+    c = models.DataQualityCheck(rows_count=10, status="PASS") + models.DataQualityCheck(
+        rows_count=2, status="PASS"
+    )
+    assert c.fails_count is None
+    assert c.status == "PASS"
@@ -85,3 +85,64 @@ def test_write(backend, fmt, tmp_path):
 
     # Test purge
     sink.purge()
+
+
+@pytest.mark.parametrize(
+    ["fmt", "writer_kwargs", "method"],
+    [
+        ("PARQUET", {}, "sink_parquet"),
+        ("PARQUET", {"compression": "zstd"}, "sink_parquet"),
+        ("PARQUET", {"use_pyarrow": True}, None),
+        ("CSV", {}, "sink_csv"),
+        ("IPC", {}, "sink_ipc"),
+        ("NDJSON", {}, "sink_ndjson"),
+        ("JSON", {}, None),
+        ("DELTA", {}, None),
+    ],
+)
+def test_write_polars_streaming(fmt, writer_kwargs, method, tmp_path):
+    df0 = get_df0("POLARS", lazy=True)
+
+    sink = FileDataSink(
+        format=fmt,
+        path=(tmp_path / f"df.{fmt}").as_posix(),
+        mode="OVERWRITE" if fmt == "DELTA" else None,
+        writer_kwargs=writer_kwargs,
+    )
+    assert sink._get_polars_sink_method(df0.to_native()) == method
+    assert sink._get_polars_sink_method(df0.to_native().collect()) is None
+
+    sink.write(df0)
+    source = sink.as_source()
+    if fmt == "CSV":
+        source.infer_schema = True
+    assert_dfs_equal(source.read(), df0)
+
+
+def test_write_micro_batch(tmp_path):
+    import polars as pl
+
+    df0 = get_df0("POLARS")
+    filepath = tmp_path / "df.delta"
+
+    sink = FileDataSink(format="DELTA", path=filepath.as_posix(), mode="COMPLETE")
+    assert sink.supports_micro_batch
+    assert not FileDataSink(
+        format="DELTA", path=filepath.as_posix(), mode="UPDATE"
+    ).supports_micro_batch
+    assert sink.is_micro_batch_idempotent
+    assert not FileDataSink(
+        format="PARQUET", path=filepath.as_posix(), mode="APPEND"
+    ).is_micro_batch_idempotent
+
+    # COMPLETE mode overwrites data with each micro-batch
+    sink.write_micro_batch(df0, batch_id=0)
+    sink.write_micro_batch(df0, batch_id=1)
+    assert pl.read_delta(filepath.as_posix()).height == 3
+
+    # Idempotent Spark writes
+    sink.mode = "APPEND"
+    sink._micro_batch_id = 2
+    kwargs, _ = sink._get_spark_kwargs(mode="APPEND", is_streaming=False)
+    assert kwargs["txnAppId"] == sink._uuid
+    assert kwargs["txnVersion"] == 2
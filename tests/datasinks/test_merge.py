@@ -3,8 +3,6 @@ import datetime
 import narwhals as nw
 import pandas as pd
 import polars as pl
-import pyspark.sql.functions as F
-import pyspark.sql.types as T
 import pytest
 
 import laktory
@@ -12,8 +10,6 @@ from laktory import models
 from laktory.enums import DataFrameBackends
 from laktory.models.datasinks.mergecdcoptions import SUPPORTED_BACKENDS
 
-spark = laktory.get_spark_session()
-
 # --------------------------------------------------------------------------- #
 # Functions                                                                   #
 # --------------------------------------------------------------------------- #
@@ -22,6 +18,14 @@ spark = laktory.get_spark_session()
 price_cols = ["close", "open"]
 
 
+def from_pandas(df, backend):
+    if backend == "PYSPARK":
+        spark = laktory.get_spark_session()
+        return spark.createDataFrame(df)
+    elif backend == "POLARS":
+        return pl.from_pandas(df).lazy()
+
+
 def build_target(path, backend, write_target=True, index=None) -> nw.LazyFrame:
     # Build Target
     df0 = pd.DataFrame(
@@ -37,34 +41,25 @@ def build_target(path, backend, write_target=True, index=None) -> nw.LazyFrame:
             {"date": "2024-11-03", "symbol": "S2", "close": 0.00, "open": 0.93},
         ]
     )
-    if backend == "PYSPARK":
-        df0 = spark.createDataFrame(df0)
-        df0 = df0.withColumn("date", F.col("date").cast("date"))
-        df0 = df0.withColumn("_is_deleted", F.lit(False))
-        df0 = df0.withColumn("from", F.lit("target"))
-        if index:
-            df0 = df0.withColumn("index", F.lit(index))
-    elif backend == "POLARS":
-        df0 = pl.from_pandas(df0)
-        # df0 = df0.with_columns({
-        #     "date": pl.col("date").cast(pl.Date()),
-        #     "_is_deleted": pl.lit(False),
-        #     "from": pl.lit("target"),
-        # })
+    df0["date"] = pd.to_datetime(df0["date"]).dt.date
+    df0["_is_deleted"] = False
+    df0["from"] = "target"
+    if index:
+        df0["index"] = index
+    df0 = from_pandas(df0, backend)
 
     # Write Target
     if write_target:
-        (
-            df0.drop("_is_deleted")  # would be dropped by the merge function
-            .write.format("DELTA")
-            .mode("OVERWRITE")
-            .save(str(path))
-        )
+        _df0 = df0.drop("_is_deleted")  # would be dropped by the merge function
+        if backend == "PYSPARK":
+            _df0.write.format("DELTA").mode("OVERWRITE").save(str(path))
+        elif backend == "POLARS":
+            _df0.collect().write_delta(str(path), mode="overwrite")
 
     return nw.from_native(df0)
 
 
-def get_basic_source():
+def get_basic_source(backend="PYSPARK"):
     dfs = pd.DataFrame(
         [
             # Delete
@@ -144,14 +139,13 @@ def get_basic_source():
             },
         ]
     )
-    dfs = spark.createDataFrame(dfs)
-    dfs = dfs.withColumn("date", F.col("date").cast("date"))
-    dfs = dfs.withColumn("from", F.lit("source"))
+    dfs["date"] = pd.to_datetime(dfs["date"]).dt.date
+    dfs["from"] = "source"
 
-    return dfs
+    return from_pandas(dfs, backend)
 
 
-def get_scd2_source():
+def get_scd2_source(backend="PYSPARK"):
     dfs = pd.DataFrame(
         [
             {
@@ -196,15 +190,24 @@ def get_scd2_source():
             },
         ]
     )
-    dfs = spark.createDataFrame(dfs)
-    dfs = dfs.withColumn("date", F.col("date").cast("date"))
-    dfs = dfs.withColumn("index", F.col("index").cast(T.IntegerType()))
+    dfs["date"] = pd.to_datetime(dfs["date"]).dt.date
+    dfs["index"] = dfs["index"].astype("int32")
 
-    return dfs
+    return from_pandas(dfs, backend)
 
 
-def read(path):
-    return spark.read.format("DELTA").load(str(path))
+def read(path, backend="PYSPARK", sort=None) -> pd.DataFrame:
+    if backend == "PYSPARK":
+        spark = laktory.get_spark_session()
+        df = spark.read.format("DELTA").load(str(path))
+        if sort:
+            df = df.sort(*sort)
+        return df.toPandas()
+    elif backend == "POLARS":
+        df = pl.read_delta(str(path))
+        if sort:
+            df = df.sort(sort)
+        return pd.DataFrame(df.to_dicts(), columns=df.columns)
 
 
 # --------------------------------------------------------------------------- #
@@ -237,7 +240,7 @@ def test_basic(tmp_path, backend):
     sink.write(df)
 
     # Test target
-    df0 = read(tmp_path).toPandas()
+    df0 = read(tmp_path, backend)
     assert len(df0) == 9  # 3 stocks * 3 timestamps
     assert df0["from"].unique().tolist() == ["target"]
     assert df0.columns.tolist() == [
@@ -249,13 +252,13 @@ def test_basic(tmp_path, backend):
     ]
 
     # Build Source
-    dfs = get_basic_source()
+    dfs = get_basic_source(backend)
 
     # Merge source
     sink.write(dfs)
 
     # Read updated target
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
 
     # Test Merge
     assert df1.columns.tolist() == [
@@ -278,7 +281,7 @@ def test_out_of_sequence(tmp_path, backend):
     build_target(tmp_path, backend=backend, index=1)
 
     # Out-of-sequence source
-    dfs = spark.createDataFrame(
+    dfs = from_pandas(
         pd.DataFrame(
             {
                 "symbol": ["S2", "S2"],
@@ -288,7 +291,8 @@ def test_out_of_sequence(tmp_path, backend):
                 "from": ["source", "source"],
                 "index": [2, 1],
             }
-        )
+        ),
+        backend,
     )
 
     # Merge
@@ -304,7 +308,7 @@ def test_out_of_sequence(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
     row = df1.iloc[-1].to_dict()
     assert len(df1) == 10
     assert row == {
@@ -325,7 +329,7 @@ def test_outdated(tmp_path, backend):
     build_target(tmp_path, backend=backend, index=3)
 
     # Out-of-sequence source
-    dfs = spark.createDataFrame(
+    dfs = from_pandas(
         pd.DataFrame(
             {
                 "symbol": ["S1", "S2"],
@@ -335,7 +339,8 @@ def test_outdated(tmp_path, backend):
                 "from": ["source", "source"],
                 "index": [4, 1],
             }
-        )
+        ),
+        backend,
     )
 
     # Merge
@@ -351,7 +356,7 @@ def test_outdated(tmp_path, backend):
     sink.write(dfs)
 
     # Test - Updated Row
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
 
     row = df1.iloc[-2].to_dict()
     assert row == {
@@ -383,7 +388,7 @@ def test_delete_non_existent(tmp_path, backend):
     df0 = build_target(path=tmp_path, backend=backend, index=1)
 
     # Source with rows "pre-deleted"
-    dfs = spark.createDataFrame(
+    dfs = from_pandas(
         pd.DataFrame(
             {
                 "symbol": ["S2", "S1"],
@@ -394,7 +399,8 @@ def test_delete_non_existent(tmp_path, backend):
                 "index": [1, 1],
                 "_is_deleted": [True, True],
             }
-        )
+        ),
+        backend,
     )
 
     # Merge
@@ -411,7 +417,7 @@ def test_delete_non_existent(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
     assert len(df1) == df0.collect().shape[0]
 
 
@@ -423,7 +429,7 @@ def test_scd2(tmp_path, backend):
     df = build_target(path=tmp_path, backend=backend, write_target=False, index=1)
 
     # Build Source Data
-    dfs = get_scd2_source()
+    dfs = get_scd2_source(backend)
 
     # Merge
     sink = models.FileDataSink(
@@ -440,10 +446,10 @@ def test_scd2(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol", "__start_at").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol", "__start_at"])
     where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
-    assert len(df1) == df.collect().shape[0] + dfs.count()
-    assert df1["__end_at"].count() == dfs.count()
+    assert len(df1) == df.collect().shape[0] + len(nw.from_native(dfs).lazy().collect())
+    assert df1["__end_at"].count() == len(nw.from_native(dfs).lazy().collect())
     assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, -1]
 
 
@@ -455,7 +461,7 @@ def test_scd2_with_delete(tmp_path, backend):
     df = build_target(path=tmp_path, backend=backend, write_target=False, index=1)
 
     # Build Source Data
-    dfs = get_scd2_source()
+    dfs = get_scd2_source(backend)
 
     # Merge
     sink = models.FileDataSink(
@@ -475,7 +481,7 @@ def test_scd2_with_delete(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol", "start_at").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol", "start_at"])
     where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
     assert (
         len(df1) == df.collect().shape[0] + 3
@@ -484,6 +490,77 @@ def test_scd2_with_delete(tmp_path, backend):
     assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, -1]
 
 
+@pytest.mark.parametrize("backend", ["PYSPARK", "POLARS"])
+def test_scd2_int64_hash(tmp_path, backend):
+    if DataFrameBackends(backend) not in SUPPORTED_BACKENDS:
+        pytest.skip(f"Backend '{backend}' not implemented.")
+
+    df = build_target(path=tmp_path, backend=backend, write_target=False, index=1)
+
+    # Build Source Data
+    dfs = get_scd2_source(backend)
+
+    # Merge
+    sink = models.FileDataSink(
+        mode="MERGE",
+        path=str(tmp_path),
+        format="DELTA",
+        merge_cdc_options=models.DataSinkMergeCDCOptions(
+            primary_keys=["symbol", "date"],
+            exclude_columns=["_is_deleted"],
+            delete_where="_is_deleted = true",
+            order_by="index",
+            scd_type=2,
+            hash_type="INT64",
+        ),
+    )
+    sink.write(df.drop("from"))
+    sink.write(dfs)
+
+    # Test
+    df1 = read(tmp_path, backend, sort=["date", "symbol", "__start_at"])
+    where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
+    assert df1["__hash_cols"].dtype == "int64"
+    # xxhash64 of "4.0~4.0~4" with seed 42, identical with Spark and Polars
+    assert df1.loc[where]["__hash_cols"].iloc[-1] == 4560392959618094760
+    assert len(df1) == df.collect().shape[0] + 3
+    assert df1["__end_at"].count() == 4
+    assert df1.loc[where]["__end_at"].fillna(-1).tolist() == [2, 3, 4, -1]
+    assert set(sink.merge_cdc_options.metrics) == {"changes", "merge", "total"}
+
+    # Replayed source rows are unchanged or older than current rows
+    sink.write(dfs)
+    df2 = read(tmp_path, backend, sort=["date", "symbol", "__start_at"])
+    assert df2.equals(df1)
+
+
+def test_unqualify_columns():
+    from laktory.models.datasinks.mergecdcoptions import _unqualify_columns
+
+    assert _unqualify_columns("source._is_deleted = true", "source") == (
+        "_is_deleted = TRUE"
+    )
+    # Literals and other identifiers containing "source." are kept
+    assert _unqualify_columns(
+        "source.x = 'source.x' AND resource.id > 1", "source"
+    ) == ("x = 'source.x' AND resource.id > 1")
+
+
+def test_xxhash64():
+    from laktory.models.datasinks._xxhash import xxhash64
+
+    # Reference XXH64 values (seed 0) and Spark seed (42)
+    assert xxhash64(["", "abc"], seed=0) == [
+        -1205034819632174695,
+        4952883123889572249,
+    ]
+    assert xxhash64(["abcdefghijklm", "laktory~" * 6 + "é", None]) == [
+        -3720345996457672580,
+        7071560659625765564,
+        None,
+    ]
+
+
 @pytest.mark.parametrize("backend", ["PYSPARK", "POLARS"])
 def test_null_updates(tmp_path, backend):
     if DataFrameBackends(backend) not in SUPPORTED_BACKENDS:
@@ -497,10 +574,10 @@ def test_null_updates(tmp_path, backend):
             {"date": "2024-11-03", "symbol": "S2", "close": 0.0, "open": 2.00},
         ]
     )
-    dfs = spark.createDataFrame(dfs)
-    dfs = dfs.withColumn("date", F.col("date").cast("date"))
-    dfs = dfs.withColumn("close", F.lit(None))
-    dfs = dfs.withColumn("from", F.lit("source"))
+    dfs["date"] = pd.to_datetime(dfs["date"]).dt.date
+    dfs["close"] = None
+    dfs["from"] = "source"
+    dfs = from_pandas(dfs, backend)
 
     # Update target without ignoring null updates
     sink = models.FileDataSink(
@@ -514,7 +591,7 @@ def test_null_updates(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
     row = df1.iloc[-1].fillna(-1).to_dict()
     assert row == {
         "date": datetime.date(2024, 11, 3),
@@ -532,7 +609,7 @@ def test_null_updates(tmp_path, backend):
     sink.write(dfs)
 
     # Test
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
     row = df1.iloc[-1].to_dict()
     assert row == {
         "date": datetime.date(2024, 11, 3),
@@ -548,13 +625,18 @@ def test_stream(tmp_path, backend):
     if DataFrameBackends(backend) not in SUPPORTED_BACKENDS:
         pytest.skip(f"Backend '{backend}' not implemented.")
 
+    if backend == "POLARS":
+        pytest.skip("Streaming merge is not supported with Polars.")
+
+    spark = laktory.get_spark_session()
+
     build_target(
         path=tmp_path,
         backend=backend,
     )
 
     # Build Source
-    dfs = get_basic_source()
+    dfs = get_basic_source(backend)
 
     # Convert source to stream
     source_path = str(tmp_path / "source")
@@ -576,7 +658,7 @@ def test_stream(tmp_path, backend):
     sink.write(dfs)
 
     # Read updated target
-    df1 = read(tmp_path).sort("date", "symbol").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol"])
     assert df1.columns.tolist() == [
         "date",
         "symbol",
@@ -594,10 +676,15 @@ def test_stream_scd2(tmp_path, backend):
     if DataFrameBackends(backend) not in SUPPORTED_BACKENDS:
         pytest.skip(f"Backend '{backend}' not implemented.")
 
+    if backend == "POLARS":
+        pytest.skip("Streaming merge is not supported with Polars.")
+
+    spark = laktory.get_spark_session()
+
     df = build_target(path=tmp_path, backend=backend, write_target=False, index=1)
 
     # Build Source
-    dfs = get_scd2_source()
+    dfs = get_scd2_source(backend)
 
     # Convert source to stream
     source_path = str(tmp_path / "source")
@@ -623,7 +710,7 @@ def test_stream_scd2(tmp_path, backend):
     sink.write(dfs)
 
     # Tests
-    df1 = read(tmp_path).sort("date", "symbol", "start_at").toPandas()
+    df1 = read(tmp_path, backend, sort=["date", "symbol", "start_at"])
     where = (df1["symbol"] == "S2") & (df1["date"] == datetime.date(2024, 11, 3))
     assert (
         len(df1) == df.collect().shape[0] + 3
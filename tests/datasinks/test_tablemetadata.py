@@ -158,3 +158,170 @@ def test_uc_table(spark, tags):
     assert meta1.columns[1].comment is None
     assert meta1.columns[2].comment == "sin function"
     assert meta1.columns[2].tags == tags
+
+
+def get_uc_sink(table_name="sin"):
+    return UnityCatalogDataSink(
+        catalog_name="laktory",
+        schema_name="unit_tests",
+        table_name=table_name,
+        metadata=lk.models.TableDataSinkMetadata(
+            comment="new comment",
+            owner="owner",
+            tags={"framework": "laktory", "layer": "gold"},
+            properties={"lk.version": "1"},
+            columns=[
+                {"name": "x", "comment": "x comment", "tags": {"pii": None}},
+                {"name": "y"},
+            ],
+        ),
+    )
+
+
+def get_uc_current():
+    current = lk.models.TableDataSinkMetadata(
+        comment="old comment",
+        owner="owner",
+        tags={"framework": "laktory", "layer": "silver", "old": "tag"},
+        properties={
+            "lk.version": "0",
+            "lk.old": "1",
+            "laktory.managedProperties": "lk.old|lk.version",
+        },
+        columns=[{"name": "x"}, {"name": "y"}],
+    )
+    current._table_type = "MANAGED"
+    return current
+
+
+def test_statements():
+    sink = get_uc_sink()
+    statements = sink.metadata.get_statements(get_uc_current())
+    t = "laktory.unit_tests.sin"
+    assert statements == [
+        f"COMMENT ON TABLE {t} IS 'new comment'",
+        f"COMMENT ON COLUMN {t}.x IS 'x comment'",
+        f"ALTER TABLE {t} ALTER COLUMN x SET TAGS ('pii' = '')",
+        f"ALTER TABLE {t} SET TBLPROPERTIES(lk.version = '1',laktory.managedProperties = 'lk.version');",
+        f"ALTER TABLE {t} UNSET TBLPROPERTIES IF EXISTS (lk.old);",
+        f"ALTER TABLE {t} UNSET TAGS ('layer', 'old')",
+        f"ALTER TABLE {t} SET TAGS ('layer' = 'gold')",
+    ]
+
+    # Streaming tables tags are updated one at a time
+    current = get_uc_current()
+    current._table_type = "STREAMING_TABLE"
+    statements = sink.metadata.get_statements(current)
+    assert statements[-3:] == [
+        f"UNSET TAG ON TABLE {t} `layer`",
+        f"UNSET TAG ON TABLE {t} `old`",
+        f"SET TAG ON TABLE {t} `layer` = `gold`",
+    ]
+
+
+class SparkMock:
+    def __init__(self):
+        self.queries = []
+
+    def sql(self, query):
+        import pandas as pd
+
+        self.queries += [query]
+        rows = []
+        for name in ["sin", "cos"]:
+            t = f"laktory.unit_tests.{name}"
+            if "information_schema.tables" in query:
+                rows += [
+                    {
+                        "_full_name": t,
+                        "table_type": "MANAGED",
+                        "table_owner": "owner",
+                        "comment": "old comment",
+                    }
+                ]
+            elif "information_schema.columns" in query:
+                rows += [
+                    {
+                        "_full_name": t,
+                        "column_name": c,
+                        "comment": None,
+                        "full_data_type": "double",
+                        "ordinal_position": i,
+                    }
+                    for i, c in enumerate(["x", "y"])
+                ]
+            elif "information_schema.column_tags" in query:
+                rows += [
+                    {
+                        "_full_name": t,
+                        "column_name": "x",
+                        "tag_name": "pii",
+                        "tag_value": "",
+                    }
+                ]
+            elif "information_schema.table_tags" in query:
+                rows += [
+                    {"_full_name": t, "tag_name": "framework", "tag_value": "laktory"}
+                ]
+        result = pd.DataFrame(rows)
+
+        class Result:
+            def toPandas(self):
+                return result
+
+            def collect(self):
+                return [{"key": "lk.version", "value": "1"}]
+
+        return Result()
+
+
+def test_update_tables_metadata(mocker):
+    from laktory.models.datasinks.tabledatasinkmetadata import update_tables_metadata
+
+    spark = SparkMock()
+    mocker.patch("laktory.get_spark_session", return_value=spark)
+
+    metadatas = [get_uc_sink("sin").metadata, get_uc_sink("cos").metadata]
+    update_tables_metadata(metadatas, max_workers=2)
+
+    # Current metadata fetched in batch
+    reads = [q for q in spark.queries if "information_schema" in q]
+    assert len(reads) == 4
+    assert "'laktory.unit_tests.sin', 'laktory.unit_tests.cos'" in reads[0]
+    assert len([q for q in spark.queries if "SHOW TBLPROPERTIES" in q]) == 2
+
+    # Diff applied for each table
+    current = metadatas[0].current
+    assert current.columns[0]._type == "double"
+    assert current.columns[0].tags == {"pii": None}
+    assert current.properties == {"lk.version": "1"}
+    for name in ["sin", "cos"]:
+        t = f"laktory.unit_tests.{name}"
+        assert f"COMMENT ON TABLE {t} IS 'new comment'" in spark.queries
+        assert f"ALTER TABLE {t} SET TAGS ('layer' = 'gold')" in spark.queries
+    assert not [q for q in spark.queries if "DESCRIBE" in q]
+
+
+def test_get_uc_current_queries(mocker):
+    from laktory.models.datasinks.tabledatasinkmetadata import get_uc_current
+
+    spark = SparkMock()
+    mocker.patch("laktory.get_spark_session", return_value=spark)
+
+    metadatas = [get_uc_sink("sin").metadata, get_uc_sink("cos").metadata]
+    get_uc_current(metadatas, max_workers=1)
+
+    names = "'laktory.unit_tests.sin', 'laktory.unit_tests.cos'"
+    reads = [q for q in spark.queries if "information_schema" in q]
+    assert reads == [
+        f"SELECT *, lower(concat_ws('.', {c}, {s}, table_name)) AS _full_name "
+        f"FROM system.information_schema.{view} "
+        f"WHERE {c} IN ('laktory') AND {s} IN ('unit_tests') "
+        f"AND lower(concat_ws('.', {c}, {s}, table_name)) IN ({names})"
+        for view, c, s in [
+            ("tables", "table_catalog", "table_schema"),
+            ("columns", "table_catalog", "table_schema"),
+            ("column_tags", "catalog_name", "schema_name"),
+            ("table_tags", "catalog_name", "schema_name"),
+        ]
+    ]
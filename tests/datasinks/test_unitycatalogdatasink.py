@@ -1,7 +1,11 @@
+import polars as pl
 import pytest
 
+from laktory._settings import settings
 from laktory._testing import get_df0
 from laktory.enums import DataFrameBackends
+from laktory.localcatalog import get_local_catalog
+from laktory.models import DataSinkMergeCDCOptions
 from laktory.models import UnityCatalogDataSink
 
 from ..conftest import assert_dfs_equal
@@ -41,6 +45,67 @@ def test_write(backend, tmp_path):
     assert not sink.exists()
 
 
+def test_write_polars(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "local_catalog_root", str(tmp_path / "catalog"))
+    df0 = get_df0("POLARS")
+
+    sink = UnityCatalogDataSink(
+        table_name="sandbox.default.df",
+        mode="OVERWRITE",
+        dataframe_backend="POLARS",
+    )
+    assert not sink.exists()
+
+    # Resolving local path does not register table
+    assert sink.local_path == (tmp_path / "catalog/sandbox/default/df").as_posix()
+    assert get_local_catalog().get_table(sink.full_name) is None
+
+    sink.write(df0)
+    assert sink.exists()
+    assert (tmp_path / "catalog/sandbox/default/df/_delta_log").exists()
+
+    # Read back data
+    df = sink.read()
+    assert_dfs_equal(df, df0)
+
+    # Append
+    sink.write(df0, mode="APPEND")
+    assert sink.read().collect().shape[0] == 2 * df0.shape[0]
+
+    # Merge
+    sink = UnityCatalogDataSink(
+        table_name="sandbox.default.merged",
+        mode="MERGE",
+        merge_cdc_options=DataSinkMergeCDCOptions(primary_keys=["x"]),
+        dataframe_backend="POLARS",
+    )
+    assert sink.merge_cdc_options.target_path == sink.local_path
+    assert get_local_catalog().get_table(sink.full_name) is None
+    sink.write(pl.DataFrame({"x": [1, 2], "y": ["a", "b"]}))
+    assert get_local_catalog().get_table(sink.full_name) is not None
+    sink.write(pl.DataFrame({"x": [2, 3], "y": ["c", "d"]}))
+    df = sink.read().collect().sort("x").to_native()
+    assert df["y"].to_list() == ["a", "c", "d"]
+
+    # Unsupported format
+    sink = UnityCatalogDataSink(
+        table_name="sandbox.default.df_parquet",
+        format="PARQUET",
+        mode="OVERWRITE",
+        dataframe_backend="POLARS",
+    )
+    with pytest.raises(ValueError):
+        sink.write(df0)
+
+    # Test purge
+    sink = UnityCatalogDataSink(
+        table_name="sandbox.default.df", dataframe_backend="POLARS"
+    )
+    sink.purge()
+    assert not sink.exists()
+    assert not (tmp_path / "catalog/sandbox/default/df").exists()
+
+
 def test_full_name():
     sink = UnityCatalogDataSink(
         table_name="sandbox.default.df",
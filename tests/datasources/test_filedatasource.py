@@ -248,6 +248,51 @@ def test_reader_kwargs(backend, tmp_path):
     assert df.columns == ["_c0", "_c1", "_c2"]
 
 
+def test_read_polars_partitioned(tmp_path):
+    df0 = get_df0("POLARS").to_native()
+
+    # Hive-partitioned JSON files
+    for year in [2023, 2024]:
+        for region in ["eu", "us"]:
+            dirpath = tmp_path / f"year={year}" / f"region={region}"
+            dirpath.mkdir(parents=True)
+            df0.write_json(dirpath / "part-0.json")
+    (tmp_path / "_SUCCESS").touch()
+
+    source = FileDataSource(path=tmp_path, format="JSON", dataframe_backend="POLARS")
+    files = source._get_polars_filepaths([".json"])
+    assert len(files) == 4
+    assert files[0][1] == {"year": 2023, "region": "eu"}
+
+    df = source.read().collect().sort("year", "region", "_idx")
+    assert df.columns == ["_idx", "id", "x1", "year", "region"]
+    assert df.shape == (12, 5)
+
+    # Partitions pruning
+    source = FileDataSource(
+        path=tmp_path,
+        format="JSON",
+        dataframe_backend="POLARS",
+        filter="year = 2024 AND region = 'eu' AND x1 > 1",
+    )
+    files = source._prune_partitions(source._get_polars_filepaths([".json"]))
+    assert [f[1] for f in files] == [{"year": 2024, "region": "eu"}]
+
+    df = source.read().collect().sort("_idx")
+    assert df["_idx"].to_list() == [1, 2]
+    assert df["year"].unique().to_list() == [2024]
+
+    # Glob pattern
+    source = FileDataSource(
+        path=str(tmp_path / "year=2023" / "*" / "*.json"),
+        format="JSON",
+        dataframe_backend="POLARS",
+    )
+    df = source.read().collect()
+    assert df["region"].sort().to_list() == ["eu"] * 3 + ["us"] * 3
+    assert "year" not in df.columns
+
+
 def test_non_applicable_options():
     # has_header
     FileDataSource(path="tmp", format="CSV", has_header=True)
@@ -91,6 +91,43 @@ def test_dag(tmp_path):
     fig.write_html(tmp_path / "dag.html", auto_open=OPEN_FIGURES)
 
 
+def test_dag_cache(tmp_path):
+    pl = get_pl(tmp_path)
+
+    # Memoized structures
+    dag = pl.dag
+    assert pl.dag is dag
+    assert pl.nodes_dict is pl.nodes_dict
+    assert pl.sorted_node_names == list(nx.topological_sort(dag))
+
+    # Execution plan does not alter pipeline DAG
+    pl.get_execution_plan(selects=["slv"])
+    assert len(pl.dag.nodes) == 6
+
+    # Node removed
+    pl.nodes = [n for n in pl.nodes if n.name != "gld_ab"]
+    assert pl.dag is not dag
+    assert "gld_ab" not in pl.nodes_dict
+    assert len(pl.dag.nodes) == 5
+
+    # Node source re-assigned
+    dag = pl.dag
+    pl.nodes_dict["gld_a"].source = {"node_name": "brz"}
+    assert pl.dag is not dag
+    assert ("brz", "gld_a") in pl.dag.edges
+
+    # Node renamed
+    nodes_dict = pl.nodes_dict
+    pl.nodes_dict["gld_b"].name = "gld_c"
+    assert pl.nodes_dict is not nodes_dict
+    assert "gld_c" in pl.nodes_dict
+
+    # Explicit invalidation
+    dag = pl.dag
+    pl.invalidate_cache()
+    assert pl.dag is not dag
+
+
 def test_children(tmp_path):
     pl = get_pl(tmp_path)
 
@@ -374,6 +411,339 @@ def test_single_node(backend, tmp_path):
     assert_dfs_equal(df, df0)
 
 
+@pytest.mark.parametrize("backend", ["POLARS"])
+def test_execute_concurrent(backend, tmp_path):
+    # Build Pipeline
+    brz = get_brz(tmp_path, backend)
+    slv = get_slv(tmp_path, backend)
+    slv2 = get_slv(tmp_path, backend)
+    slv2.name = "slv2"
+    slv2.sinks[0].path = f"{tmp_path}/slv2_sink"
+    pl = models.Pipeline(name="pl", nodes=[slv, slv2, brz], dataframe_backend=backend)
+
+    # Write source data
+    ss = StreamingSource(backend)
+    df0 = ss.write_to_json(tmp_path / "brz_source")
+
+    # Execute
+    pl.execute(max_workers=4)
+
+    for node_name in ["slv", "slv2"]:
+        df = pl.nodes_dict[node_name].primary_sink.read()
+        assert_dfs_equal(df, df0)
+
+
+def test_execute_concurrent_sinkless_upstream(tmp_path, monkeypatch):
+    backend = "POLARS"
+
+    # Build Pipeline: slv (without sink) is read by 2 concurrent downstream nodes
+    brz = get_brz(tmp_path, backend)
+    slv = models.PipelineNode(name="slv", source={"node_name": "brz"})
+    glds = [
+        models.PipelineNode(
+            name=name,
+            source={"node_name": "slv"},
+            sinks=[{"format": "PARQUET", "path": f"{tmp_path}/{name}_sink"}],
+        )
+        for name in ["gld_a", "gld_b"]
+    ]
+    pl = models.Pipeline(name="pl", nodes=[brz, slv] + glds, dataframe_backend=backend)
+    pl.root_path_ = tmp_path
+
+    # Write source data
+    ss = StreamingSource(backend)
+    df0 = ss.write_to_json(tmp_path / "brz_source")
+
+    # Track executions
+    executed = []
+    execute = models.PipelineNode.execute
+
+    def _execute(node, *args, **kwargs):
+        executed.append(node.name)
+        return execute(node, *args, **kwargs)
+
+    monkeypatch.setattr(models.PipelineNode, "execute", _execute)
+
+    # Execute
+    pl.execute(max_workers=4)
+    assert sorted(executed) == ["brz", "gld_a", "gld_b", "slv"]
+    assert pl._plan._implicit_executed is None
+    for node_name in ["gld_a", "gld_b"]:
+        df = pl.nodes_dict[node_name].primary_sink.read()
+        assert_dfs_equal(df, df0)
+
+    # Nodes without sinks are executed again on the next pipeline execution
+    executed.clear()
+    pl.execute(max_workers=4)
+    assert sorted(executed) == ["brz", "gld_a", "gld_b", "slv"]
+
+
+@pytest.mark.parametrize("backend", ["POLARS"])
+def test_execute_concurrent_failure(backend, tmp_path):
+    # Build Pipeline
+    brz = get_brz(tmp_path, backend)
+    slv = get_slv(tmp_path, backend)
+    pl = models.Pipeline(name="pl", nodes=[brz, slv], dataframe_backend=backend)
+
+    # Source data is missing: brz fails and slv must never be executed
+    with pytest.raises(FileNotFoundError):
+        pl.execute(max_workers=2)
+
+    assert pl.nodes_dict["slv"].output_df is None
+    assert not Path(f"{tmp_path}/slv_sink").exists()
+
+
+@pytest.mark.parametrize("storage_level", ["MEMORY_AND_DISK", "DISK_ONLY"])
+def test_execute_cache(storage_level, tmp_path, monkeypatch):
+    backend = "POLARS"
+
+    # Build Pipeline: slv (without sink) is read by 2 downstream nodes
+    brz = get_brz(tmp_path, backend)
+    slv = models.PipelineNode(
+        name="slv",
+        source={"node_name": "brz"},
+        cache={"storage_level": storage_level},
+    )
+    glds = [
+        models.PipelineNode(
+            name=name,
+            source={"node_name": "slv"},
+            sinks=[{"format": "PARQUET", "path": f"{tmp_path}/{name}_sink"}],
+        )
+        for name in ["gld_a", "gld_b"]
+    ]
+    pl = models.Pipeline(name="pl", nodes=[brz, slv] + glds, dataframe_backend=backend)
+    pl.root_path_ = tmp_path
+    slv = pl.nodes_dict["slv"]
+
+    # Write source data
+    ss = StreamingSource(backend)
+    df0 = ss.write_to_json(tmp_path / "brz_source")
+
+    # Track cache
+    cached = []
+    release_cache = models.PipelineNode.release_cache
+
+    def _release_cache(node, *args, **kwargs):
+        cached.append((node.name, node.is_cached, node.cache_path.exists()))
+        release_cache(node, *args, **kwargs)
+
+    monkeypatch.setattr(models.PipelineNode, "release_cache", _release_cache)
+
+    # Execute
+    pl.execute()
+
+    # Cache is released once, after gld_b execution
+    assert cached[-1] == ("slv", True, storage_level == "DISK_ONLY")
+    assert [c for c in cached if c[1]] == [cached[-1]]
+    assert not slv.is_cached
+    assert not slv.cache_path.exists()
+    for node_name in ["gld_a", "gld_b"]:
+        df = pl.nodes_dict[node_name].primary_sink.read()
+        assert_dfs_equal(df, df0)
+
+
+@pytest.mark.parametrize("storage_level", ["MEMORY_AND_DISK", "DISK_ONLY"])
+def test_execute_cache_sinkless_consumer(storage_level, tmp_path, monkeypatch):
+    backend = "POLARS"
+
+    # Build Pipeline: slv (cached) is read by gld_a (without sink), itself read
+    # by gld_b (with sink)
+    brz = get_brz(tmp_path, backend)
+    slv = models.PipelineNode(
+        name="slv",
+        source={"node_name": "brz"},
+        cache={"storage_level": storage_level},
+    )
+    gld_a = models.PipelineNode(name="gld_a", source={"node_name": "slv"})
+    gld_b = models.PipelineNode(
+        name="gld_b",
+        source={"node_name": "gld_a"},
+        sinks=[{"format": "PARQUET", "path": f"{tmp_path}/gld_b_sink"}],
+    )
+    pl = models.Pipeline(
+        name="pl", nodes=[brz, slv, gld_a, gld_b], dataframe_backend=backend
+    )
+    pl.root_path_ = tmp_path
+    slv = pl.nodes_dict["slv"]
+
+    # Write source data
+    ss = StreamingSource(backend)
+    df0 = ss.write_to_json(tmp_path / "brz_source")
+
+    # Track cache
+    released = []
+    release_cache = models.PipelineNode.release_cache
+
+    def _release_cache(node, *args, **kwargs):
+        if node.is_cached:
+            released.append(pl.nodes_dict["gld_b"].primary_sink.exists())
+        release_cache(node, *args, **kwargs)
+
+    monkeypatch.setattr(models.PipelineNode, "release_cache", _release_cache)
+
+    # Execute
+    pl.execute()
+
+    # Cache is released once, after gld_b has been written
+    assert released == [True]
+    assert not slv.is_cached
+    assert not slv.cache_path.exists()
+    df = pl.nodes_dict["gld_b"].primary_sink.read()
+    assert_dfs_equal(df, df0)
+
+
+def test_execute_cache_chained(tmp_path):
+    backend = "POLARS"
+
+    # Build Pipeline: brz (spilled to disk) is read by slv, itself read by gld.
+    # gld reads the output of slv, which lazily scans brz spill file.
+    brz = get_brz(tmp_path, backend)
+    brz.cache = {"storage_level": "DISK_ONLY"}
+    slv = get_slv(tmp_path, backend)
+    gld = models.PipelineNode(
+        name="gld",
+        source={"node_name": "slv"},
+        sinks=[{"format": "PARQUET", "path": f"{tmp_path}/gld_sink"}],
+    )
+    pl = models.Pipeline(name="pl", nodes=[brz, slv, gld], dataframe_backend=backend)
+    pl.root_path_ = tmp_path
+    brz = pl.nodes_dict["brz"]
+
+    # Write source data
+    ss = StreamingSource(backend)
+    df0 = ss.write_to_json(tmp_path / "brz_source")
+
+    # Execute
+    pl.execute()
+
+    # Spill file is removed once the pipeline execution is completed
+    assert not brz.is_cached
+    assert not brz.cache_path.exists()
+    df = pl.nodes_dict["gld"].primary_sink.read()
+    assert_dfs_equal(df, df0)
+
+
+def test_execute_skip_unchanged(tmp_path, monkeypatch):
+    backend = "POLARS"
+
+    # Build Pipeline
+    brz = get_brz(tmp_path, backend)
+    slv = get_slv(tmp_path, backend)
+    pl = models.Pipeline(name="pl", nodes=[brz, slv], dataframe_backend=backend)
+    pl.root_path_ = tmp_path
+
+    # Write source data
+    ss = StreamingSource(backend)
+    ss.write_to_json(tmp_path / "brz_source")
+
+    # Track execution
+    executed = []
+    execute = models.PipelineNode.execute
+
+    def _execute(node, *args, **kwargs):
+        executed.append(node.name)
+        return execute(node, *args, **kwargs)
+
+    monkeypatch.setattr(models.PipelineNode, "execute", _execute)
+
+    # First run
+    pl.execute(skip_unchanged=True)
+    assert executed == ["brz", "slv"]
+    assert pl.run_state_path.exists()
+
+    # Unchanged
+    executed.clear()
+    pl.execute(skip_unchanged=True)
+    assert executed == []
+
+    # Not skipped without run state
+    pl.execute()
+    assert executed == ["brz", "slv"]
+
+    # Updated configuration
+    executed.clear()
+    pl.nodes_dict["slv"].comment = "silver"
+    pl.execute(skip_unchanged=True)
+    assert executed == ["slv"]
+
+    # Updated source (propagated downstream)
+    executed.clear()
+    (tmp_path / "brz_source" / "000.json").touch()
+    pl.execute(skip_unchanged=True)
+    assert executed == ["brz", "slv"]
+
+    # Deleted sink
+    executed.clear()
+    (tmp_path / "slv_sink").unlink()
+    pl.execute(skip_unchanged=True)
+    assert executed == ["slv"]
+
+    # Updated source with upstream node not selected: brz sink still holds
+    # the data of its last execution.
+    executed.clear()
+    (tmp_path / "brz_source" / "000.json").touch()
+    pl.execute(skip_unchanged=True, selects=["slv"])
+    assert executed == []
+
+    # Upstream node executed: downstream node is not skipped
+    pl.execute(skip_unchanged=True)
+    assert executed == ["brz", "slv"]
+
+
+def test_execute_pushdown(tmp_path):
+    backend = "POLARS"
+
+    # Build Pipeline
+    brz = models.PipelineNode(
+        name="brz",
+        source={"format": "JSON", "path": f"{tmp_path}/brz_source/000.json"},
+    )
+    slv = models.PipelineNode(
+        name="slv",
+        source={
+            "node_name": "brz",
+            "selects": {"x1": "x", "_idx": "_idx"},
+            "filter": "id != 'b'",
+        },
+        sinks=[{"format": "PARQUET", "path": f"{tmp_path}/slv_sink"}],
+    )
+    gld = models.PipelineNode(
+        name="gld",
+        source={"node_name": "brz", "filter": "x1 > 2"},
+        transformer={"nodes": [{"expr": "SELECT id FROM {df}"}]},
+    )
+    pl = models.Pipeline(name="pl", nodes=[brz, slv], dataframe_backend=backend)
+    pl.root_path_ = tmp_path
+
+    # Write source data
+    ss = StreamingSource(backend)
+    ss.write_to_json(tmp_path / "brz_source")
+
+    # Plan
+    plan = pl.get_execution_plan()
+    assert plan.pushdowns["brz"].columns == ["_idx", "id", "x1"]
+    assert plan.pushdowns["brz"].filter == "id != 'b'"
+    assert plan.pushdowns["slv"].columns is None
+
+    # Execute
+    pl.execute(pushdown=True)
+    df = polars.read_parquet(tmp_path / "slv_sink").sort("_idx")
+    assert df.columns == ["x", "_idx"]
+    assert df["x"].to_list() == [1, 3]
+    df = pl.nodes_dict["brz"].output_df.collect()
+    assert df.columns == ["_idx", "id", "x1"]  # _batch_id pruned
+    assert df["id"].to_list() == ["a", "c"]
+    assert pl.nodes_dict["brz"].source._pushed_filter is None
+
+    # Consumer with transformer requires all columns
+    pl = models.Pipeline(name="pl", nodes=[brz, slv, gld], dataframe_backend=backend)
+    plan = pl.get_execution_plan()
+    assert plan.pushdowns["brz"].columns is None
+    assert plan.pushdowns["brz"].filter == "(id != 'b') OR (x1 > 2)"
+    assert plan.pushdowns["brz"].source_columns is None
+
+
 @pytest.mark.parametrize("backend", ["PYSPARK"])
 def test_full(backend, tmp_path):
     pl = get_pl(tmp_path)
@@ -159,6 +159,41 @@ def test_selected_nodes(pl):
     ]
 
 
+def test_selection_index(pl):
+    index = pl.selection_index
+    assert pl.selection_index is index
+    assert index.ancestors("gld_b") == {"brz_b", "slv_b2", "slv_b1"}
+    assert index.descendants("a") == {"slv_a1", "slv_a2", "gld_a"}
+    assert index.resolve(["*slv_b", "brz_a*", "gld_b"]) == [
+        "brz_a",
+        "brz_b",
+        "slv_a1",
+        "slv_a2",
+        "slv_b2",
+        "gld_a",
+        "slv_b1",
+        "gld_b",
+    ]
+
+    with pytest.raises(ValueError):
+        index.resolve(["slv_c"])
+
+    # Plan is resolved once
+    plan = pl.get_execution_plan(selects=["slv_a1*"])
+    assert plan.nodes_dag is plan.nodes_dag
+    assert plan.dag is plan.dag
+    tasks = plan.tasks
+    assert plan.tasks[0] is tasks[0]
+
+    # Tasks upstreams are bound to their own plan
+    pl.get_execution_plan(selects=["gld_a"])
+    assert plan.tasks_dict["node-gld_a"].upstream_task_names == ["slv_a"]
+
+    # Re-resolved when selects change
+    plan.selects = ["gld_a"]
+    assert plan.node_names == ["gld_a"]
+
+
 def test_plan_dag(pl):
     plan = models.PipelineExecutionPlan(
         pipeline=pl,
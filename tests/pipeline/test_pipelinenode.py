@@ -135,6 +135,66 @@ def test_execute_stream(backend, tmp_path):
         assert not path.exists()
 
 
+@pytest.mark.parametrize("backend", ["POLARS", "PYSPARK"])
+def test_execute_stream_multisinks(backend, tmp_path):
+    if DataFrameBackends(backend) not in STREAMING_BACKENDS:
+        pytest.skip(f"Backend '{backend}' not implemented.")
+
+    ss = StreamingSource(backend)
+    source_path = str(tmp_path / "source")
+
+    node = models.PipelineNode(
+        name="node0",
+        source={"path": source_path, "format": "DELTA", "as_stream": "True"},
+        sinks=[
+            {"path": str(tmp_path / "sink1"), "format": "DELTA", "mode": "APPEND"},
+            {"path": str(tmp_path / "sink2"), "format": "PARQUET", "mode": "APPEND"},
+        ],
+        root_path=tmp_path / "node",
+    )
+
+    # Sinks keep their own checkpoint unless opted in
+    assert node.sinks_checkpoint_path is None
+    node.shared_sinks_checkpoint = True
+    checkpoint_path = node.sinks_checkpoint_path
+    assert checkpoint_path == tmp_path / "node" / "checkpoints" / "sinks"
+
+    ss.write_to_delta(source_path)
+    node.execute()
+    ss.write_to_delta(source_path)
+    node.execute()
+
+    # Single stream writing to all sinks
+    for s in node.sinks:
+        assert s.read().collect().shape[0] == 6
+        assert not s.checkpoint_path.exists()
+        marker = checkpoint_path / "sinks" / s._uuid
+        assert marker.read_text() == "1"
+
+    # Test purge
+    node.purge()
+    assert not checkpoint_path.exists()
+
+
+def test_batch_marker(tmp_path):
+    from laktory.models.pipeline._batchmarker import BatchMarker
+
+    marker = BatchMarker(tmp_path / "sinks" / "sink0")
+    assert marker.get() is None
+
+    marker.set(3)
+    assert BatchMarker(tmp_path / "sinks" / "sink0").get() == 3
+    assert BatchMarker("dbfs:/tmp/sink0").path == Path("/dbfs/tmp/sink0")
+
+    # Cloud storage: disabled instead of written relative to working directory
+    for path in ["abfss://c@a.dfs.core.windows.net/cp/sink0", "s3://bucket/sink0"]:
+        marker = BatchMarker(path)
+        marker.set(3)
+        assert marker.get() == 3
+        assert BatchMarker(path).get() is None
+        assert not Path(path.split(":")[0] + ":").exists()
+
+
 @pytest.mark.parametrize("backend", ["POLARS", "PYSPARK"])
 def test_execute_view(backend, tmp_path):
     if backend == "POLARS":
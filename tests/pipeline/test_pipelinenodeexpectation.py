@@ -236,6 +236,62 @@ def test_streaming_multi(backend, node, tmp_path):
     assert node.checks[2].fails_count == 3
 
 
+@pytest.mark.parametrize("backend", ["POLARS", "PYSPARK"])
+def test_streaming_sinks(backend, tmp_path):
+    if DataFrameBackends(backend) not in STREAMING_BACKENDS:
+        pytest.skip(f"Backend '{backend}' not implemented.")
+
+    from laktory import get_spark_session
+
+    spark = get_spark_session()
+    ss = StreamingSource(backend=backend)
+
+    source_path = str(tmp_path / "source")
+    output_path = str(tmp_path / "output")
+    quarantine_path = str(tmp_path / "quarantine")
+
+    node = models.PipelineNode(
+        name="node0",
+        source=models.FileDataSource(path=source_path, format="DELTA", as_stream=True),
+        expectations=[
+            models.DataQualityExpectation(name="id_b", expr="id != 'b'", action="WARN"),
+            models.DataQualityExpectation(
+                name="x1_3", expr="x1 != 3", action="QUARANTINE"
+            ),
+        ],
+        sinks=[
+            models.FileDataSink(path=output_path, format="DELTA", mode="APPEND"),
+            models.FileDataSink(
+                path=quarantine_path, format="DELTA", mode="APPEND", is_quarantine=True
+            ),
+        ],
+        root_path=tmp_path / "node",
+    )
+
+    # Push and execute
+    ss.write_to_delta(source_path, nbatch=2)
+    node.execute()
+
+    # Expectations checked within sinks micro-batches
+    assert not node.expectations_checkpoint_path.exists()
+    assert node.checks[0].status == "FAIL"
+    assert node.checks[0].rows_count == 6
+    assert node.checks[0].fails_count == 2
+    assert node.checks[1].status == "FAIL"
+    assert node.checks[1].fails_count == 2
+
+    # Output and quarantine
+    assert spark.read.format("DELTA").load(output_path).count() == 4
+    assert spark.read.format("DELTA").load(quarantine_path).count() == 2
+
+    # Only new rows are processed
+    ss.write_to_delta(source_path)
+    node.execute()
+    assert node.checks[0].rows_count == 3
+    assert spark.read.format("DELTA").load(output_path).count() == 6
+    assert spark.read.format("DELTA").load(quarantine_path).count() == 3
+
+
 def test_aggregate_on_stream():
     with pytest.raises(DataQualityExpectationsNotSupported):
         models.PipelineNode(
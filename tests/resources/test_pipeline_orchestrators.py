@@ -103,7 +103,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-brz.json",
                         "selects": "brz",
                     },
                     "package_name": "laktory",
@@ -121,7 +121,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld.json",
                         "selects": "gld",
                     },
                     "package_name": "laktory",
@@ -139,7 +139,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_a.json",
                         "selects": "gld_a",
                     },
                     "package_name": "laktory",
@@ -157,7 +157,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_ab.json",
                         "selects": "gld_ab",
                     },
                     "package_name": "laktory",
@@ -175,7 +175,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_b.json",
                         "selects": "gld_b",
                     },
                     "package_name": "laktory",
@@ -193,7 +193,7 @@ def test_databricks_job():
                 "python_wheel_task": {
                     "entry_point": "models.pipeline._execute",
                     "named_parameters": {
-                        "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                        "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-slv.json",
                         "selects": "slv",
                     },
                     "package_name": "laktory",
@@ -233,7 +233,7 @@ def test_databricks_job():
 
     # Test resources
     resources = job.core_resources
-    assert len(resources) == 3
+    assert len(resources) == 3 + 2 * 6  # config file and task config files
 
     data = job.config_file.content_dict
     checkpoint_path = data["nodes"][0]["sinks"][0]["checkpoint_path"]
@@ -481,7 +481,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-brz.json",
                             "selects": "brz",
                         },
                         "package_name": "laktory",
@@ -499,7 +499,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld.json",
                             "selects": "gld",
                         },
                         "package_name": "laktory",
@@ -517,7 +517,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_a.json",
                             "selects": "gld_a",
                         },
                         "package_name": "laktory",
@@ -538,7 +538,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_ab.json",
                             "selects": "gld_ab",
                         },
                         "package_name": "laktory",
@@ -556,7 +556,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-gld_b.json",
                             "selects": "gld_b",
                         },
                         "package_name": "laktory",
@@ -574,7 +574,7 @@ def test_databricks_job():
                     "python_wheel_task": {
                         "entry_point": "models.pipeline._execute",
                         "named_parameters": {
-                            "filepath": "/Workspace/.laktory/pipelines/pl-job.json",
+                            "filepath": "/Workspace/.laktory/pipelines/pl-job/tasks/node-slv.json",
                             "selects": "slv",
                         },
                         "package_name": "laktory",
@@ -614,6 +614,86 @@ def test_databricks_job():
     }
 
 
+def test_databricks_job_task_configs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "build_root", str(tmp_path))
+    pl = get_pl_job()
+    config_file = pl.orchestrator.config_file
+
+    # Slices
+    configs = config_file.get_task_content_dicts()
+    assert sorted(configs) == [
+        "node-brz",
+        "node-gld",
+        "node-gld_a",
+        "node-gld_ab",
+        "node-gld_b",
+        "node-slv",
+    ]
+    nodes = configs["node-gld"]["nodes"]
+    assert [n["name"] for n in nodes] == ["slv", "gld"]
+    assert "transformer" not in nodes[0]
+    assert "source" not in nodes[0]
+    assert nodes[0]["sinks"] == config_file.content_dict["nodes"][2]["sinks"]
+    assert "transformer" in nodes[1]
+    assert [n["name"] for n in configs["node-brz"]["nodes"]] == ["brz"]
+
+    # View sinks keep their definition and upstream references
+    nodes = configs["node-gld_ab"]["nodes"]
+    assert [n["name"] for n in nodes] == ["gld_ab", "gld", "gld_a", "gld_b"]
+    assert "transformer" in nodes[2]
+
+    # Slice is a valid pipeline
+    _pl = models.Pipeline.model_validate(configs["node-gld_ab"])
+    assert _pl.get_execution_plan(selects=["gld_ab"]).node_names == ["gld_ab"]
+
+    # Build
+    stale = tmp_path / "pipelines" / "pl-job" / "tasks" / "node-old.json"
+    stale.parent.mkdir(parents=True)
+    stale.touch()
+    config_file.build()
+    assert (tmp_path / "pipelines" / "pl-job.json").exists()
+    assert sorted(f.name for f in stale.parent.iterdir()) == [
+        f"{k}.json" for k in sorted(configs)
+    ]
+
+    # Workspace files
+    files = pl.orchestrator.task_config_files
+    assert files[0].source == str(stale.parent / "node-brz.json")
+    assert files[0].path == "/.laktory/pipelines/pl-job/tasks/node-brz.json"
+
+
+def test_task_config_view_upstreams():
+    from laktory.models.pipeline.orchestrators.pipelineconfigworkspacefile import (
+        get_task_config,
+    )
+
+    config = {
+        "name": "pl-views",
+        "nodes": [
+            {"name": "tmp", "source": {"format": "JSON", "path": "/tmp/src/"}},
+            {
+                "name": "v",
+                "sinks": [
+                    {"schema_name": "default", "table_name": "v", "table_type": "VIEW"}
+                ],
+                "transformer": {"nodes": [{"expr": "SELECT * from {nodes.tmp}"}]},
+            },
+            {
+                "name": "out",
+                "source": {"node_name": "v"},
+                "sinks": [{"format": "PARQUET", "mode": "APPEND", "path": "/tmp/out/"}],
+            },
+        ],
+    }
+    pl = models.Pipeline.model_validate(config)
+
+    # Upstream nodes of views are referenced, not executed
+    nodes = get_task_config(config, pl, ["out"])["nodes"]
+    assert [n["name"] for n in nodes] == ["tmp", "v", "out"]
+    assert "source" not in nodes[0]
+    assert "transformer" in nodes[1]
+
+
 def test_databricks_job_execute(mocker):
     pl = get_pl_job()
 
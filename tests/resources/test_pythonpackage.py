@@ -56,3 +56,17 @@ def test_python_package_path():
         path="/Workspace/lake_1.whl",
     )
     assert pp.path == "/Workspace/lake_1.whl"
+
+
+def test_python_package_build_unchanged(mocker):
+    from laktory.cli._common import Worker
+
+    pp = get_python_package()
+    pp.build()
+
+    # Sources unchanged: wheel is not rebuilt
+    run = mocker.spy(Worker, "run")
+    pp = get_python_package()
+    pp.build()
+    assert run.call_count == 0
+    assert Path(pp.source).exists()
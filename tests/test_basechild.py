@@ -77,3 +77,31 @@ def test_set_parent():
     m0 = M0(name="m0")
     m1 = M1(name="m1")
     m1.parent = m0
+
+
+def test_parent_cache():
+    node = models.PipelineNode(
+        name="slv",
+        source={"path": "/tmp/", "format": "PARQUET"},
+        transformer={"nodes": [{"func_name": "select", "func_args": ["x"]}]},
+    )
+    pl = models.Pipeline(name="pl", nodes=[node], dataframe_backend="POLARS")
+    node = pl.nodes[0]
+    arg = node.transformer.nodes[0].func_args[0]
+
+    assert arg.parent_pipeline is pl
+    assert arg.parent_pipeline_node is node
+    assert arg.dataframe_backend == "POLARS"
+    assert arg._parent_cache["parent_PipelineNode"] is node
+    assert arg._parent_cache["dataframe_backend_"] == "POLARS"
+
+    # Invalidated when an ancestor is updated
+    pl.dataframe_backend_ = "PYSPARK"
+    assert arg._parent_cache is None
+    assert arg.dataframe_backend == "PYSPARK"
+
+    # Invalidated when re-parented
+    pl2 = models.Pipeline(name="pl2", nodes=[], dataframe_backend="POLARS")
+    node.parent = pl2
+    assert arg.parent_pipeline is pl2
+    assert arg.dataframe_backend == "POLARS"
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -5,6 +6,7 @@ import pytest
 from laktory import models
 from laktory._version import VERSION
 from laktory.dispatcher import Dispatcher
+from laktory.dispatcher import databrickspipelinerunner
 
 root = Path(__file__).parent
 
@@ -61,3 +63,53 @@ def test_resources(stack):
 
     assert job.model_dump() == {"name": "job-stock-prices-ut-stack", "id": None}
     assert dlt.model_dump() == {"name": "${vars.workflow_name}", "id": None}
+
+
+def test_run(stack, monkeypatch):
+    from laktory._testing import LocalWorkspaceClient
+
+    job_name = "job-stock-prices-ut-stack"
+    dlt_name = "${vars.workflow_name}"
+
+    dispatcher = Dispatcher(stack)
+    wc = LocalWorkspaceClient(jobs=[job_name], pipelines=[dlt_name], steps=3)
+    dispatcher._wc = wc
+
+    statuses = []
+    results = dispatcher.run(
+        poll_interval=0.01,
+        max_poll_interval=0.02,
+        on_status=statuses.append,
+    )
+
+    assert results == {
+        dlt_name: "COMPLETED",
+        job_name: "TERMINATED:SUCCESS",
+    }
+    assert statuses[-1] == results
+    assert dispatcher.resources[job_name].id == 1
+    assert dispatcher.resources[dlt_name].id == "2"
+
+    # States are polled with batched list calls
+    assert wc.calls["jobs.get_run"] == 0
+    assert wc.calls["jobs.list_runs"] >= 3
+
+    # Few pipelines updates are fetched individually
+    assert wc.calls["pipelines.get_update"] > 0
+
+    # Pipelines states polled with batched list calls
+    monkeypatch.setattr(databrickspipelinerunner, "LIST_REFRESH_MIN_RUNNERS", 1)
+    wc.calls.clear()
+    dispatcher.run(names=[dlt_name], poll_interval=0.01, max_poll_interval=0.02)
+    assert wc.calls["pipelines.get_update"] == 0
+
+    # Running event loop
+    async def _run():
+        return dispatcher.run(names=[job_name], poll_interval=0.01)
+
+    assert asyncio.run(_run()) == {job_name: "TERMINATED:SUCCESS"}
+
+    # Failures
+    wc.failures = [job_name]
+    with pytest.raises(Exception, match=job_name):
+        dispatcher.run(names=[job_name], poll_interval=0.01, raise_exception=True)
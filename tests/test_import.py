@@ -0,0 +1,133 @@
+import importlib
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+def import_modules(module: str) -> tuple[float, set[str]]:
+    """Import `module` in a new interpreter and return duration and modules"""
+    code = f"""
+import json
+import sys
+import time
+t0 = time.perf_counter()
+import {module}
+dt = time.perf_counter() - t0
+print(json.dumps({{"duration": dt, "modules": list(sys.modules)}}))
+"""
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    data = json.loads(out.stdout.strip().splitlines()[-1])
+    return data["duration"], set(data["modules"])
+
+
+@pytest.mark.parametrize(
+    ["module", "excluded"],
+    [
+        (
+            "laktory",
+            [
+                "laktory.models.pipeline",
+                "laktory.models.resources.databricks.job",
+                "laktory.yaml",
+                "sqlglot",
+                "pyspark",
+            ],
+        ),
+        (
+            "laktory.cli",
+            [
+                "laktory.models.stacks",
+                "laktory.models.resources.databricks.job",
+                "laktory.dispatcher",
+            ],
+        ),
+        (
+            "laktory.models.pipeline._execute",
+            [
+                "laktory.models.stacks",
+                "laktory.models.resources.databricks.cluster",
+                "laktory.models.resources.databricks.table",
+                "laktory.models.grants",
+            ],
+        ),
+    ],
+)
+def test_import_lazy(module, excluded):
+    duration, modules = import_modules(module)
+    print(f"import {module}: {duration:.3f} s / {len(modules)} modules")
+    for name in excluded:
+        assert name not in modules
+
+
+def test_import_attributes():
+    import laktory as lk
+
+    t0 = time.perf_counter()
+    assert lk.models.Pipeline.__name__ == "Pipeline"
+    assert lk.models.DataFrameColumnExpr.__name__ == "DataFrameColumnExpr"
+    assert lk.models.String.__name__ == "String"
+    assert lk.models.resources.databricks.Job.__name__ == "Job"
+    assert lk.SQLParser.__name__ == "SQLParser"
+    assert callable(lk.models.pipeline._execute)
+    assert "Pipeline" in dir(lk.models)
+    print(f"attributes access: {time.perf_counter() - t0:.3f} s")
+
+    for module, name in [(lk.models, "NotAModel"), (lk, "not_a_module")]:
+        with pytest.raises(AttributeError):
+            getattr(module, name)
+
+
+def star_import(module: str) -> set[str]:
+    """Names imported by `from {module} import *` in a new interpreter"""
+    code = f"""
+import json
+from {module} import *
+print(json.dumps([k for k in list(globals()) if not k.startswith("_")]))
+"""
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(out.stdout.strip().splitlines()[-1])) - {"json"}
+
+
+def test_import_star():
+    import laktory.models
+    import laktory.models.resources.databricks as dbks
+
+    # Public names of star-imported sub-modules
+    names = star_import("laktory.models")
+    expected = {"BaseChild", "BaseModel", "LaktoryContext", "ReaderWriterMethod"}
+    for name in [
+        "dataframe",
+        "dataquality",
+        "datasinks",
+        "datasources",
+        "dtypes",
+        "grants",
+        "pipeline",
+        "resources",
+        "stacks",
+    ]:
+        module = importlib.import_module(f"laktory.models.{name}")
+        public_names = getattr(module, "__all__", None) or vars(module)
+        expected |= {n for n in public_names if not n.startswith("_")}
+        expected.add(name)
+    assert expected <= names
+    assert names <= set(dir(laktory.models))
+    assert set(laktory.models.__all__) == names
+
+    # Resources and their sub-modules
+    names = star_import("laktory.models.resources.databricks")
+    expected = set(dbks._RESOURCES.keys()) | set(dbks._RESOURCES.values())
+    assert expected | {"job_base", "pipeline_base"} <= names
+    assert names <= set(dir(dbks))
+    assert set(dbks.__all__) == names
+
+    # Top-level package
+    names = star_import("laktory")
+    assert {"models", "api", "constants", "exceptions", "VERSION"} <= names
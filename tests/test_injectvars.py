@@ -178,6 +178,31 @@ def test_objects():
     assert _resolve_expression("a+owner.id", {}, {"a": 2, "owner": owner}) == 11
 
 
+def test_resolver(monkeypatch):
+    from laktory._parsers import VariableResolver
+
+    monkeypatch.setenv("region", "east")
+
+    resolver = VariableResolver(
+        vars={"env": "prd", "catalog": "lake_${vars.env}", "none": None},
+        objs={"a": 2},
+    )
+    assert resolver.resolve_value("${vars.catalog}") == "lake_prd"
+    assert resolver.resolve_value("${vars.REGION}") == "east"
+    assert resolver.resolve_value("${vars.none}") == "${vars.none}"
+    assert resolver.resolve_value("${{ a + 1 }}") == 3
+
+    # Memoized results
+    assert resolver._memo == {
+        "${vars.catalog}": "lake_prd",
+        "lake_${vars.env}": "lake_prd",
+        "${vars.REGION}": "east",
+        "${vars.none}": "${vars.none}",
+    }
+    resolver._memo["${vars.catalog}"] = "cached"
+    assert resolver.resolve_values({"c": ["${vars.catalog}"]}) == {"c": ["cached"]}
+
+
 def test_self_referencing():
     with pytest.raises(ValueError):
         Cluster(
@@ -0,0 +1,64 @@
+import sqlite3
+
+import polars as pl
+import pytest
+
+from laktory.localcatalog import LocalCatalog
+
+
+def test_local_catalog(tmp_path):
+    catalog = LocalCatalog(root=tmp_path / "catalog")
+
+    # Path resolution does not register table
+    path = catalog.get_table_path("dev.finance.prices")
+    assert path == (tmp_path / "catalog/dev/finance/prices").as_posix()
+    assert catalog.get_table("dev.finance.prices") is None
+
+    # Managed table
+    table = catalog.create_table("dev.finance.prices")
+    assert table["full_name"] == "dev.finance.prices"
+    assert table["path"] == (tmp_path / "catalog/dev/finance/prices").as_posix()
+    assert table["managed"]
+    assert not catalog.table_exists("dev.finance.prices")
+
+    pl.DataFrame({"x": [1, 2, 3]}).write_delta(table["path"])
+    assert catalog.table_exists("dev.finance.prices")
+    assert catalog.table_exists("DEV.finance.`prices`")
+
+    # Registration is idempotent
+    assert catalog.create_table("dev.finance.prices", path=tmp_path / "other") == table
+
+    assert catalog.get_table_path("dev.finance.prices", path=tmp_path / "other") == path
+
+    # External table
+    external = catalog.create_table("dev.finance.meta", path=tmp_path / "meta")
+    assert not external["managed"]
+    pl.DataFrame({"x": [1]}).write_delta(external["path"])
+
+    # Registry is shared between instances
+    catalog2 = LocalCatalog(root=tmp_path / "catalog")
+    assert catalog2.list_tables() == ["dev.finance.meta", "dev.finance.prices"]
+    assert catalog2.list_tables(prefix="dev.other") == []
+
+    # Drop
+    catalog.drop_table("dev.finance.prices")
+    catalog.drop_table("dev.finance.meta")
+    assert catalog.list_tables() == []
+    assert not (tmp_path / "catalog/dev/finance/prices").exists()
+    assert (tmp_path / "meta").exists()
+
+    # Invalid
+    with pytest.raises(ValueError):
+        catalog.create_table("dev.finance.prices", format="ICEBERG")
+    with pytest.raises(ValueError):
+        catalog.get_table("a.b.c.d")
+
+
+def test_local_catalog_connection(tmp_path):
+    catalog = LocalCatalog(root=tmp_path / "catalog")
+
+    # Connections are closed on exit
+    with catalog._connect() as conn:
+        conn.execute("SELECT * FROM tables").fetchall()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT * FROM tables")
@@ -1,5 +1,6 @@
 from laktory._testing import Paths
 from laktory.yaml import RecursiveLoader
+from laktory.yaml.parsecache import parse_cache
 
 paths = Paths(__file__)
 
@@ -103,3 +104,51 @@ def test_read_with_variables():
             {"name": "source_b", "url": "url_b"},
         ],
     }
+
+
+def test_parse_cache(tmp_path):
+    parse_cache.clear()
+
+    # Repeated includes
+    filepath = paths.data / "yaml_loader" / "stocks.yaml"
+    with open(filepath, "r") as fp:
+        data0 = RecursiveLoader.load(fp)
+    hits = parse_cache.hits
+    assert hits > 0  # common.yaml included twice
+    with open(filepath, "r") as fp:
+        data1 = RecursiveLoader.load(fp)
+    assert data1 == data0
+    assert parse_cache.misses == len(parse_cache._nodes)
+
+    # Modified file
+    filepath = tmp_path / "data.yaml"
+    filepath.write_text("a: 1\n")
+    with open(filepath, "r") as fp:
+        assert RecursiveLoader.load(fp) == {"a": 1}
+    filepath.write_text("a: 22\n")
+    with open(filepath, "r") as fp:
+        assert RecursiveLoader.load(fp) == {"a": 22}
+
+
+def test_parse_cache_disk(tmp_path, monkeypatch):
+    from laktory._settings import settings
+
+    monkeypatch.setattr(settings, "yaml_cache_disk", True)
+    monkeypatch.setattr(parse_cache, "dirpath", tmp_path / "cache")
+    parse_cache.clear()
+
+    filepath = tmp_path / "data.yaml"
+    filepath.write_text("a: [1, 2]\n")
+    with open(filepath, "r") as fp:
+        RecursiveLoader.load(fp)
+    assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+
+    # New process
+    parse_cache.clear()
+    with open(filepath, "r") as fp:
+        assert RecursiveLoader.load(fp) == {"a": [1, 2]}
+    assert parse_cache.hits == 1
+    assert parse_cache.misses == 0
+
+    parse_cache.clear(disk=True)
+    assert len(list((tmp_path / "cache").glob("*.pickle"))) == 0
@@ -3,6 +3,7 @@ import math
 import narwhals as nw
 import numpy as np
 import polars as pl
+import pytest
 
 from laktory.sqlparser import SQLParser
 
@@ -151,6 +152,38 @@ def test_math_functions():
         assert _df["r0"].fill_null(-1).to_list() == _df["r1"].fill_null(-1).to_list()
 
 
+def test_expr_cache():
+    from sqlglot.errors import ParseError
+
+    from laktory.sqlparser import ExprCache
+    from laktory.sqlparser import expr_cache
+
+    expr_cache.clear()
+    parser = SQLParser()
+
+    df = nw.from_native(pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]}))
+
+    expr0 = parser.parse("x + y")
+    expr1 = SQLParser().parse("x + y")
+    assert expr1 is expr0
+    assert expr_cache.misses == 1
+    assert expr_cache.hits == 1
+    assert df.select(expr1)["x"].to_list() == [5, 7, 9]
+
+    # Invalid expressions are not cached
+    with pytest.raises(ParseError):
+        parser.parse("x ~ y")
+    assert len(expr_cache) == 1
+
+    # Eviction
+    cache = ExprCache(maxsize=2)
+    for sql in ["a", "b", "a", "c"]:
+        cache.get(sql, lambda sql=sql: sql.upper())
+    assert list(cache._exprs) == ["a", "c"]
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
 # def test_string_functions():
 #     parser = SQLParser()
 #
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -462,6 +463,98 @@ def test_terraform_stack(monkeypatch, stack):
     }
 
 
+def test_terraform_write(monkeypatch, tmp_path):
+    from laktory.models.stacks.terraformstack import fragments_cache
+
+    monkeypatch.chdir(tmp_path)
+
+    stack = models.Stack(
+        name="stack",
+        organization="o",
+        resources={
+            "providers": {
+                "databricks": {"host": "https://host"},
+                "databricks.dev": {"host": "https://host-dev", "alias": "dev"},
+            },
+            "databricks_notebooks": {
+                "nb-a": {
+                    "source": "./nb.py",
+                    "path": "/a/nb.py",
+                    "resource_options": {
+                        "moved_from": "nb-old",
+                        "provider": "${resources.databricks.dev}",
+                    },
+                },
+                "nb-b": {
+                    "source": "./nb2.py",
+                    "path": "/a/nb2.py",
+                    "resource_options": {"import_": "/a/nb2.py"},
+                },
+                "nb-ext": {"lookup_existing": {"path": "/ext/nb"}},
+            },
+            "databricks_jobs": {
+                "job-1": {
+                    "name": "job-1",
+                    "tasks": [
+                        {
+                            "task_key": "a",
+                            "notebook_task": {
+                                "notebook_path": "${resources.nb-a.path}"
+                            },
+                        },
+                        {
+                            "task_key": "ext",
+                            "notebook_task": {
+                                "notebook_path": "${resources.nb-ext.path}/${resources.unknown.x}"
+                            },
+                        },
+                    ],
+                },
+            },
+        },
+    )
+
+    fragments_cache.clear()
+    tstack = stack.to_terraform()
+    data = tstack.model_dump()
+    assert fragments_cache.misses == len(tstack.resources)
+
+    # References
+    nb = data["resource"]["databricks_notebook"]["nb-a"]
+    assert nb["provider"] == "databricks.dev"
+    tasks = data["resource"]["databricks_job"]["job-1"]["task"]
+    assert (
+        tasks[0]["notebook_task"]["notebook_path"] == "${databricks_notebook.nb-a.path}"
+    )
+    assert (
+        tasks[1]["notebook_task"]["notebook_path"]
+        == "${data.databricks_notebook.nb-ext.path}/${resources.unknown.x}"
+    )
+    assert data["data"] == {
+        "databricks_notebook": {"nb-ext": {"path": "/ext/nb", "format": "SOURCE"}}
+    }
+
+    # Cached fragments
+    filepath = tstack.write()
+    assert fragments_cache.hits == len(tstack.resources)
+
+    # Repeated keys are kept as lists of pairs
+    def _pairs(pairs):
+        keys = [k for k, _ in pairs]
+        return dict(pairs) if len(set(keys)) == len(keys) else pairs
+
+    with open(filepath) as fp:
+        written = json.loads(fp.read(), object_pairs_hook=_pairs)
+    assert [k for k, _ in written["provider"]] == ["databricks", "databricks"]
+
+    expected = {
+        k: v for k, v in data.items() if k not in ["moved_00000", "import_00000"]
+    }
+    expected |= {"moved": data["moved_00000"], "import": data["import_00000"]}
+    expected["provider"] = [("databricks", v) for v in data["provider"].values()]
+    assert written == expected
+
+
 def test_terraform_plan(monkeypatch, stack):
     c0 = settings.cli_raise_external_exceptions
     settings.cli_raise_external_exceptions = True